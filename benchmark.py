@@ -0,0 +1,298 @@
+# Benchmark della dashboard: tempi di costruzione delle pagine, tempi di ogni callback
+# registrata (con tutte le opzioni di bande, continenti e tipi di mappa), tempi delle
+# figure servite dalla route /figures e dimensione dei dcc.Store, sui CSV inclusi e
+# su dataset sintetici 10x e 100x.
+# I risultati vengono scritti in JSON per confrontare esecuzioni diverse:
+#
+#   python benchmark.py --output bench.json --scales 1,10,100 --repeat 5
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import dash
+import plotly
+from plotly.io.json import to_json_plotly
+from dash.development.base_component import Component
+
+import dashboard
+
+
+# Funzione che crea un CSV sintetico replicando scale volte il CSV originale:
+# le copie hanno nominativi distinti e punteggi perturbati in modo riproducibile
+def create_synthetic_csv(source_path, scale, output_path):
+    source_df = pd.read_csv(source_path, sep = ";")
+    copies = [source_df]
+    for copy_number in range(1, scale):
+        rng = np.random.default_rng(copy_number)
+        copy_df = source_df.copy()
+        copy_df['Call'] = copy_df['Call'] + f"/{copy_number}"
+        copy_df['Score'] = (copy_df['Score'] * rng.uniform(0.9, 1.1, len(copy_df))).astype('int64')
+        copies.append(copy_df)
+    pd.concat(copies, ignore_index=True).to_csv(output_path, sep = ";", index=False)
+
+# Funzione che registra i dataset da misurare come versioni correnti. Un dataset
+# gia' caricato con la stessa chiave viene scartato, per misurarne il caricamento
+def use_datasets(cw_path, ssb_path):
+    dataset_keys = {}
+    for name, csv_path in [('cw', cw_path), ('ssb', ssb_path)]:
+        dashboard.retire_dataset(dashboard.register_dataset_loader(name, csv_path))
+        dataset_keys[name] = dashboard.register_dataset_loader(name, csv_path)
+    dataset_keys['ssb_cw'] = dashboard.register_dataset_view('ssb_cw', [dataset_keys['cw'], dataset_keys['ssb']])
+    dashboard.current_dataset_keys = dataset_keys
+    return dataset_keys
+
+# Funzione che misura una funzione: tempo della prima chiamata e mediana delle
+# ripetizioni successive (ms)
+def time_call(function, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat + 1):
+        start = time.perf_counter()
+        result = function()
+        timings.append((time.perf_counter() - start) * 1000)
+    median = statistics.median(timings[1:]) if repeat else timings[0]
+    return result, {'first_ms': round(timings[0], 3), 'median_ms': round(median, 3)}
+
+# Funzione che raccoglie le props di tutti i componenti con id di un layout
+def collect_props(layout, props=None):
+    props = {} if props is None else props
+    if isinstance(layout, Component):
+        component_props = layout.to_plotly_json()['props']
+        if getattr(layout, 'id', None) is not None:
+            props[layout.id] = dict(component_props, _type=layout._type)
+        collect_props(getattr(layout, 'children', None), props)
+    elif isinstance(layout, (list, tuple)):
+        for child in layout:
+            collect_props(child, props)
+    return props
+
+# Funzione che restituisce la dimensione (byte) del JSON dei dcc.Store di una pagina
+def store_payloads(props):
+    return {
+        component_id: len(to_json_plotly(component_props.get('data')))
+        for component_id, component_props in props.items()
+        if component_props['_type'] == 'Store'
+    }
+
+# Funzione che restituisce le coppie (componente, proprieta') di un id di output
+def split_output(output_key):
+    return [part.rsplit('.', 1) for part in output_key.strip('.').split('...')]
+
+# Funzione che chiama una callback tramite l'endpoint di Dash, come farebbe il browser
+def post_callback(client, output_key, spec, props, overrides):
+    def dependency_value(dependency):
+        dependency_id = (dependency['id'], dependency['property'])
+        if dependency_id in overrides:
+            return overrides[dependency_id]
+        return props.get(dependency['id'], {}).get(dependency['property'])
+
+    inputs = [dict(id=i['id'], property=i['property'], value=dependency_value(i)) for i in spec['inputs']]
+    state = [dict(id=s['id'], property=s['property'], value=dependency_value(s)) for s in spec['state']]
+    outputs = [dict(id=component_id, property=prop.split('@')[0]) for component_id, prop in split_output(output_key)]
+    body = {
+        'output': output_key,
+        'outputs': outputs if output_key.startswith('..') else outputs[0],
+        'inputs': inputs,
+        'state': state,
+        'changedPropIds': [f"{inputs[0]['id']}.{inputs[0]['property']}"] if inputs else []
+    }
+    # Le props raccolte dal layout possono contenere valori numpy
+    return client.post('/_dash-update-component', data=to_json_plotly(body), content_type='application/json')
+
+# Funzione che restituisce i valori rappresentativi di un input: tutte le opzioni
+# di RadioItems e Dropdown (bande, continenti, metriche), ogni opzione da sola per i
+# Dropdown a selezione multipla (categorie dell'esploratore) ed entrambi i valori degli switch
+def input_variants(component_props):
+    if component_props.get('options'):
+        values = [option['value'] if isinstance(option, dict) else option for option in component_props['options']]
+        if isinstance(component_props.get('value'), list):
+            return [[value] for value in values]
+        return values
+    if isinstance(component_props.get('value'), bool):
+        return [True, False]
+    return []
+
+# Funzione che misura le callback lato server raggiungibili da una pagina
+def benchmark_callbacks(client, props, repeat, overrides=None):
+    overrides = overrides or {}
+    results = {}
+    for output_key, spec in dashboard.app.callback_map.items():
+        output_ids = [component_id for component_id, _ in split_output(output_key)]
+        # Le callback lato client e quelle di navigazione non vengono misurate
+        if 'callback' not in spec or 'page-content' in output_ids:
+            continue
+        component_ids = [d['id'] for d in spec['inputs'] + spec['state']] + output_ids
+        if any(component_id not in props for component_id in component_ids):
+            continue
+
+        # Prima l'esecuzione con i valori iniziali, poi una per ogni valore di ogni input
+        variants = [('initial', {})]
+        for dependency in spec['inputs']:
+            if dependency['property'] == 'value':
+                for value in input_variants(props[dependency['id']]):
+                    variants.append((f"{dependency['id']}={value}", {(dependency['id'], 'value'): value}))
+
+        for variant_name, variant_overrides in variants:
+            # La prima chiamata viene misurata senza figure in cache, le successive con la cache
+            dashboard.figure_cache.clear()
+            response, timing = time_call(
+                lambda: post_callback(client, output_key, spec, props, {**overrides, **variant_overrides}),
+                repeat
+            )
+            results[f"{output_key} [{variant_name}]"] = {
+                'status': response.status_code,
+                'response_bytes': len(response.data),
+                'cold_ms': timing['first_ms'],
+                'warm_ms': timing['median_ms']
+            }
+            # Le risposte aggiornano i Store, come nel browser
+            if variant_name == 'initial' and response.status_code == 200:
+                for component_id, new_props in json.loads(response.data)['response'].items():
+                    props.setdefault(component_id, {'_type': None}).update(new_props)
+    return results
+
+# Funzione che restituisce le varianti dei parametri di una figura della route: prima
+# i valori predefiniti, poi ogni valore ammesso di ogni parametro (bande, continenti,
+# tipo di mappa) e, per gli anni, tutto il dataset, un intervallo interno e l'ultimo anno
+def figure_param_variants(figure_name, dataset_key):
+    _, allowed_params, _ = dashboard.figure_routes[figure_name]
+    variants = [('default', {})]
+    for name, values in allowed_params.items():
+        if values is dashboard.parse_year_range:
+            first_year, last_year = dashboard.get_dataset_years(dataset_key)
+            middle_year = (first_year + last_year) // 2
+            values = [f"{first_year},{last_year}", f"{middle_year},{last_year}", f"{last_year},{last_year}"]
+        elif callable(values):
+            continue
+        for value in values:
+            variants.append((f"{name}={value}", {name: value}))
+    return variants
+
+# Funzione che misura le figure servite dalla route /figures per un dataset, con ogni
+# variante dei parametri: prima richiesta, richieste successive (dalla cache del JSON
+# compresso) e revalidazione con ETag
+def benchmark_figure_routes(client, dataset_key, figure_names, repeat):
+    results = {}
+    for figure_name in figure_names:
+        for variant_name, params in figure_param_variants(figure_name, dataset_key):
+            query = dict(params, dataset=dataset_key)
+            results[f"{figure_name} [{variant_name}]"] = benchmark_figure_route(client, figure_name, query, repeat)
+    return results
+
+# Funzione che misura una figura della route con i parametri dati
+def benchmark_figure_route(client, figure_name, query, repeat):
+    url = f"/figures/{figure_name}"
+    dashboard.figure_cache.clear()
+    dashboard.figure_json_cache.clear()
+    response, timing = time_call(lambda: client.get(url, query_string=query, headers={'Accept-Encoding': 'gzip'}), repeat)
+    revalidation, revalidation_timing = time_call(
+        lambda: client.get(url, query_string=query, headers={'If-None-Match': response.headers.get('ETag', '')}),
+        repeat
+    )
+    return {
+        'status': response.status_code,
+        'gzip_bytes': len(response.data),
+        'cold_ms': timing['first_ms'],
+        'warm_ms': timing['median_ms'],
+        'revalidation_status': revalidation.status_code,
+        'revalidation_ms': revalidation_timing['median_ms']
+    }
+
+# Funzione che esegue il benchmark completo sui dataset correnti
+def benchmark_scale(repeat):
+    dataset_keys = dashboard.current_dataset_keys
+    client = dashboard.app.server.test_client()
+    result = {'load_ms': {}, 'rows': {}, 'pages': {}}
+
+    for name in ['cw', 'ssb']:
+        dataset, timing = time_call(lambda: dashboard.get_dataset(dataset_keys[name]), 0)
+        result['load_ms'][name] = timing['first_ms']
+        result['rows'][name] = len(dataset)
+
+    root_props = collect_props(dashboard.serve_layout())
+    winner = dashboard.calculate_top_entries(dataset_keys['ssb_cw'], 'Score', ['Contest', 'Year']).iloc[-1]
+    pages = {
+        'welcome': (lambda: dashboard.welcome_page(dataset_keys['ssb_cw']), {('callsign-search', 'value'): winner['Call'][:2]}),
+        'cw': (lambda: dashboard.single_data_dashboard_page(dataset_keys['cw'], 'CW'), {}),
+        'ssb': (lambda: dashboard.single_data_dashboard_page(dataset_keys['ssb'], 'SSB'), {}),
+        'ssb_cw': (lambda: dashboard.ssb_cw_dashboard_page(dataset_keys['ssb_cw']), {}),
+        'callsign': (lambda: dashboard.callsign_page(dataset_keys['ssb_cw'], winner['Call']), {}),
+        'explorer': (lambda: dashboard.category_explorer_page({'CW': dataset_keys['cw'], 'SSB': dataset_keys['ssb']}), {}),
+    }
+    # Figure scaricate dalla route /figures per ogni pagina
+    page_figures = {
+        'cw': (dataset_keys['cw'], ['map', 'band-line-chart']),
+        'ssb': (dataset_keys['ssb'], ['map', 'band-line-chart']),
+        'ssb_cw': (dataset_keys['ssb_cw'], ['participants-map', 'winners-map', 'band-comparsion']),
+    }
+    for page_name, (build_page, overrides) in pages.items():
+        page, timing = time_call(build_page, repeat)
+        props = dict(root_props, **collect_props(page))
+        result['pages'][page_name] = dict(
+            timing,
+            layout_bytes=len(to_json_plotly(page)),
+            stores=store_payloads(collect_props(page)),
+            callbacks=benchmark_callbacks(client, props, repeat, overrides)
+        )
+        if page_name in page_figures:
+            dataset_key, figure_names = page_figures[page_name]
+            result['pages'][page_name]['figures'] = benchmark_figure_routes(client, dataset_key, figure_names, repeat)
+    return result
+
+# Funzione che elimina i dataset misurati e tutti i loro dati derivati
+def release_datasets(dataset_keys):
+    for dataset_key in dataset_keys.values():
+        dashboard.retire_dataset(dataset_key)
+    dashboard.figure_cache.clear()
+    dashboard.figure_json_cache.clear()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark of dashboard pages, callbacks and stores")
+    parser.add_argument('--output', help="JSON file for the results (default: stdout)")
+    parser.add_argument('--scales', default='1,10,100', help="dataset sizes as multiples of the bundled CSVs")
+    parser.add_argument('--repeat', type=int, default=5, help="timed repetitions after the first call")
+    args = parser.parse_args()
+
+    results = {
+        'environment': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'dash': dash.__version__,
+            'plotly': plotly.__version__,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'scales': {}
+    }
+    original_keys = dashboard.current_dataset_keys
+    with tempfile.TemporaryDirectory() as work_dir:
+        # I dataset sintetici usano una cache separata da quella dei CSV inclusi
+        dashboard.dataset_cache_dir = os.path.join(work_dir, 'cache')
+        for scale in [int(value) for value in args.scales.split(',')]:
+            print(f"Benchmark x{scale}", file=sys.stderr)
+            if scale == 1:
+                dataset_keys = use_datasets(dashboard.cw_data_path, dashboard.ssb_data_path)
+            else:
+                cw_path = os.path.join(work_dir, f"cw_x{scale}.csv")
+                ssb_path = os.path.join(work_dir, f"ssb_x{scale}.csv")
+                create_synthetic_csv(dashboard.cw_data_path, scale, cw_path)
+                create_synthetic_csv(dashboard.ssb_data_path, scale, ssb_path)
+                dataset_keys = use_datasets(cw_path, ssb_path)
+            results['scales'][f"x{scale}"] = benchmark_scale(args.repeat)
+            release_datasets(dataset_keys)
+    dashboard.current_dataset_keys = original_keys
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(output)
+    else:
+        print(output)
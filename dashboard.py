@@ -1,1703 +1,4073 @@
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import plotly.io as pio
-import os
-import dash_bootstrap_components as dbc
-from dash import dash, html, dcc, State, Input, Output, callback_context
-from dash.exceptions import PreventUpdate
-
-
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-
-cw_data_path = os.path.join(BASE_DIR, "cw_data.csv")
-ssb_data_path = os.path.join(BASE_DIR, "ssb_data.csv")
-prefix_data_path = os.path.join(BASE_DIR, "correct_countries_prefixes.csv")
-country_codes_data_path = os.path.join(BASE_DIR, "country_codes.CSV")
-
-# Vengono caricati i dataframe
-cw_score_df = pd.read_csv(cw_data_path, sep = ";")
-ssb_score_df = pd.read_csv(ssb_data_path, sep = ";")
-prefix_df = pd.read_csv(prefix_data_path, sep = ";")
-country_codes_df = pd.read_csv(country_codes_data_path, sep = ";")
-
-
-# Vengono rinominate le colonne del dataframe dei prefissi per adattarle al merge
-prefix_df.rename(columns={'PREFIX': 'QTH', 'COUNTRY': 'Country'}, inplace=True)
-country_codes_df.rename(columns={'COUNTRY': 'Country', 'CODE': 'country_code'}, inplace=True)
-
-# Vengono rimossi i duplicati nel dataframe dei prefissi
-prefix_df = prefix_df.drop_duplicates(subset='QTH')
-
-def create_dataset_to_work(score_df):
-    # Vengono uniti i due dataset in base al QTH (prefisso)
-    first_merged_df = pd.merge(score_df, prefix_df, on='QTH', how='left')
-    second_merged_df = pd.merge(first_merged_df, country_codes_df, on = 'Country', how='left')
-    # Selezione dell'ordine delle colonne
-    column_order = ['Call', 'QTH', 'Country', 'country_code'] + [col for col in score_df if col not in ['Call', 'QTH', 'Country']]
-    # Vengono riordinate le colonne nel dataframe risultante
-    merged_df = second_merged_df[column_order]
-    return(merged_df)
-
-def create_merged_dataset_to_work(cw_dataset, ssb_dataset):
-    # Viene aggiunta una colonna con l'indicazione della tipologia di contest
-    cw_dataset['Contest'] = 'CW'
-    ssb_dataset['Contest'] = 'SSB'
-
-    ssb_and_cw_score_df = pd.concat([cw_dataset, ssb_dataset], ignore_index=True)
-    return(ssb_and_cw_score_df)
-
-
-cw_dataset = create_dataset_to_work(cw_score_df)
-ssb_dataset = create_dataset_to_work(ssb_score_df)
-
-ssb_cw_dataset = create_merged_dataset_to_work(cw_dataset, ssb_dataset)
-
-
-# Funzione che calcola la media eliminando i valori nulli
-def calculate_mean(df, band):
-    df_notnull = df[df[band].notnull()]
-
-    mean_by_year = df_notnull.groupby('Year')[band].mean().reset_index()
-    mean_by_year[band] = mean_by_year[band].round(1)
-
-    return mean_by_year
-
-# Funzione che calcola il punteggio medio di ogni Country
-def calculate_mean_data_for_country(df, country, y_data):
-    data_to_plot = y_data
-    df_country = df[df['Country'] == country]
-    mean_data_by_year = df_country.groupby('Year')[data_to_plot].mean().reset_index()
-    mean_data_by_year[data_to_plot] = mean_data_by_year[data_to_plot].round(1)
-    return mean_data_by_year
-
-
-# Scala di colori personalizzata per la mappa
-custom_colorscale = [
-    [0.0, '#7d28c3'],  # Viola intenso
-    [0.1, '#5030c3'],  # Blu-viola
-    [0.2, '#2860c3'],  # Blu intenso
-    [0.3, '#2890c3'],  # Blu chiaro
-    [0.4, '#37c357'],  # Verde
-    [0.5, '#91c337'],  # Verde-giallo
-    [0.6, '#f5e056'],  # Giallo
-    [0.7, '#f5ae56'],  # Arancione chiaro
-    [0.8, '#f57542'],  # Arancione
-    [0.9, '#f34544'],  # Rosso-arancione
-    [1.0, '#d22b2b']   # Rosso intenso
-]
-
-# Riscalamento degli assi:
-buffer_percentage = 0.05
-
-# Funzione per ottenere i 'confini' dei continenti
-def get_continent_bounds(continent):
-    bounds = {
-        'World': {'lon': [-180, 180], 'lat': [-90, 90]},
-        'Europe': {'lon': [-30, 60], 'lat': [30, 75]},
-        'North America': {'lon': [-170, -50], 'lat': [5, 85]},
-        'Asia': {'lon': [30, 160], 'lat': [-10, 85]},
-        'Africa': {'lon': [-30, 60], 'lat': [-40, 40]},
-        'South America': {'lon': [-90, -30], 'lat': [-60, 15]},
-        'Oceania': {'lon': [85, 240], 'lat': [-50, 20]}
-    }
-    return bounds.get(continent, bounds['World'])
-
-# Array che definisce le bande del contest
-bands = ['160M', '80M', '40M', '20M', '15M', '10M']
-
-# Funzione che restituisce il nome del Country dato il codice
-def find_country_from_code(code, selected_dataset):
-    # Casi ambigui da gestire 
-    if code == "ITA":
-        return "Italy"
-    elif code == "ESP":
-        return "Spain"
-    elif code == "USA":
-        return "USA"
-    
-    country_row = selected_dataset[selected_dataset["country_code"] == code]
-    return country_row["Country"].values[0] if not country_row.empty else None
-
-# Template personalizzato per il tema chiaro
-pio.templates["plotly_light_soft"] = pio.templates["plotly_white"].update(
-    layout=dict(
-        paper_bgcolor="#b0b5ba",
-        plot_bgcolor="#b0b5ba"
-    )
-)
-
-############################################################
-
-# Applicazione
-app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
-
-server=app.server
-
-def welcome_page():
-    return dbc.Container([
-        html.H1("Welcome to CQ World Wide WPX Contest Dashboard", style={'text-align': 'center', 'margin-top':'70px', 'font-size':'60px'}),
-        html.H2("The WPX Contest is based on an award offered by CQ Magazine for working all prefixes. Held on the last weekend of March (SSB) and May (CW), the contest draws thousands of entries from around the world.", style={'text-align': 'center', 'margin-top':'50px'}),
-        html.H2("There will be represented data form 2005 to 2024, obtained from the contest official website, using three different dashboards.", style={'text-align': 'center', 'margin-top':'20px'}),
-        html.H2("Select data to represent:", style={'text-align': 'center', 'margin-top':'60px'}),
-        dbc.Row([
-            dbc.Col(dbc.Button("SSB Contest", id='ssb-contest', className="btn-custom btn btn-dark"), width="auto"),
-            dbc.Tooltip("Display a dashboard for SSB contest data",target="ssb-contest", placement="bottom", className="tooltip-custom"),
-            dbc.Col(dbc.Button("CW Contest", id='cw-contest', className="btn-custom btn btn-dark"), width="auto"),
-            dbc.Tooltip("Display a dashboard for CW contest data",target="cw-contest", placement="bottom", className="tooltip-custom"),
-            dbc.Col(dbc.Button("SSB and CW", id='ssb-cw', className="btn-custom btn btn-dark"), width="auto"),
-            dbc.Tooltip("Direct comparison of both contests records through a simple display in one dashboard ",target="ssb-cw", placement="bottom", className="tooltip-custom"),
-        ], justify='center', className="custom-row"),
-    ], style={'text-align': 'center','min-width': '1600px'})
-
-
-app.layout = dbc.Container([
-    dcc.Store(id='global-color-map', storage_type='memory'),
-    dcc.Store(id='selected-theme', data={'dark_mode': True}),
-    dcc.Store(id='selected-template', data='plotly_dark'),
-    html.Link(id='theme-link', rel='stylesheet', href='/static/dark.css'),
-    dbc.Navbar(
-        dbc.Container(
-            dbc.Row([
-                dbc.Col(
-                    dbc.Button(
-                        "Homepage",
-                        id="btn-home",
-                        color="primary",
-                        className="btn-custom-home btn btn-dark",
-                        style={'margin-left':'200px'},
-                    ),
-                    width="auto",
-                    className="p-0"
-                ),
-                dbc.Col(
-                    html.H1(
-                        "Data Analysis for CQ World Wide WPX Contest - by IU1SCQ",
-                        className="mb-0 text-center text-nowrap"
-                    ),
-                    className="p-0 flex-grow-1"
-                ),
-                dbc.Col(
-                    dbc.Switch(
-                        id="select-dark-mode",
-                        label="Dark mode",
-                        value=True,
-                        style={'font-size': '30px', 'margin-right':'200px'},
-                    ),
-                    width="auto",
-                    className="p-0"
-                ),
-            ], align="center", className="g-0 w-100 flex-nowrap"),
-
-            fluid=True,
-            className="w-100",
-            style={'padding-bottom':'20px', 'padding-top':'20px'},
-        ),
-
-        sticky="top",
-        className="w-100"
-    ),
-    dcc.Location(id='url', refresh=False),
-    html.Div(id='page-content', children=welcome_page())
-], fluid=True)
-
-# Callback per tornare alla pagina principale
-@app.callback(
-    Output('page-content', 'children', allow_duplicate=True),
-    Input('btn-home', 'n_clicks'),
-    prevent_initial_call=True
-)
-def go_home(n_clicks):
-    if n_clicks:
-        return welcome_page()
-    return dash.no_update
-
-
-# Callback per lo switch del tema
-@app.callback(
-    [Output('selected-theme', 'data'),
-     Output('selected-template', 'data')],
-    Input('select-dark-mode', 'value')
-)
-def update_theme_store(dark_mode):
-    theme_data = {'dark_mode': dark_mode}
-    template = 'plotly_dark' if dark_mode else 'plotly_light_soft'
-    return theme_data, template
-
-# Callback che aggiorna il tema
-@app.callback(
-    Output('theme-link', 'href'),
-    Input('selected-theme', 'data')
-)
-def update_stylesheet(theme):
-    dark_mode = theme.get('dark_mode', True)
-    if dark_mode:
-        return '/static/dark.css'
-    else:
-        return '/static/light.css'
-
-# Callback che crea la mappa dei colori per i vincitori
-@app.callback(
-    Output('global-color-map', 'data'),
-    Input('winners-table', 'data')
-)
-def compute_color_map(winners_table):
-    if not winners_table:
-        raise PreventUpdate
-    if isinstance(winners_table, list):
-        winners_table = pd.DataFrame(winners_table)
-    
-    unique_winner_countries = winners_table['Country'].unique()
-    vivid_colors = px.colors.qualitative.Vivid
-    country_color_map = {
-        country: vivid_colors[i % len(vivid_colors)]
-        for i, country in enumerate(sorted(unique_winner_countries))
-    }
-    return country_color_map
-
-
-
-########################################################################
-# Funzione che crea la dashboard di dei singoli contest
-########################################################################
-def single_data_dashboard_page(selected_dataset, title_string):        
-    unique_years = selected_dataset['Year'].unique()
-    merged_mean_df = pd.DataFrame({'Year': unique_years})
-    mean_total_QSOs = calculate_mean(selected_dataset, 'QSOs')
-    mean_total_WPX = calculate_mean(selected_dataset, 'WPX')
-
-    # Dataset con medie di qso e wpx e anno
-    mean_qso_wpx_df = pd.merge(merged_mean_df, mean_total_QSOs, on='Year', how='left')
-    mean_qso_wpx_df = pd.merge(mean_qso_wpx_df, mean_total_WPX, on='Year', how='left' )
-
-    # Vengono rappresentate in un linechart le medie dei QSO totali e quelle nelle singole bande
-    for band in bands:
-        mean_df = calculate_mean(selected_dataset, band)
-        merged_mean_df = pd.merge(merged_mean_df, mean_df, on='Year', how='left')        
-    merged_mean_df = pd.merge(merged_mean_df, mean_total_QSOs, on='Year', how='left')
-    merged_mean_df.rename(columns={'QSOs': 'TotalQSOs'}, inplace=True)
-
-
-    # Vincitori di ogni anno
-    grouped_data = selected_dataset.groupby('Year')
-    winners = []
-
-    for year, group in grouped_data:    
-        sorted_group = group.sort_values(by='Score', ascending=False)   
-        winner = sorted_group.head(1)    
-        winners.append(winner)
-
-    winners_table = pd.concat(winners)
-    unique_winner_countries = winners_table['Country'].unique()
-
-    # Punteggio massimo per ogni Country
-    max_scores_by_country = {}
-    for country in unique_winner_countries:
-        max_score_for_country = winners_table[winners_table['Country'] == country]['Score'].max()
-        max_scores_by_country[country] = max_score_for_country
-
-    max_country_score = max(max_scores_by_country, key=max_scores_by_country.get)
-    max_score = max_scores_by_country[max_country_score]
-
-    # QSOs massimi per ogni Country
-    max_QSO_by_country = {}
-    for country in unique_winner_countries:
-        max_QSO_for_country = winners_table[winners_table['Country'] == country]['QSOs'].max()
-        max_QSO_by_country[country] = max_QSO_for_country
-
-    max_country_QSO = max(max_QSO_by_country, key=max_QSO_by_country.get)
-    max_QSO = max_QSO_by_country[max_country_QSO]
-
-    # WPX massimi per ogni Country
-    max_WPX_by_country = {}
-    for country in unique_winner_countries:
-        max_WPX_for_country = winners_table[winners_table['Country'] == country]['WPX'].max()
-        max_WPX_by_country[country] = max_WPX_for_country
-
-    max_country_WPX = max(max_WPX_by_country, key=max_WPX_by_country.get)
-    max_WPX = max_WPX_by_country[max_country_WPX]
-
-
-    # Per il grafico a linee delle bande
-    global_y_min = merged_mean_df[['TotalQSOs', '160M', '80M', '40M', '20M', '15M', '10M']].min().min()
-    global_y_max = merged_mean_df[['TotalQSOs', '160M', '80M', '40M', '20M', '15M', '10M']].max().max()
-    global_y_range = global_y_max - global_y_min
-    global_y_min_buffered = global_y_min - buffer_percentage * global_y_range
-    global_y_max_buffered = global_y_max + buffer_percentage * global_y_range
-
-    global_x_min = merged_mean_df['Year'].min()
-    global_x_max = merged_mean_df['Year'].max()
-    global_x_range = global_x_max - global_x_min
-    global_x_min_buffered = global_x_min - buffer_percentage * global_x_range
-    global_x_max_buffered = global_x_max + buffer_percentage * global_x_range
-
-    # Per l'istogramma dei club quando vengono plottati i QSO
-    global_y_min_QSO = 0
-    global_y_max_QSO = selected_dataset['Score'].max()
-    global_y_QSO_range = global_y_max_QSO - global_y_min_QSO
-    global_y_min_QSO_buffered = global_y_min_QSO - buffer_percentage * global_y_QSO_range
-    global_y_max_QSO_buffered = global_y_max_QSO + buffer_percentage * global_y_QSO_range
-
-    global_x_min_QSO = 0
-    global_x_max_QSO = selected_dataset['QSOs'].max()
-    global_x_QSO_range = global_x_max_QSO - global_x_min_QSO
-    global_x_min_QSO_buffered = global_x_min_QSO - buffer_percentage * global_x_QSO_range
-    global_x_max_QSO_buffered = global_x_max_QSO + buffer_percentage * global_x_QSO_range
-
-    # Per l'istogramma dei club quando vengono plottati i WPX
-    global_y_min_WPX = 0
-    global_y_max_WPX = selected_dataset['Score'].max()
-    global_y_WPX_range = global_y_max_WPX - global_y_min_WPX
-    global_y_min_WPX_buffered = global_y_min_WPX - buffer_percentage * global_y_WPX_range
-    global_y_max_WPX_buffered = global_y_max_WPX + buffer_percentage * global_y_WPX_range
-
-    global_x_min_WPX = 0
-    global_x_max_WPX = selected_dataset['WPX'].max()
-    global_x_WPX_range = global_x_max_WPX - global_x_min_WPX
-    global_x_min_WPX_buffered = global_x_min_WPX - buffer_percentage * global_x_WPX_range
-    global_x_max_WPX_buffered = global_x_max_WPX + buffer_percentage * global_x_WPX_range
-
-
-
-    # Per poter fare uno studio sulle categorie si copia il dataframe di partenza
-    # e si estraggono le sopracategorie. Si crea cosi' una nuova colonna Category 
-    # piu' facilmente utilizzabile
-    new_cat_df = selected_dataset.copy()
-    new_cat_df['Category'] = new_cat_df['Category'].apply(lambda x: x.split(' ')[0])
-    new_cat_df['Category'] = new_cat_df['Category'].replace({'YELLOW': 'YELLOW CARD'})
-    supercat_count_per_year = new_cat_df.groupby(['Year', 'Category']).size().reset_index(name='Count')
-
-
-    # Conteggio dei partecipanti per ogni Country per il plot della mappa
-    country_counts = selected_dataset['country_code'].value_counts().reset_index()
-    country_counts.columns = ['country_code', 'count']
-
-    # Conteggio dei vincitori per ogni Country per il plot della mappa
-    winner_counts = winners_table['country_code'].value_counts().reset_index()
-    winner_counts.columns = ['country_code', 'count']
-    
-        
-    # Componente RadioItems per la selezione della banda
-    radio_band = dbc.RadioItems(
-        id="select-band",
-        options=[        
-            {"label": "All", "value": "All"},
-            {"label": "160M", "value": "160M"},
-            {"label": "80M", "value": "80M"},
-            {"label": "40M", "value": "40M"},
-            {"label": "20M", "value": "20M"},
-            {"label": "15M", "value": "15M"},
-            {"label": "10M", "value": "10M"}
-        ],
-        value="All",
-        style={'font-size': '20px'},
-        inline = True
-    )
-
-    # Componente RadioItems per la selezione del country vincitore
-    radio_winner_countries = dbc.RadioItems(
-        id="winner-country-radio",
-        options=[],
-        value=None,
-        style={'font-size': '20px'},
-        inline=False
-    )
-
-    # Componente RadioItems per la selezione del continente da visualizzare nella mappa
-    radio_continents = dbc.RadioItems(
-        id= "select-continent",
-        options=[
-            {'label': 'World', 'value': 'World'},
-            {'label': 'Europe', 'value': 'Europe'},
-            {'label': 'North America', 'value': 'North America'},
-            {'label': 'South America', 'value': 'South America'},
-            {'label': 'Asia', 'value': 'Asia'},
-            {'label': 'Africa', 'value': 'Africa'},
-            {'label': 'Oceania', 'value': 'Oceania'}
-        ],
-        value='World',
-        style={'width':'900px', 'margin-left':0, 'font-size': '20px'},
-        inline = True
-    )
-
-    # Componente Switch per la selezione del tipo di mappa da visualizzare (mondo o continente)
-    winner_switch = dbc.Switch(
-        id="select-map-type",
-        label="All partecipants/Winners",
-        style= {'font-size': '20px'},
-        value=True
-    )
-
-    # Componente Switch per scegliere se visualizzare qso e wpx a confronto o solo wpx    
-    enable_qso_switch = dbc.Switch(
-        id="enable-qso",
-        label="Show mean of QSOs",
-        style= {'font-size': '20px'},
-        value=True
-    )
-
-    # Componente Switch per scegliere se visualizzare in scala logaritmica nel grafico delle categorie    
-    logarithmic_scale_switch = dbc.Switch(
-        id="logarithmic-scale",
-        label="Use logarithmic scale for y axis",
-        style= {'font-size': '20px'},
-        value=True
-    )
-
-    # Componente RadioItems per la selezione del tipo di dato da visualizzare sull'asse x dell'istogramma dei club
-    radio_club_x = dbc.RadioItems(
-        id="select-club-y",
-        options=[        
-            {"label": "WPXs", "value": "WPX"},
-            {"label": "QSOs", "value": "QSOs"},
-        ],
-        value="WPX",
-        style={'font-size': '20px'},
-        inline=True
-    )
-
-    # Componente RadioItems per la selezione del tipo di dato da visualizzare sull'asse y dei plot dei vincitori
-    radio_winner_y = dbc.RadioItems(
-        id="select-winner-y",
-        options=[        
-            {"label": "WPXs", "value": "WPX"},
-            {"label": "QSOs", "value": "QSOs"},
-            {"label": "Total score", "value": "Score"}
-        ],
-        value="WPX",
-        style={'font-size': '20px'},
-        inline=True
-    )
-    return dbc.Container([
-        dcc.Store(id='selected-data', data=selected_dataset.to_dict('records')),
-        dcc.Store(id='country-counts', data=country_counts.to_dict('records')),
-        dcc.Store(id='winner-counts', data=winner_counts.to_dict('records')),
-        dcc.Store(id='merged-mean-data', data=merged_mean_df.to_dict('records')),
-        dcc.Store(id='global-ranges', data={
-            'x_min': global_x_min_buffered,
-            'x_max': global_x_max_buffered,
-            'y_min': global_y_min_buffered,
-            'y_max': global_y_max_buffered
-        }),
-        dcc.Store(id="mean-qso-wpx", data=mean_qso_wpx_df.to_dict('records')),
-        dcc.Store(id='supercat', data=supercat_count_per_year.to_dict('records')),
-        dcc.Store(id='y-data-to-plot', data='Score'),
-        dcc.Store(id='select-winner-country', data=None),
-        dcc.Store(id='winners-table', data=winners_table.to_dict('records')),
-        dcc.Store(id='winners-QSO-WPX-score', data={
-            'max_QSO': max_QSO,
-            'max_WPX': max_WPX,
-            'max_score': max_score
-        }),
-        dcc.Store(id='global-ranges-QSO-WPX', data={
-            'x_min_QSO': global_x_min_QSO_buffered,
-            'x_max_QSO': global_x_max_QSO_buffered,
-            'y_min_QSO': global_y_min_QSO_buffered,
-            'y_max_QSO': global_y_max_QSO_buffered,
-            'x_min_WPX': global_x_min_WPX_buffered,
-            'x_max_WPX': global_x_max_WPX_buffered,
-            'y_min_WPX': global_y_min_WPX_buffered,
-            'y_max_WPX': global_y_max_WPX_buffered
-        }),
-
-        # Titolo
-        dbc.Row(
-            dbc.Col(
-                html.H3(f'Data from 2005 to 2024 for {title_string} contest'),
-                width=12,
-                className="text-center my-4"
-            )
-        ),
-
-        # QSO e WPX sulle diverse bande, due linechart affiancati nelle due colonne
-        # primo linechart, quello dei qso totali e sulle singole bande
-        # secondo linechart, media dei wpx negli anni a confronto con la media dei qso totali
-        
-        dbc.Row([
-            dbc.Col([
-                html.Div([
-                    dbc.Label("Select band:", html_for="select-band", className="me-2 labels"),
-                    radio_band
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
-                dcc.Graph(id="band-line-chart", style={'width': '100%', 'height': '500px'})
-            ], width=5),
-
-            dbc.Col([
-                html.Div([
-                    enable_qso_switch
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
-                dcc.Graph(id="wpx-qso-linechart", style={'width': '100%', 'height': '500px'})
-            ], width=5)
-        ], justify="center", className="mb-5"),
-
-        # vincitori, barchart con scelta tra wpx e qso, colonna che elenca i vincitori
-        # negli anni, linechart che mostra i vincitori selezionati       
-        dbc.Row([
-            dbc.Col([
-                html.Div([
-                    dbc.Label("Select y axis:", html_for="select-winner-y", className="me-2 labels"),
-                    radio_winner_y
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
-                dcc.Graph(id='winner-barchart', style={'width': '100%', 'height': '500px'})
-            ], width=5),
-
-            dbc.Col([
-                dbc.Label("Select winner:", html_for="winner-country-radio", className="me-2 labels"),
-                radio_winner_countries
-            ], width=1, style={"display": "flex", "flexDirection": "column", "alignItems": "center"}),
-
-            dbc.Col([
-                dcc.Graph(id="winner-linechart", style={'width': '100%', 'height': '500px'})
-            ], width=5)
-        ], justify="center", className="mb-5"),
-
-        # Rappresentazione per i Club
-        dbc.Row([
-            dbc.Col([
-                html.Div([
-                    dbc.Label("Select y axis:", html_for="select-club-y", className="me-2 labels"),
-                    radio_club_x
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
-                dcc.Graph(id="club-chart", style={'width': '100%', 'height': '500px'})
-            ], width=5),
-
-            dbc.Col([
-                dcc.Graph(id='club-pie', style={'width': '100%', 'height': '500px'})
-            ], width=5)
-        ], justify="center", className="mb-5"),
-
-        # Categorie di partecipazione
-        dbc.Row([
-            dbc.Col([
-                html.Div([
-                    logarithmic_scale_switch,
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
-                dcc.Graph(id='category-linechart', style={'width': '100%', 'height': '500px'})
-            ], width=9),
-        ], justify="center", className="mb-5"),
-
-        # Mappa del mondo
-        dbc.Row([
-            dbc.Col([
-                html.Div([
-                    winner_switch,
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
-                html.Div([
-                    dbc.Label("Focus on:", html_for="select-continent", className="me-2 labels"),
-                    radio_continents
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
-                dcc.Graph(id="map-graph", style={'width': '100%', 'height': '800px'}, config={"scrollZoom": False})
-            ], width=9, className="text-center mb-3")
-        ], justify="center", className="mb-5"),
-    ], fluid=True)
-
-
-########################################################################
-# Tutte le callbacks e funzioni per la dashboard dei singoli contest
-########################################################################
-
-# Callback per aggiornare il linechart in base alla selezione della banda
-@app.callback(
-    Output("band-line-chart", "figure"),
-    [Input("select-band", "value"),
-     Input('selected-template', 'data')],
-    [State("merged-mean-data", "data"),
-    State("global-ranges", "data")]
-          
-)
-def update_band_line_chart(selected_band, selected_template, merged_mean_data, global_ranges):
-    merged_mean_df = pd.DataFrame(merged_mean_data)
-    x_min = global_ranges['x_min']
-    x_max = global_ranges['x_max']
-    y_min = global_ranges['y_min']
-    y_max = global_ranges['y_max']
-    color_map = {
-        "TotalQSOs": "#E58606",
-        "160M": "#ED645A",
-        "80M": "#52BCA3",
-        "40M": "#5D69B1",
-        "20M": "#99C945",
-        "15M": "#CC61B0",
-        "10M": "#764E9F",
-    }
-    if selected_band == "All":
-        bands_to_plot = ['TotalQSOs','160M', '80M', '40M', '20M', '15M', '10M']
-    else:
-        bands_to_plot = ['TotalQSOs', selected_band]
-
-    fig_band_line_chart = px.line(
-        merged_mean_df,
-        x='Year',
-        y=bands_to_plot,
-        title=f"QSOs in {selected_band} band compared to total QSOs",
-        labels={"Year": "Year", selected_band: f"{selected_band}"},
-        markers=True,
-        template=selected_template,
-        color_discrete_map=color_map
-    )
-    fig_band_line_chart.update_xaxes(title='Year', range=[x_min, x_max])
-    fig_band_line_chart.update_yaxes(title='Mean of QSOs', range=[y_min, y_max])
-    fig_band_line_chart.update_layout(
-        margin=dict(
-            l=60,
-            r=160,
-            t=60,
-            b=60,
-        )
-    )
-    return fig_band_line_chart
-
-#callback per la creazione del linechart del confronto media wpx e qso
-@app.callback(
-    Output("wpx-qso-linechart", "figure"),
-    [Input('selected-template', 'data'),
-     Input("enable-qso", "value")],
-    [State("mean-qso-wpx", "data"),
-     State("global-ranges", "data")]
-    
-)
-def update_qso_wpx_linechart(selected_template, enable_qso, mean_df, global_ranges):
-    x_min = global_ranges['x_min']
-    x_max = global_ranges['x_max']
-    y_min = global_ranges['y_min']
-    y_max = global_ranges['y_max']
-    color_map = {
-        "QSOs": "#E58606",
-        "WPX": "#2F8AC4"
-    }
-    if enable_qso:
-        data_to_plot = ["WPX", "QSOs"]
-    else:
-        data_to_plot = ["WPX"]
-    fig_qso_wpx_line_chart = px.line(
-        mean_df,
-        x='Year',
-        y=data_to_plot,
-        title=f"Comparsion of mean QSOs and WPXs",
-        labels={"Year": "Year"},
-        markers=True,
-        template=selected_template,
-        color_discrete_map=color_map
-    )
-    fig_qso_wpx_line_chart.update_xaxes(title='Year', range=[x_min, x_max])
-    fig_qso_wpx_line_chart.update_yaxes(title='Mean of data', range=[y_min, y_max])
-    fig_qso_wpx_line_chart.update_layout(
-        margin=dict(
-            l=60,
-            r=160,
-            t=60,
-            b=60,
-        ),
-        showlegend=True
-    )
-    return fig_qso_wpx_line_chart
-
-# Callback per aggiornare l'istogramma sui club
-@app.callback(
-    Output("club-chart", "figure"),
-    [Input("select-club-y", "value"),
-    Input('selected-template', 'data')],
-    State("selected-data", "data")    
-)
-def update_club_chart(selected_y, selected_template, selected_dataset):     
-    if isinstance(selected_dataset, list):
-        data_club = pd.DataFrame(selected_dataset)
-    else:
-        data_club= selected_dataset.copy()
-    
-    # Creazione un nuovo campo 'Club Status' per differenziare i membri di un club da quelli che non lo sono.
-    # Viene utilizzato il metodo .loc per selezionare tutte le righe e viene creata la colonna 'Club Status'.
-    # La funzione lambda controlla se il valore è 'No club' e restituisce 'No Club Member' in quel caso, altrimenti restituisce 'Club Member'.
-    data_club.loc[:, 'Club Status'] = data_club['Club'].apply(lambda x: 'No Club Member' if x == 'NO CLUB' else 'Club Member')
-
-    # Aggregazione
-    data_club_grouped = (data_club.groupby(["Year", "Club Status"], as_index=False)[selected_y].mean())
-    
-    # Colori personalizzati per l'istogramma dei club
-    color_discrete_map = {
-        'No Club Member': "#EFDA3B",
-        'Club Member': '#636EFA'
-    }
-
-    fig_club_chart = px.line(
-        data_club_grouped,
-        x='Year',
-        y=selected_y,
-        color='Club Status',
-        title=f"Comparsion on {selected_y} for club members and not members",
-        labels={"Year": "Year"},
-        markers=True,
-        template=selected_template,
-        color_discrete_map=color_discrete_map
-    ).update_yaxes(title=f"Mean of {selected_y}")      
-    return fig_club_chart
-
-# Callback per la generazione del grafico a torta per i club
-@app.callback(
-    Output("club-pie", "figure"),   
-    Input('selected-template', 'data'),
-    State("selected-data", "data")    
-)
-def update_club_pie(template, selected_data):
-    df = pd.DataFrame(selected_data)
-
-    df["Club Status"] = df["Club"].apply(
-        lambda x: "No Club Member" if x == "NO CLUB" else "Club Member"
-    )
-
-    df_pie = (
-        df
-        .groupby("Club Status")
-        .size()
-        .reset_index(name="Count")
-    )
-
-    fig = px.pie(
-        df_pie,
-        names="Club Status",
-        values="Count",
-        title="Club Members vs No Club Members from 2005 to 2024",
-        color="Club Status",
-        template=template,
-        color_discrete_map={
-            "Club Member": "#636EFA",
-            "No Club Member": "#EFDA3B"
-        }
-    )
-    return fig
-
-# Callback per la scelta del continente da visualizzare nella mappa
-@app.callback(
-    Output('map-graph', 'figure'),
-    [Input('select-continent', 'value'),
-    Input("select-map-type", "value"),
-    Input('selected-template', 'data')],
-    [State('country-counts', 'data'),
-    State('winner-counts', 'data'),
-    State('selected-data', 'data')]
-)
-def update_map(selected_continent, selected_type, selected_template, country_counts, winner_counts, selected_dataset):
-    if isinstance(selected_dataset, list):
-        selected_dataset = pd.DataFrame(selected_dataset)
-    if isinstance(country_counts, list):
-        country_counts = pd.DataFrame(country_counts)
-    if isinstance(winner_counts, list):
-        winner_counts = pd.DataFrame(winner_counts)
-
-    bounds = get_continent_bounds(selected_continent)
-    if selected_type == True:
-        selected_type_of_rapresentation = 'participants'
-        type_of_counts = country_counts        
-        type_of_counts = type_of_counts.rename(columns={'count': 'participants'})
-        color_bar=dict(
-            title='',
-            orientation='v', 
-            yanchor='middle', 
-            y=0.5,  
-            xanchor='left',  
-            x=-0.1,
-            len=1
-        )        
-    else:
-        selected_type_of_rapresentation = 'winners'
-        type_of_counts = winner_counts                
-        type_of_counts = type_of_counts.rename(columns={'count': 'winners'})
-        color_bar = dict(
-            title='',
-            orientation='v', 
-            yanchor='middle', 
-            y=0.5,  
-            xanchor='left',  
-            x=-0.1,
-            len=1,
-            tickvals=[1, 2, 3, 4, 5],
-            ticktext=['1', '2', '3', '4', '5']
-        )
-
-    # Inserimento di una colonna con il nome del Country
-    type_of_counts.loc[:, 'Country'] = type_of_counts['country_code'].apply(lambda code: find_country_from_code(code, selected_dataset))
-
-    map_figure = px.choropleth(
-        type_of_counts,
-        locations="country_code",
-        color=selected_type_of_rapresentation,
-        hover_name="Country",
-        hover_data= {"country_code" : False},
-        template= selected_template, 
-        color_continuous_scale=custom_colorscale,
-        title=f"Number of {selected_type_of_rapresentation} from 2005 to 2024 per Country"
-    ).update_layout(
-        margin=dict(
-            l=60,
-            r=100,
-            t=60,
-            b=60,
-        ),
-        height=700,
-        title_y= 0.95,
-        title_x=0.5, 
-        coloraxis_colorbar = color_bar,
-        geo=dict(
-            projection_scale=1,
-            center={"lat": (bounds['lat'][0] + bounds['lat'][1]) / 2, "lon": (bounds['lon'][0] + bounds['lon'][1]) / 2},
-            lonaxis_range=bounds['lon'],
-            lataxis_range=bounds['lat'],
-        )
-    )
-    return map_figure
-
-# Callback per popolare i radio button per la scelta del country vincitore
-@app.callback(
-    [Output("winner-country-radio", "options"),
-     Output("winner-country-radio", "value")],
-    Input("winners-table", "data")
-)
-def update_winner_country_radio(winners_table):
-    if not winners_table:
-        return [], None
-    df = pd.DataFrame(winners_table)
-    country_year = (
-        df.groupby("Country")["Year"]
-        .min()
-        .reset_index()
-        .sort_values("Year")
-    )
-    options = [
-        {"label": row["Country"], "value": row["Country"]}
-        for _, row in country_year.iterrows()
-    ]
-    value = options[0]["value"]
-    return options, value
-
-# Callback per aggiornare i due grafici sui vincitori in base alla scelta del dato da usare sull'asse y
-@app.callback(
-        Output("y-data-to-plot", "data"),
-        Input("select-winner-y", "value")
-)
-def update_winner_plots(selected_y):
-    if selected_y == "WPX":
-        y_data_to_plot = "WPX"
-    elif selected_y == "QSOs":
-        y_data_to_plot = "QSOs"
-    else:
-        y_data_to_plot = "Score"
-    return y_data_to_plot    
-    
-# Callbacke per aggiornare il grafico barchart dei vincitori
-@app.callback(
-    Output("winner-barchart", "figure"),
-    [Input("y-data-to-plot", "data"),
-     Input('selected-template', 'data'),
-     Input('global-color-map', 'data')],
-    [State('winners-table', 'data')]
-)
-def update_winner_barchart(selected_y, selected_template, color_map, winners_table):
-    if isinstance(winners_table, list):
-        winners_table = pd.DataFrame(winners_table)
-
-    winners_figure = px.bar(
-        winners_table,
-        x='Year',
-        y= selected_y,
-        color='Country',
-        title = "Winner Countries per year",
-        color_discrete_map=color_map,
-        template= selected_template, 
-        hover_data={'Callsign': winners_table["Call"], 'Cat': winners_table["Category"], 'club': winners_table["Club"]}
-    ).update_layout(
-        xaxis_title='Year',
-        yaxis_title=selected_y,
-        margin=dict(l=2, r=2, t=40, b=2)
-    )
-    return winners_figure
-
-# Callback per aggiornare il grafico a linee in base alla scelta del paese (tramite il click sui radio button)
-@app.callback(
-    Output("winner-linechart", "figure"),
-    [Input("winner-country-radio", "value"),
-    Input("y-data-to-plot", "data"),
-    Input('selected-template', 'data'),
-    Input('global-color-map', 'data')],
-    [State('selected-data', 'data'),
-    State('winners-table', 'data'),
-    State('winners-QSO-WPX-score', 'data')]         
-)
-def update_winner_country_chart(selected_country, y_data, selected_template, color_map, selected_dataset, winners_table, winners_QSO_WPX_score):
-    if isinstance(selected_dataset, list):
-        selected_dataset = pd.DataFrame(selected_dataset)
-    if isinstance(winners_table, list):
-        winners_table = pd.DataFrame(winners_table)
-    if selected_country:
-        country_to_plot = selected_country 
-    else:
-        country_to_plot = winners_table.loc[winners_table['Year'] == 2005, 'Country'].values[0]
-
-    max_QSO = winners_QSO_WPX_score['max_QSO']
-    max_WPX = winners_QSO_WPX_score['max_WPX']
-    max_score = winners_QSO_WPX_score['max_score']
-
-    if y_data == "WPX":
-        max_to_plot = max_WPX
-    elif y_data == "QSOs":
-        max_to_plot = max_QSO
-    else:
-        max_to_plot = max_score
-
-    # Per il riscalamento degli assi
-    global_y_winner_min = 0
-    global_y_winner_max = max_to_plot
-    global_y_range = global_y_winner_max - global_y_winner_min
-    global_y_winner_max_buffered = global_y_winner_max + buffer_percentage * global_y_range
-    global_y_winner_max_buffered = max_to_plot * (1 + buffer_percentage)
-
-
-    mean_score_df = calculate_mean_data_for_country(selected_dataset, country_to_plot, y_data)
-    
-    # Per ottenere il colore corretto dalla mappa
-    country_color = color_map.get(country_to_plot, "white")
-
-    fig_winner_country_chart = px.line(
-        mean_score_df,
-        x='Year',
-        y= y_data,
-        title=f"Average {y_data} for {country_to_plot} and winners",        
-        labels={"Year": "Year", y_data: f"Average {y_data}"},
-        template= selected_template,
-        color_discrete_sequence=[country_color],
-        markers=True    
-    ).update_layout(        
-        margin=dict(l=2, r=2, t=40, b=2)
-    )  
-    winners_selected_country = winners_table[winners_table['Country'] == country_to_plot]
-    fig_winner_country_chart.update_yaxes(title=y_data, range=[global_y_winner_min, global_y_winner_max_buffered])
-
-    # Viene sovrapposto al grafico a linee uno scatterplot per visualizzare i vincitori
-    fig_winner_country_chart.add_scatter(    
-        x=winners_selected_country['Year'],  
-        y=winners_selected_country[y_data],  
-        mode='markers', 
-        name='Winners',
-        line=dict(color="#FFFFFF"),
-        text=winners_selected_country['Call'],
-        hovertemplate=
-        '<b>Year</b>: %{x}<br>' +
-        '<b>Call</b>: %{text}<extra></extra><br>' +
-        f'<b>{y_data}</b>: %{{y}}'
-    )
-    return fig_winner_country_chart
-
-# Callback per aggiornare il grafico a linee per le categorie
-@app.callback(
-    Output("category-linechart", "figure"),
-    [Input('selected-template', 'data'),
-     Input('logarithmic-scale', 'value')],
-    State('supercat', 'data')
-)
-def update_category_linechart(selected_template, logatithmic_scale, supercat_count_per_year):
-    category_fig = px.line(
-        supercat_count_per_year,
-        x='Year',
-        y='Count',
-        color='Category',
-        title="Number of operators for each category per year",
-        color_discrete_sequence=px.colors.qualitative.Vivid,
-        markers = True,
-        template=selected_template,
-        labels={'Count': 'Count', 'Category': 'Category', 'Year': 'Year'}
-    )
-    if logatithmic_scale:
-        category_fig.update_yaxes(type='log', title_text='Number of operators')
-    else:
-        category_fig.update_yaxes(title_text='Number of operators')
-
-    return category_fig
-
-
-########################################################################
-# Funzione che crea la dashboard di confronto
-########################################################################
-
-def ssb_cw_dashboard_page(selected_dataset):    
-    unique_years = selected_dataset['Year'].unique()
-    merged_mean_df = pd.DataFrame({'Year': unique_years})
-
-    mean_total_QSOs_CW = calculate_mean(selected_dataset[selected_dataset['Contest'] == 'CW'], 'QSOs')
-    mean_total_QSOs_SSB = calculate_mean(selected_dataset[selected_dataset['Contest'] == 'SSB'], 'QSOs')
-
-    mean_total_WPX_CW = calculate_mean(selected_dataset[selected_dataset['Contest'] == 'CW'], 'WPX')
-    mean_total_WPX_SSB = calculate_mean(selected_dataset[selected_dataset['Contest'] == 'SSB'], 'WPX')
-
-    mean_total_score_CW = calculate_mean(selected_dataset[selected_dataset['Contest'] == 'CW'], 'Score')
-    mean_total_score_SSB = calculate_mean(selected_dataset[selected_dataset['Contest'] == 'SSB'], 'Score')
-
-    for band in bands:
-        mean_CW_df = calculate_mean(selected_dataset[selected_dataset['Contest'] == 'CW'], band)
-        mean_SSB_df = calculate_mean(selected_dataset[selected_dataset['Contest'] == 'SSB'], band)
-
-        mean_CW_df.rename(columns={band: f"{band}_CW"}, inplace=True)
-        mean_SSB_df.rename(columns={band: f"{band}_SSB"}, inplace=True)
-
-        merged_mean_df = pd.merge(merged_mean_df, mean_CW_df, on='Year', how='left')
-        merged_mean_df = pd.merge(merged_mean_df, mean_SSB_df, on='Year', how='left')
-
-    # Merge finale per i QSOs totali
-    mean_total_QSOs_CW.rename(columns={'QSOs': 'TotalQSOs_CW'}, inplace=True)
-    mean_total_QSOs_SSB.rename(columns={'QSOs': 'TotalQSOs_SSB'}, inplace=True)
-
-    mean_total_WPX_CW.rename(columns={'WPX': 'TotalWPX_CW'}, inplace=True)
-    mean_total_WPX_SSB.rename(columns={'WPX': 'TotalWPX_SSB'}, inplace=True)
-
-    mean_total_score_CW.rename(columns={'Score': 'TotalScore_CW'}, inplace=True)
-    mean_total_score_SSB.rename(columns={'Score': 'TotalScore_SSB'}, inplace=True)
-
-    merged_mean_df = pd.merge(merged_mean_df, mean_total_QSOs_CW, on='Year', how='left')
-    merged_mean_df = pd.merge(merged_mean_df, mean_total_QSOs_SSB, on='Year', how='left')
-    merged_mean_df = pd.merge(merged_mean_df, mean_total_WPX_CW, on='Year', how='left')
-    merged_mean_df = pd.merge(merged_mean_df, mean_total_WPX_SSB, on='Year', how='left')
-    merged_mean_df = pd.merge(merged_mean_df, mean_total_score_CW, on='Year', how='left')
-    merged_mean_df = pd.merge(merged_mean_df, mean_total_score_SSB, on='Year', how='left')
-
-    # Conteggio dei partecipanti per ogni Country per il plot della mappa
-    country_counts_cw = selected_dataset[selected_dataset['Contest'] == 'CW']['country_code'].value_counts().reset_index()
-    country_counts_cw.columns = ['country_code', 'count']
-
-    country_counts_ssb = selected_dataset[selected_dataset['Contest'] == 'SSB']['country_code'].value_counts().reset_index()
-    country_counts_ssb.columns = ['country_code', 'count']
-
-
-    # Vincitori di ogni anno per il cw
-    grouped_data_cw = selected_dataset[selected_dataset['Contest'] == 'CW'].groupby('Year')
-    winners_cw = []
-
-    for year, group in grouped_data_cw:    
-        sorted_group_cw = group.sort_values(by='Score', ascending=False)   
-        winner_cw = sorted_group_cw.head(1)    
-        winners_cw.append(winner_cw)
-
-    winners_cw_table = pd.concat(winners_cw)
-
-    # Vincitori di ogni anno per l'ssb
-    grouped_data_ssb = selected_dataset[selected_dataset['Contest'] == 'SSB'].groupby('Year')
-    winners_ssb = []
-
-    for year, group in grouped_data_ssb:    
-        sorted_group_ssb = group.sort_values(by='Score', ascending=False)   
-        winner_ssb = sorted_group_ssb.head(1)    
-        winners_ssb.append(winner_ssb)
-
-    winners_ssb_table = pd.concat(winners_ssb)
-
-
-
-    # Componente RadioItems per la selezione della banda
-    radio_comparsion_band = dbc.RadioItems(
-        id="select-comparsion-band",
-        options=[        
-            {"label": "160M", "value": "160M"},
-            {"label": "80M", "value": "80M"},
-            {"label": "40M", "value": "40M"},
-            {"label": "20M", "value": "20M"},
-            {"label": "15M", "value": "15M"},
-            {"label": "10M", "value": "10M"}
-        ],
-        value="20M",
-        style={'item-align':'center', 'font-size': '20px'},
-        inline = True
-    )
-
-    # Componente RadioItems per la selezione del tipo di dato da visualizzare sull'asse y del linechart dei qso wpx
-    radio_qso_wpx_comparsion = dbc.RadioItems(
-        id="select-line-qso-wpx-y",
-        options=[        
-            {"label": "WPX", "value": "TotalWPX"},
-            {"label": "QSOs", "value": "TotalQSOs"}
-        ],
-        value="TotalWPX",
-        style={'font-size': '20px'},
-        inline=True
-    )
-
-    # Componente RadioItems per la selezione del continente da visualizzare nella mappa
-    radio_comparsion_continents = dbc.RadioItems(
-        id= "select-comparsion-continent",
-        options=[
-            {'label': 'World', 'value': 'World'},
-            {'label': 'Europe', 'value': 'Europe'},
-            {'label': 'North America', 'value': 'North America'},
-            {'label': 'South America', 'value': 'South America'},
-            {'label': 'Asia', 'value': 'Asia'},
-            {'label': 'Africa', 'value': 'Africa'},
-            {'label': 'Oceania', 'value': 'Oceania'}
-        ],
-        value='World',
-        style={'width':1000, 'margin-top':10, 'font-size': '20px'},
-        inline = True
-    )
-
-    # Componenete RadioItems per la selezione del dato da visualizzare sull'asse y nei barchart dei vincitori
-    radio_comparsion_winner_axis = dbc.RadioItems(
-        id= "select-y-barchart-comparsion",
-        options=[
-            {'label': 'WPX', 'value': 'WPX'},
-            {'label': 'QSOs', 'value': 'QSOs'},
-            {'label': 'Total score', 'value': 'Score'}
-        ],
-        value='WPX',
-        style={'font-size': '20px'},
-        inline = True
-    )
-    
-    return dbc.Container([
-        dcc.Store(id='selected-data', data=selected_dataset.to_dict('records')),
-        dcc.Store(id='merged-mean-data', data=merged_mean_df.to_dict('records')),
-        dcc.Store(id='country-counts-ssb', data=country_counts_ssb.to_dict('records')),
-        dcc.Store(id='country-counts-cw', data=country_counts_cw.to_dict('records')),
-        dcc.Store(id='winners-cw-table', data=winners_cw_table.to_dict('records')),
-        dcc.Store(id='winners-ssb-table', data=winners_ssb_table.to_dict('records')),
-
-        dbc.Row(
-            dbc.Col(
-                html.H3('Comparsion between SSB and CW contest data from 2005 to 2024'),
-                width=12,
-                className="text-center my-4"
-            )
-        ),
-        # Grafico a linee per le bande
-        dbc.Row([
-            dbc.Col([
-                html.Div([
-                    dbc.Label(
-                        "Select band:",
-                        html_for="select-comparsion-band",
-                        class_name="me-2 labels"
-                    ),
-                    radio_comparsion_band
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),                    
-                dcc.Graph(id="band-comparsion", style={'width': '100%', 'height': '500px'}),
-            ], width=5),
-            dbc.Col([
-                html.Div([
-                    dcc.Graph(id = 'cw-pie', style={'width': '50%', 'height': '500px'}),
-                    dcc.Graph(id = 'ssb-pie', style={'width': '50%', 'height': '500px'})
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),                
-            ], width=6),
-        ], justify="center", className="mb-5"),
-        # Grafico di comparazione dei punteggi o qso o wpx negli anni
-        dbc.Row([
-            # Grafico a linee per la media dei punteggi
-            dbc.Col([                
-                dcc.Graph(id="score-comparsion", style={'width': '100%', 'height': '500px'})
-            ], width=5),
-            # Grafico a linee per le medie dei WPX o dei QSO a seconda della selezione
-            dbc.Col([
-                html.Div([
-                    dbc.Label(
-                        "Select y axis:",
-                        html_for="selectline-qso-wpx-y",
-                        class_name="me-2 labels"
-                    ),
-                    radio_qso_wpx_comparsion
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
-                dcc.Graph(id="qso-wpx-comparsion", style={'width': '100%', 'height': '500px'})
-            ], width=5)            
-        ], justify="center", className="mb-5"), 
-        # Grafici dei vincitori. Devono essere più indipendenti l'uno dall'altro
-        dbc.Row([                    
-            dbc.Col([
-                html.Div([
-                    dbc.Label(
-                        "Select y axis:",
-                        html_for="select-y-barchart-comparsion",
-                        class_name="me-2 labels"
-                    ),
-                    radio_comparsion_winner_axis
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),                
-                dcc.Graph(id='winner-barchart-comparsion', style={'width': '100%', 'height': '500px', 'margin-right':'20px'}),
-            ], width=5),
-            dbc.Col([
-                html.Div([
-                    dcc.Graph(id='winner-radar', style={'width': '100%', 'height': '500px', 'margin-left':'20px'})
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})
-            ], width=5)                      
-        ], justify="center", className="mb-5"),
-        # Mappe
-        dbc.Row([
-            dbc.Col([
-                html.Div([
-                    dbc.Label(
-                        "Focus on:",
-                        html_for="select-comparsion-continent",
-                        class_name="me-2 labels"
-                    ),
-                    radio_comparsion_continents
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center", "margin-top":"40px"}),
-            ], width=10, class_name="text-center mb-3"),
-        ], justify="center", className="mb-5"),
-        dbc.Row([        
-            dbc.Col([
-                html.Div([
-                    dcc.Graph(id='participants-map-graph', style={'width': '100%', 'height': '700px'}, config={"scrollZoom": False}),
-                    dcc.Graph(id='winners-map-graph', style={'width': '100%', 'height': '700px'}, config={"scrollZoom": False})
-                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})                
-            ], width=10, style={'display':'flex', 'flexDirection': 'column', 'alignItems':'center', 'min-height': 1000})
-        ], justify="center", className="mb-5")
-    ], fluid=True)                   
- 
-#################################################################
-# Tutte le callbacks e le funzioni per la dashboard di confronto
-#################################################################
-
-# Callback per il linechart delle bande
-@app.callback(
-    Output("band-comparsion", "figure"),
-    [Input("select-comparsion-band", "value"),
-     Input('selected-template', 'data')],
-    State("merged-mean-data", "data")  
-)
-def update_band_comparsion_line_chart(selected_band, selected_template, merged_mean_data):
-    
-    merged_mean_df = pd.DataFrame(merged_mean_data)
-
-    band_cw_column = f"{selected_band}_CW"
-    band_ssb_column = f"{selected_band}_SSB"
-
-    fig_band_comparsion_line_chart = go.Figure()
-
-    fig_band_comparsion_line_chart.add_trace(go.Scatter(
-        x=merged_mean_df['Year'],
-        y=merged_mean_df[band_cw_column],
-        mode='lines+markers',
-        name='CW',
-        line=dict(color='#31AFE0')
-    ))
-
-    fig_band_comparsion_line_chart.add_trace(go.Scatter(
-        x=merged_mean_df['Year'],
-        y=merged_mean_df[band_ssb_column],
-        mode='lines+markers',
-        name='SSB',
-        line=dict(color='darkorange')
-    ))
-
-    fig_band_comparsion_line_chart.update_layout(
-        title=f"Comparison of number of QSOs between SSB and CW contest in {selected_band} band",
-        xaxis_title='Year',
-        yaxis_title='Mean of QSOs',
-        template= selected_template
-    )
-
-    return fig_band_comparsion_line_chart
-
-# Callback per il pie del contest cw
-@app.callback(
-    Output("cw-pie", "figure"),   
-    Input('selected-template', 'data'),
-    State("merged-mean-data", "data")    
-)
-def update_cw_pie(template, data):
-    df = pd.DataFrame(data)
-
-    values = []
-    labels = []
-
-    for band in bands:
-        col = f"{band}_CW"
-        if col in df.columns:
-            values.append(df[col].sum())
-            labels.append(band)
-
-    fig = px.pie(
-        names=labels,
-        values=values,
-        title="Band activity comparsion in CW contest",
-        template=template,
-        color_discrete_sequence=px.colors.qualitative.Vivid
-    ).update_traces(
-        hovertemplate=
-        "Band: %{label}<br>"
-        "QSOs: %{value}<extra></extra>"
-    )
-
-    return fig
-
-# Callback per il pie del contest ssb
-@app.callback(
-    Output("ssb-pie", "figure"),   
-    Input('selected-template', 'data'),
-    State("merged-mean-data", "data")    
-)
-def update_ssb_pie(template, data):
-    df = pd.DataFrame(data)
-
-    values = []
-    labels = []
-
-    for band in bands:
-        col = f"{band}_SSB"
-        if col in df.columns:
-            values.append(df[col].sum())
-            labels.append(band)
-
-    fig = px.pie(
-        names=labels,
-        values=values,
-        title="Band activity comparsion in SSB contest",
-        template=template,
-        color_discrete_sequence=px.colors.qualitative.Vivid
-    ).update_traces(
-        hovertemplate=
-        "Band: %{label}<br>"
-        "QSOs: %{value}<extra></extra>"
-    )
-
-    return fig
-
-# Callback per il linechart per il punteggio medio negli anni
-@app.callback(
-    Output("score-comparsion", "figure"),    
-    Input('selected-template', 'data'),
-    State("merged-mean-data", "data")
-)
-def update_score_comparsion(selected_template, merged_mean_data):        
-    merged_mean_df = pd.DataFrame(merged_mean_data)
-    fig_score_chart = go.Figure()
-    fig_score_chart.add_trace(go.Scatter(
-        x=merged_mean_df['Year'],
-        y=merged_mean_df['TotalScore_CW'],
-        mode='lines+markers',
-        name='CW',
-        line=dict(color='#31AFE0')
-    ))
-    fig_score_chart.add_trace(go.Scatter(
-        x=merged_mean_df['Year'],
-        y=merged_mean_df['TotalScore_SSB'],
-        mode='lines+markers',
-        name='SSB',
-        line=dict(color='darkorange')
-    ))
-    fig_score_chart.update_layout(
-        title=f"Comparison of mean Score between SSB and CW contest",
-        xaxis_title='Year',
-        yaxis_title='Mean of Score',
-        template= selected_template
-    )
-    return fig_score_chart
-
-# Callback per il linechart per i wpx o qso medi negli anni
-@app.callback(
-    Output("qso-wpx-comparsion", "figure"),    
-    [Input('selected-template', 'data'), 
-     Input('select-line-qso-wpx-y', 'value')],
-    State("merged-mean-data", "data")
-)
-def update_score_comparsion(selected_template, selected_y, merged_mean_data):        
-    merged_mean_df = pd.DataFrame(merged_mean_data)
-
-    fig_line_chart = go.Figure()
-    y_cw = f'{selected_y}_CW'
-    y_ssb = f'{selected_y}_SSB'
-
-    fig_line_chart.add_trace(go.Scatter(
-        x=merged_mean_df['Year'],
-        y=merged_mean_df[y_cw],
-        mode='lines+markers',
-        name='CW',
-        line=dict(color='#31AFE0')
-    ))
-    fig_line_chart.add_trace(go.Scatter(
-        x=merged_mean_df['Year'],
-        y=merged_mean_df[y_ssb],
-        mode='lines+markers',
-        name='SSB',
-        line=dict(color='darkorange')
-    ))
-    if selected_y == 'TotalQSOs':
-        mean_label = 'QSOs'
-    else:
-        mean_label = 'WPX'
-
-    fig_line_chart.update_layout(
-        title=f"Comparison of mean {mean_label} between SSB and CW contest",
-        xaxis_title='Year',
-        yaxis_title=f"Mean of {mean_label}",
-        template= selected_template
-    )
-    return fig_line_chart
-
-# Callback per le mappe geografiche
-@app.callback(
-    [Output('participants-map-graph', 'figure'),
-    Output('winners-map-graph', 'figure')],
-    [Input('select-comparsion-continent', 'value'),
-     Input('selected-template', 'data')],
-    [State('country-counts-ssb', 'data'),
-    State('country-counts-cw', 'data'),
-    State('selected-data', 'data'),
-    State('winners-cw-table', 'data'),
-    State('winners-ssb-table', 'data')]
-)
-def update_comparsion_map(selected_continent, selected_template, country_counts_ssb, country_counts_cw, selected_dataset, winners_cw_table, winners_ssb_table):
-    if isinstance(selected_dataset, list):
-        selected_dataset = pd.DataFrame(selected_dataset)
-    if isinstance(country_counts_ssb, list):
-        country_counts_ssb = pd.DataFrame(country_counts_ssb)        
-    if isinstance(country_counts_cw, list):
-        country_counts_cw = pd.DataFrame(country_counts_cw)
-    if isinstance(winners_cw_table, list):
-        winners_cw_table = pd.DataFrame(winners_cw_table)
-    if isinstance(winners_ssb_table, list):
-        winners_ssb_table = pd.DataFrame(winners_ssb_table)
-
-    bounds = get_continent_bounds(selected_continent)
-
-    type_of_counts_ssb = country_counts_ssb        
-    type_of_counts_ssb = type_of_counts_ssb.rename(columns={'count': 'participants'})
-    type_of_counts_cw = country_counts_cw        
-    type_of_counts_cw = type_of_counts_cw.rename(columns={'count': 'participants'})
-
-    # Inserimento di una colonna con il nome del Country
-    type_of_counts_ssb.loc[:, 'Country'] = type_of_counts_ssb['country_code'].apply(lambda code: find_country_from_code(code, selected_dataset[selected_dataset['Contest'] == 'SSB']))
-    type_of_counts_cw.loc[:, 'Country'] = type_of_counts_cw['country_code'].apply(lambda code: find_country_from_code(code, selected_dataset[selected_dataset['Contest'] == 'CW']))
-
-    # Merge dei dati CW e SSB per confronto
-    combined_counts = pd.merge(
-        type_of_counts_ssb[['country_code', 'participants', 'Country']],
-        type_of_counts_cw[['country_code', 'participants', 'Country']],
-        on=['country_code', 'Country'],
-        suffixes=('_ssb', '_cw')
-    )
-
-    # Determina il contest con il maggior numero di partecipanti
-    combined_counts['Majority'] = combined_counts.apply(lambda row: 'CW' if row['participants_cw'] > row['participants_ssb'] else 'SSB', axis=1)
-    color_map = {'CW': '#31AFE0', 'SSB': 'orange'}
-    combined_counts['color'] = combined_counts['Majority'].map(color_map)
-    
-    # Mappa per numero di partecipanti
-    map_figure_participants = px.choropleth(
-        combined_counts,
-        locations="country_code",
-        color='Majority',
-        hover_name="Country",
-        hover_data={"country_code": False, "participants_ssb": True, "participants_cw": True},
-        template= selected_template,
-        title=f"Comparsion of number of participants per Country",
-        color_discrete_map=color_map,
-    ).update_layout(
-        margin=dict(
-            l=5, 
-            r=5, 
-            t=70, 
-            b=20
-        ),
-        height=700,
-        title_y= 0.98,
-        title_x=0.5, 
-        geo=dict(
-            projection_scale=1,
-            center={"lat": (bounds['lat'][0] + bounds['lat'][1]) / 2, "lon": (bounds['lon'][0] + bounds['lon'][1]) / 2},
-            lonaxis_range=bounds['lon'],
-            lataxis_range=bounds['lat']
-        ),
-        legend=dict(
-            orientation="h",      
-            yanchor="bottom",    
-            xanchor="center",  
-            y=1,    
-            x=0.5    
-        )
-    )
-
-    # Vincitori
-    cw_countries = winners_cw_table.groupby('country_code').size().reset_index(name='cw_winners')
-    ssb_countries = winners_ssb_table.groupby('country_code').size().reset_index(name='ssb_winners')
-
-    winners_counts = pd.merge(cw_countries, ssb_countries, on='country_code', how='outer').fillna(0)
-    winners_counts['cw_winners'] = winners_counts['cw_winners'].astype(int)
-    winners_counts['ssb_winners'] = winners_counts['ssb_winners'].astype(int)
-
-    winners_counts['Contest'] = winners_counts.apply(
-        lambda row: 'CW Only' if row['cw_winners'] > 0 and row['ssb_winners'] == 0 else
-                    'SSB Only' if row['ssb_winners'] > 0 and row['cw_winners'] == 0 else
-                    'Both',
-        axis=1
-    )
-    winners_counts['Country'] = winners_counts['country_code'].apply(lambda code: find_country_from_code(code, selected_dataset))
-
-    color_map = {'CW Only': '#31AFE0', 'SSB Only': 'orange', 'Both': '#FF00B7'}
-
-    # Mappa per numero di vincitori
-    map_figure_winners = px.choropleth(
-        winners_counts,
-        locations="country_code",
-        color="Contest",
-        hover_name="Country",        
-        hover_data={"Country": False, "country_code":False, "cw_winners": True, "ssb_winners": True},
-        template= selected_template,
-        title=f"Winners Distribution",
-        color_discrete_map=color_map
-    ).update_layout(
-        margin=dict(
-            l=5, 
-            r=5, 
-            t=70, 
-            b=20
-        ),        
-        height=700,
-        title_y= 0.98,
-        title_x=0.5,
-        geo=dict(
-            projection_scale=1,
-            center={"lat": (bounds['lat'][0] + bounds['lat'][1]) / 2, "lon": (bounds['lon'][0] + bounds['lon'][1]) / 2},
-            lonaxis_range=bounds['lon'],
-            lataxis_range=bounds['lat']
-        ),
-        legend=dict(
-            orientation="h", 
-            yanchor="bottom",
-            xanchor="center",
-            y=1,          
-            x=0.5            
-        )
-    )
-    return map_figure_participants, map_figure_winners
-
-# Callback per il grafico a barre dei vincitori
-@app.callback(
-    Output("winner-barchart-comparsion", "figure"),
-    [Input('selected-template', 'data'),
-      Input('select-y-barchart-comparsion', 'value')],
-    [State('winners-cw-table', 'data'),
-     State('winners-ssb-table', 'data')]
-)
-def update_winner_comparsion_barchart(selected_template, selected_y, winners_cw_table, winners_ssb_table):    
-    if isinstance(winners_cw_table, list):
-        winners_cw_table = pd.DataFrame(winners_cw_table)
-    if isinstance(winners_ssb_table, list):
-        winners_ssb_table = pd.DataFrame(winners_ssb_table)
-
-    cw_color = '#31AFE0'
-    ssb_color = 'orange'
-
-    cw_data = winners_cw_table[["Year", "Country", selected_y]].rename(columns={selected_y: "Value"})
-    ssb_data = winners_ssb_table[["Year", "Country", selected_y]].rename(columns={selected_y: "Value"})
-
-    winner_barchart = go.Figure()
-    winner_barchart.add_trace(
-        go.Bar(
-            x=cw_data["Year"],
-            y=cw_data["Value"],
-            name="CW",
-            marker_color=cw_color,
-            hovertemplate=(
-                "<b>Year:</b> %{x}<br>"
-                "<b>Country:</b> %{customdata}<br>"
-                "<b>" + selected_y +": </b> %{y}<extra></extra>"
-            ),
-            customdata=cw_data["Country"]
-        )
-    )
-    winner_barchart.add_trace(
-        go.Bar(
-            x=ssb_data["Year"],
-            y=ssb_data["Value"],
-            name="SSB",
-            marker_color=ssb_color,
-            hovertemplate=(
-                "<b>Year:</b> %{x}<br>"
-                "<b>Country:</b> %{customdata}<br>"
-                "<b>" + selected_y +": </b> %{y}<extra></extra>"
-            ),
-            customdata=ssb_data["Country"]
-        )
-    )
-    winner_barchart.update_layout(
-        template= selected_template,
-        height=570,
-        width=850,
-        barmode="group",  # Per sovrapporre le barre
-        title=f"Winner Comparison ({selected_y})",
-        xaxis_title="Year",
-        yaxis_title=selected_y,
-        legend_title="Contest",
-        margin=dict(l=10, r=10, t=50, b=50),
-    )
-
-    return winner_barchart
-
-# Radar chart vincitori
-@app.callback(
-    Output('winner-radar', 'figure'),
-    Input('selected-template', 'data'),
-    [ State('winners-cw-table', 'data'),
-    State('winners-ssb-table', 'data')]
-)
-def update_radar_chart(selected_template, winners_cw_table, winners_ssb_table):
-    if isinstance(winners_cw_table, list):
-        winners_cw_table = pd.DataFrame(winners_cw_table)
-    if isinstance(winners_ssb_table, list):
-        winners_ssb_table = pd.DataFrame(winners_ssb_table)
-
-    cw_color = '#31AFE0'
-    ssb_color = 'orange'
-
-    cw_band_profile = winners_cw_table[bands].mean()
-    ssb_band_profile = winners_ssb_table[bands].mean()
-    fig = go.Figure()
-
-    fig.add_trace(
-        go.Scatterpolar(
-            r=cw_band_profile.values,
-            theta=bands,
-            fill='toself',
-            name='CW Winners',
-            line=dict(color=cw_color)
-        )
-    )
-
-    fig.add_trace(
-        go.Scatterpolar(
-            r=ssb_band_profile.values,
-            theta=bands,
-            fill='toself',
-            name='SSB Winners',
-            line=dict(color=ssb_color)
-        )
-    )
-
-    fig.update_layout(
-        title="Band activity profile of contest winners (mean of QSOs per band)",
-        polar=dict(
-            radialaxis=dict(visible=True)
-        ),
-        template = selected_template,
-        showlegend=True
-    )
-
-    return fig
-
-
-##################################################################
-# Callback per gestire la selezione del dataset e la navigazione alla dashboard
-@app.callback(
-    Output('page-content', 'children'),
-    [Input('ssb-contest', 'n_clicks'),
-     Input('cw-contest', 'n_clicks'),
-     Input('ssb-cw', 'n_clicks')],
-     prevent_initial_call=True  # Per evitare che la callback venga chiamata all'inizio
-)
-def select_dataset(ssb_click, cw_click, ssb_cw_click):
-    if ssb_click:
-        return single_data_dashboard_page(ssb_dataset, 'SSB')  
-    elif cw_click:
-        return single_data_dashboard_page(cw_dataset, 'CW')
-    elif ssb_cw_click:
-        return ssb_cw_dashboard_page(ssb_cw_dataset)
-    else:
-        return welcome_page()
-
-if __name__ == '__main__':
-    app.run(debug=True)
-
-
-
-
+import pandas as pd
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.io.json import to_json_plotly
+import os
+import sys
+import io
+import json
+import hashlib
+import hmac
+import pickle
+import functools
+import gzip
+import threading
+import time
+import logging
+import urllib.request
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+import dash_bootstrap_components as dbc
+from dash import dash, html, dcc, State, Input, Output, callback_context
+from dash.exceptions import PreventUpdate
+from flask import request, jsonify, g, abort, Response
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Messaggi del server (dati non risolti, log scartati, budget superati): senza una
+# configurazione di logging i warning vengono scritti su stderr
+logger = logging.getLogger('dashboard')
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+cw_data_path = os.path.join(BASE_DIR, "cw_data.csv")
+ssb_data_path = os.path.join(BASE_DIR, "ssb_data.csv")
+prefix_data_path = os.path.join(BASE_DIR, "correct_countries_prefixes.csv")
+country_codes_data_path = os.path.join(BASE_DIR, "country_codes.CSV")
+
+# Cartella della cache binaria dei dataset arricchiti
+dataset_cache_dir = os.path.join(BASE_DIR, ".dataset_cache")
+# Da incrementare quando cambia il formato della cache o l'arricchimento dei dati
+dataset_cache_format = 4
+
+# Viene caricato il dataframe dei codici dei Country
+country_codes_df = pd.read_csv(country_codes_data_path, sep = ";")
+
+# Vengono rinominate le colonne del dataframe dei codici per adattarle al merge
+country_codes_df.rename(columns={'COUNTRY': 'Country', 'CODE': 'country_code'}, inplace=True)
+
+# Tabella dei prefissi (PREFIX -> COUNTRY): viene letta dalla cache locale versionata,
+# aggiornata con --refresh-prefixes dalla geolist, oppure dal CSV incluso se la cache
+# manca o non e' valida. L'avvio e le richieste non usano mai la rete: i worker
+# applicano una nuova tabella quando trovano la cache aggiornata
+geolist_url = "https://cqww.com/api/get/geolist"
+geolist_timeout = 30
+# Campi della geolist con il prefisso e il Country (senza distinzione tra maiuscole)
+geolist_prefix_field = 'prefix'
+geolist_country_field = 'country'
+# Una nuova tabella con meno prefissi di questa frazione della tabella corrente
+# viene rifiutata (risposta troncata o formato cambiato)
+prefix_table_min_ratio = 0.9
+
+# Funzione che restituisce il percorso della cache della tabella dei prefissi
+def prefix_table_path():
+    return os.path.join(dataset_cache_dir, "prefix_table.json")
+
+# Funzione che costruisce la tabella dei prefissi (colonne PREFIX e COUNTRY) con
+# gli indici usati per risolvere i Country. La versione deriva dal contenuto, quindi
+# e' la stessa in tutti i worker
+def build_prefix_table(prefixes_df, source):
+    # Vengono rinominate le colonne per adattarle al merge e rimossi i duplicati
+    prefixes = prefixes_df[['PREFIX', 'COUNTRY']].rename(columns={'PREFIX': 'QTH', 'COUNTRY': 'Country'})
+    prefixes = prefixes.drop_duplicates(subset='QTH').reset_index(drop=True)
+    content = prefixes.to_csv(sep = ";", index=False).encode()
+    prefix_index = pd.Index(prefixes['QTH'])
+    return {
+        'version': hashlib.sha256(content).hexdigest()[:16],
+        'source': source,
+        'prefixes': prefixes,
+        'index': prefix_index,
+        'countries': prefixes['Country'].to_numpy(),
+        'max_length': int(prefix_index.str.len().max())
+    }
+
+# Funzione che verifica una nuova tabella dei prefissi prima di usarla
+def validate_prefix_table(table, current_table=None):
+    prefixes = table['prefixes']
+    if prefixes.empty:
+        raise ValueError("empty prefix table")
+    if prefixes.isna().any().any():
+        raise ValueError("prefix table with missing prefixes or countries")
+    invalid = prefixes['QTH'][~prefixes['QTH'].str.fullmatch(r'[A-Z0-9]+(/[A-Za-z0-9]+)?')]
+    if len(invalid):
+        raise ValueError(f"invalid prefixes: {', '.join(invalid[:10])}")
+    if current_table is not None and len(prefixes) < prefix_table_min_ratio * len(current_table['prefixes']):
+        raise ValueError(f"prefix table shrank from {len(current_table['prefixes'])} to {len(prefixes)} prefixes")
+
+# Funzione che confronta due tabelle dei prefissi: prefissi aggiunti, rimossi e
+# prefissi il cui Country e' cambiato
+def diff_prefix_tables(old_table, new_table):
+    old_countries = dict(zip(old_table['prefixes']['QTH'], old_table['prefixes']['Country']))
+    new_countries = dict(zip(new_table['prefixes']['QTH'], new_table['prefixes']['Country']))
+    return {
+        'old_version': old_table['version'],
+        'new_version': new_table['version'],
+        'added': {prefix: new_countries[prefix] for prefix in sorted(new_countries.keys() - old_countries.keys())},
+        'removed': {prefix: old_countries[prefix] for prefix in sorted(old_countries.keys() - new_countries.keys())},
+        'changed': {
+            prefix: [old_countries[prefix], new_countries[prefix]]
+            for prefix in sorted(old_countries.keys() & new_countries.keys())
+            if old_countries[prefix] != new_countries[prefix]
+        }
+    }
+
+# Funzione che salva la tabella dei prefissi nella cache, sostituendo il file in modo atomico
+def write_prefix_table(table):
+    os.makedirs(dataset_cache_dir, exist_ok=True)
+    prefixes = table['prefixes'].rename(columns={'QTH': 'PREFIX', 'Country': 'COUNTRY'})
+    cache = {
+        'version': table['version'],
+        'source': table['source'],
+        'fetched': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'prefixes': prefixes.to_dict(orient='records')
+    }
+    tmp_path = f"{prefix_table_path()}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as cache_file:
+        json.dump(cache, cache_file)
+    os.replace(tmp_path, prefix_table_path())
+
+# Funzione che legge la tabella dei prefissi dalla cache. Restituisce None se la
+# cache manca, non e' valida o non corrisponde alla sua versione
+def read_prefix_table():
+    try:
+        mtime = os.stat(prefix_table_path()).st_mtime_ns
+        with open(prefix_table_path()) as cache_file:
+            cache = json.load(cache_file)
+        table = build_prefix_table(pd.DataFrame(cache['prefixes'], columns=['PREFIX', 'COUNTRY']), cache['source'])
+        validate_prefix_table(table)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if table['version'] != cache['version']:
+        return None
+    table['mtime'] = mtime
+    return table
+
+# Funzione che carica la tabella dei prefissi all'avvio: dalla cache o dal CSV incluso
+def load_prefix_table():
+    table = read_prefix_table()
+    if table is None:
+        table = build_prefix_table(pd.read_csv(prefix_data_path, sep = ";"), prefix_data_path)
+    return table
+
+# Funzione che scarica la geolist e la converte nelle colonne PREFIX e COUNTRY.
+# Sono accettati JSON (lista di oggetti, anche dentro un oggetto) e CSV con ';'
+def fetch_geolist(url):
+    with urllib.request.urlopen(url, timeout=geolist_timeout) as response:
+        body = response.read().decode('utf-8')
+    if body.lstrip()[:1] in ('[', '{'):
+        records = json.loads(body)
+        if isinstance(records, dict):
+            records = next((value for value in records.values() if isinstance(value, list)), [])
+        geolist_df = pd.DataFrame(records)
+    else:
+        geolist_df = pd.read_csv(io.StringIO(body), sep = ";", dtype=str)
+    fields = {str(col).lower(): col for col in geolist_df.columns}
+    for field in [geolist_prefix_field, geolist_country_field]:
+        if field.lower() not in fields:
+            raise ValueError(f"{url}: missing field '{field}'")
+    geolist_df = geolist_df.rename(columns={
+        fields[geolist_prefix_field.lower()]: 'PREFIX',
+        fields[geolist_country_field.lower()]: 'COUNTRY'
+    })
+    return geolist_df[['PREFIX', 'COUNTRY']].astype(str).apply(lambda col: col.str.strip())
+
+# Funzione che aggiorna la cache della tabella dei prefissi dalla geolist e restituisce
+# le differenze con la tabella corrente. La cache viene scritta solo se la nuova
+# tabella e' valida e diversa: i worker la applicano al prossimo controllo
+def refresh_prefix_table(url=None):
+    url = url or geolist_url
+    new_table = build_prefix_table(fetch_geolist(url), url)
+    validate_prefix_table(new_table, prefix_table)
+    diff = diff_prefix_tables(prefix_table, new_table)
+    if new_table['version'] != prefix_table['version']:
+        write_prefix_table(new_table)
+    return diff
+
+prefix_table = load_prefix_table()
+
+# Array che definisce le bande del contest
+bands = ['160M', '80M', '40M', '20M', '15M', '10M']
+
+# Colonne a bassa cardinalita' salvate come categoriche (codici + valori distinti),
+# colonne di conteggi salvate con il tipo intero piu' piccolo che contiene i valori
+# (int16 per bande e WPX, int32 per il punteggio) e ore salvate come float32
+categorical_columns = ['QTH', 'Country', 'country_code', 'Category', 'Club', 'Contest',
+                       'Club Status', 'Supercategory', 'Power', 'Band', 'Overlay']
+integer_columns = ['Year', 'Score', 'QSOs', 'WPX'] + bands
+float32_columns = ['Hours']
+
+# Funzione che assegna i tipi compatti alle colonne del dataset arricchito
+def apply_column_types(df):
+    df = df.copy()
+    for col in categorical_columns:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in integer_columns:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col].astype('int64'), downcast='integer')
+    for col in float32_columns:
+        if col in df.columns:
+            # Le ore non dichiarate ('-') diventano NaN
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype('float32')
+    return df
+
+# Dimensioni derivate calcolate una sola volta durante l'arricchimento, come colonne
+# categoriche: stato di club, supercategoria (SINGLE-OP, ASSISTED, MULTI-TWO...),
+# potenza (HIGH/LOW/QRP), banda (ALL, 10M...) e tag overlay ((T), (R), (C), (Y))
+derived_columns = ['Club Status', 'Supercategory', 'Power', 'Band', 'Overlay']
+
+# Funzione che applica un parser vettoriale ai soli valori distinti di una colonna
+# categorica e restituisce il risultato come colonna categorica, riusando i codici
+def map_categories(column, parse):
+    parsed = pd.Categorical(parse(column.cat.categories.to_series(index=None)))
+    # Il codice -1 (valore mancante) resta -1
+    parsed_codes = np.append(parsed.codes, -1)
+    derived_codes = parsed_codes[column.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(derived_codes, parsed.categories), index=column.index)
+
+# Funzione che distingue i membri di un club da quelli che non lo sono
+def parse_club_status(clubs):
+    return np.where(clubs == 'NO CLUB', 'No Club Member', 'Club Member')
+
+# Funzioni che estraggono le parti di una categoria ('SINGLE-OP LOW 20M (T)')
+def parse_supercategory(categories):
+    return categories.str.split(' ').str[0].replace({'YELLOW': 'YELLOW CARD'})
+
+def parse_power(categories):
+    return categories.str.extract(r' (HIGH|LOW|QRP)\b', expand=False)
+
+def parse_band(categories):
+    return categories.str.extract(r' (ALL|\d+M)\b', expand=False)
+
+def parse_overlay(categories):
+    return categories.str.extract(r'\(([A-Z])\)', expand=False)
+
+# Dimensioni derivate dalla categoria e relativi parser
+category_parsers = {
+    'Supercategory': parse_supercategory,
+    'Power': parse_power,
+    'Band': parse_band,
+    'Overlay': parse_overlay
+}
+
+# Funzione che aggiunge al dataset le dimensioni derivate
+def add_derived_columns(df):
+    df['Club Status'] = map_categories(df['Club'], parse_club_status)
+    for dimension, parse in category_parsers.items():
+        df[dimension] = map_categories(df['Category'], parse)
+    return df
+
+# Risoluzione del Country dal nominativo: ricerca del prefisso piu' lungo della tabella
+# dei prefissi che inizia il nominativo (prima i prefissi di 6 caratteri, poi 5...),
+# in modo vettoriale per ogni lunghezza
+
+# Suffissi portatili che non cambiano l'entita' del nominativo (CALL/P, CALL/QRP, CALL/4)
+portable_suffixes = ['P', 'M', 'A', 'QRP', 'QRPP', 'LH'] + [str(digit) for digit in range(10)]
+# Suffissi delle stazioni mobili marittime e aeronautiche, che non hanno un'entita'
+mobile_suffixes = ['MM', 'AM']
+
+# Funzione che restituisce la parte di ogni nominativo da cui si ricava l'entita':
+# senza suffissi portatili, il designatore piu' corto tra le parti separate da '/'
+# (5B/AJ2O -> 5B, JI2MED/UK -> UK). I mobili marittimi e aeronautici restano vuoti
+def callsign_designators(calls):
+    if len(calls) == 0:
+        return pd.Series([], dtype=str)
+    parts = pd.Series(calls, dtype=str).str.upper().str.strip().str.split('/', expand=True).fillna('')
+    is_mobile = parts.isin(mobile_suffixes).any(axis=1).to_numpy()
+    # Il primo elemento e' sempre un nominativo o un prefisso, anche se corto
+    parts.iloc[:, 1:] = parts.iloc[:, 1:].mask(parts.iloc[:, 1:].isin(portable_suffixes), '')
+    lengths = parts.apply(lambda part: part.str.len()).to_numpy()
+    lengths = np.where(lengths > 0, lengths, np.iinfo(np.int64).max)
+    designators = parts.to_numpy()[np.arange(len(parts)), lengths.argmin(axis=1)]
+    return pd.Series(np.where(is_mobile, '', designators), dtype=str)
+
+# Funzione che restituisce, per ogni nominativo, la posizione nella tabella del prefisso
+# piu' lungo che lo inizia (-1 se nessun prefisso corrisponde)
+def match_callsign_prefixes(calls, table=None):
+    table = table or prefix_table
+    designators = callsign_designators(calls)
+    matched = np.full(len(designators), -1)
+    for length in range(table['max_length'], 0, -1):
+        pending = np.flatnonzero(matched < 0)
+        if len(pending) == 0:
+            break
+        matched[pending] = table['index'].get_indexer(designators.iloc[pending].str[:length])
+    return matched
+
+# Numero massimo di nominativi non risolti riportati nel log
+unresolved_samples = 10
+
+# Funzione che assegna il Country ad ogni riga: dal QTH quando e' nella tabella dei
+# prefissi, altrimenti dal prefisso piu' lungo del nominativo. Le righe che restano
+# senza Country vengono segnalate
+def resolve_countries(score_df, table=None):
+    table = table or prefix_table
+    matched = table['index'].get_indexer(score_df['QTH'])
+    unmatched = np.flatnonzero(matched < 0)
+    if len(unmatched):
+        matched[unmatched] = match_callsign_prefixes(score_df['Call'].iloc[unmatched], table)
+
+    unresolved_calls = score_df['Call'].iloc[np.flatnonzero(matched < 0)]
+    if len(unresolved_calls):
+        # Solo un campione dei nominativi, per non riempire il log ad ogni caricamento
+        samples = sorted(unresolved_calls.unique())
+        more = f' (+{len(samples) - unresolved_samples} more)' if len(samples) > unresolved_samples else ''
+        logger.warning("Country not resolved for %d rows: %s%s", len(unresolved_calls), ', '.join(samples[:unresolved_samples]), more)
+    return np.where(matched >= 0, table['countries'][matched], None)
+
+def create_dataset_to_work(score_df):
+    # Il Country viene ricavato dal QTH (prefisso) o dal nominativo
+    first_merged_df = score_df.assign(Country=resolve_countries(score_df))
+    second_merged_df = pd.merge(first_merged_df, country_codes_df, on = 'Country', how='left')
+    # Selezione dell'ordine delle colonne
+    column_order = ['Call', 'QTH', 'Country', 'country_code'] + [col for col in score_df if col not in ['Call', 'QTH', 'Country']]
+    # Vengono riordinate le colonne nel dataframe risultante
+    merged_df = second_merged_df[column_order]
+    return(add_derived_columns(apply_column_types(merged_df)))
+
+
+# Funzione che calcola l'hash del contenuto dei dati da cui dipende un dataset arricchito:
+# il CSV del contest, la versione della tabella dei prefissi e i codici dei Country
+def compute_source_hash(csv_path, table=None):
+    table = table or prefix_table
+    source_hash = hashlib.sha256(f"format-{dataset_cache_format}-prefixes-{table['version']}".encode())
+    for path in [csv_path, country_codes_data_path]:
+        with open(path, 'rb') as source_file:
+            source_hash.update(source_file.read())
+    return source_hash.hexdigest()[:16]
+
+# Funzione che salva un dataset arricchito nella cache: un file .npy per colonna
+# (codici per le colonne categoriche) e un manifest JSON con hash, tipi, categorie e
+# primo e ultimo anno. Il manifest viene sostituito per ultimo, in modo atomico
+def write_dataset_cache(name, source_hash, df):
+    os.makedirs(dataset_cache_dir, exist_ok=True)
+    manifest = {'source_hash': source_hash, 'columns': []}
+    if 'Year' in df.columns and len(df):
+        manifest['years'] = [int(df['Year'].min()), int(df['Year'].max())]
+    for col in df.columns:
+        column_file = f"{name}-{source_hash}-{col}.npy"
+        column = {'name': col, 'file': column_file}
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            column['categories'] = df[col].cat.categories.tolist()
+            column['kind'] = 'category'
+            values = df[col].cat.codes.to_numpy()
+        elif pd.api.types.is_numeric_dtype(df[col]):
+            column['kind'] = 'numeric'
+            values = df[col].to_numpy()
+        else:
+            # Colonne di testo ad alta cardinalita' (Call): codici + valori distinti
+            codes, uniques = pd.factorize(df[col], use_na_sentinel=False)
+            column['categories'] = uniques.tolist()
+            column['kind'] = 'string'
+            values = codes.astype('int32')
+        tmp_path = os.path.join(dataset_cache_dir, f"{column_file}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as column_handle:
+            np.save(column_handle, values)
+        os.replace(tmp_path, os.path.join(dataset_cache_dir, column_file))
+        manifest['columns'].append(column)
+
+    tmp_manifest = os.path.join(dataset_cache_dir, f"{name}.json.{os.getpid()}.tmp")
+    with open(tmp_manifest, 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(tmp_manifest, os.path.join(dataset_cache_dir, f"{name}.json"))
+    # Un worker che non ha ancora applicato la nuova tabella dei prefissi scrive una
+    # versione precedente: i file della versione nuova non devono essere eliminati
+    if is_prefix_table_current():
+        prune_dataset_cache(name, source_hash)
+
+# Funzione che indica se la tabella dei prefissi in uso e' l'ultima salvata nella cache
+def is_prefix_table_current():
+    try:
+        mtime = os.stat(prefix_table_path()).st_mtime_ns
+    except OSError:
+        return prefix_table.get('mtime') is None
+    return mtime == prefix_table.get('mtime')
+
+# Funzione che elimina i file delle colonne delle versioni precedenti di un dataset:
+# il manifest indica solo l'ultima versione, quindi le altre non verrebbero piu' lette
+def prune_dataset_cache(name, source_hash):
+    for file_name in os.listdir(dataset_cache_dir):
+        file_hash = file_name[len(name) + 1:].split('-')[0]
+        if file_name.startswith(f"{name}-") and file_name.endswith('.npy') and file_hash != source_hash:
+            try:
+                os.remove(os.path.join(dataset_cache_dir, file_name))
+            except OSError:
+                pass
+
+# Funzione che legge il manifest della cache di un dataset (None se manca o non e' valido)
+def read_dataset_manifest(name):
+    try:
+        with open(os.path.join(dataset_cache_dir, f"{name}.json")) as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+
+# Funzione che legge un dataset arricchito dalla cache (mappando i file in memoria).
+# Restituisce None se la cache manca o se i CSV sono cambiati
+def read_dataset_cache(name, source_hash):
+    manifest = read_dataset_manifest(name)
+    try:
+        if manifest is None or manifest['source_hash'] != source_hash:
+            return None
+        data = {}
+        for column in manifest['columns']:
+            values = np.load(os.path.join(dataset_cache_dir, column['file']), mmap_mode='r')
+            if column['kind'] == 'category':
+                data[column['name']] = pd.Categorical.from_codes(values, categories=column['categories'])
+            elif column['kind'] == 'string':
+                data[column['name']] = pd.Series(column['categories'], dtype=object).take(values).to_numpy()
+            else:
+                data[column['name']] = values
+        return pd.DataFrame(data, copy=False)
+    except (OSError, ValueError, KeyError):
+        return None
+
+# Funzione che carica un dataset arricchito dalla cache, ricostruendolo dal CSV
+# (e aggiornando la cache) quando la cache manca o non corrisponde ai CSV
+def load_dataset_to_work(name, csv_path, rebuild=False):
+    source_hash = compute_source_hash(csv_path)
+    dataset = None if rebuild else read_dataset_cache(name, source_hash)
+    if dataset is None:
+        dataset = create_dataset_to_work(pd.read_csv(csv_path, sep = ";"))
+        try:
+            write_dataset_cache(name, source_hash, dataset)
+        except OSError:
+            # Cache non scrivibile: si continua con i dati letti dal CSV
+            pass
+    return dataset
+
+# Funzione che carica il dataset di un contest, con la colonna della tipologia di contest
+def load_contest_dataset(name, csv_path):
+    dataset = load_dataset_to_work(name, csv_path)
+    dataset['Contest'] = pd.Series(name.upper(), index=dataset.index, dtype='category')
+    return dataset
+
+
+# Registro dei dataset lato server: nei dcc.Store viene salvata solo una chiave
+# ("cw", "ssb", "ssb_cw" piu' un hash di versione) e le callback la risolvono
+# nel DataFrame in memoria, invece di far viaggiare l'intero dataset in JSON.
+# I dataset vengono caricati solo al primo utilizzo (dataset_loaders), mentre SSB+CW
+# e' una vista sui due dataset dei contest (dataset_views), senza una copia concatenata
+dataset_registry = {}
+dataset_loaders = {}
+dataset_views = {}
+dataset_lock = threading.Lock()
+
+# Funzione che calcola l'hash di versione di un dataset (stabile tra i worker)
+def dataset_version(df):
+    row_hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return format(int(row_hashes.sum()) & 0xFFFFFFFF, '08x')
+
+# Funzione che registra un dataset e restituisce la sua chiave. Le versioni
+# ottenute aggiungendo un log passano la propria versione, derivata da quella precedente
+def register_dataset(name, df, version=None):
+    dataset_key = f"{name}-{version or dataset_version(df)}"
+    dataset_registry[dataset_key] = df
+    return dataset_key
+
+# Funzione che registra il dataset di un contest senza caricarlo: la versione
+# deriva dall'hash dei CSV, quindi non serve leggere i dati
+def register_dataset_loader(name, csv_path, source_hash=None):
+    dataset_key = f"{name}-{(source_hash or compute_source_hash(csv_path))[:8]}"
+    dataset_loaders[dataset_key] = functools.partial(load_contest_dataset, name, csv_path)
+    return dataset_key
+
+# Funzione che registra una vista sull'unione di piu' dataset
+def register_dataset_view(name, part_keys):
+    version = hashlib.sha256('+'.join(part_keys).encode()).hexdigest()[:8]
+    dataset_key = f"{name}-{version}"
+    dataset_views[dataset_key] = list(part_keys)
+    return dataset_key
+
+# Funzione che indica se una chiave corrisponde ad un dataset o ad una vista registrati
+def is_registered_dataset(dataset_key):
+    return dataset_key in dataset_registry or dataset_key in dataset_loaders or dataset_key in dataset_views
+
+# Funzione che indica se una chiave ha la forma di una chiave di dataset ("cw-1a94fddd")
+def is_dataset_key(dataset_key):
+    name, _, version = str(dataset_key).rpartition('-')
+    return name in dataset_versions and len(version) == 8 and all(char in '0123456789abcdef' for char in version)
+
+# Funzione che controlla i log quando arriva una chiave sconosciuta, che puo' venire
+# da un worker che ha gia' applicato un nuovo log. Il controllo rispetta l'intervallo
+# normale e le chiavi senza la forma di una chiave di dataset vengono ignorate
+def refresh_for_unknown_key(dataset_key):
+    if not is_registered_dataset(dataset_key) and is_dataset_key(dataset_key):
+        refresh_ingested_logs()
+
+# Funzione che restituisce il dataset associato ad una chiave, caricandolo al primo utilizzo
+def get_dataset(dataset_key):
+    refresh_for_unknown_key(dataset_key)
+    if dataset_key not in dataset_registry:
+        with dataset_lock:
+            if dataset_key not in dataset_registry and dataset_key in dataset_loaders:
+                dataset_registry[dataset_key] = dataset_loaders[dataset_key]()
+                del dataset_loaders[dataset_key]
+    if dataset_key not in dataset_registry:
+        raise PreventUpdate
+    return dataset_registry[dataset_key]
+
+# Funzione che restituisce le chiavi dei dataset che compongono una chiave
+# (i due contest per una vista, la chiave stessa per un dataset)
+def get_dataset_part_keys(dataset_key):
+    refresh_for_unknown_key(dataset_key)
+    return dataset_views.get(dataset_key, [dataset_key])
+
+# CSV dei dataset dei contest
+contest_csv_paths = {'cw': cw_data_path, 'ssb': ssb_data_path}
+
+# Chiavi delle versioni correnti dei dataset: il dizionario non viene mai modificato,
+# ma sostituito per intero quando viene applicato un nuovo log o una nuova tabella dei prefissi
+current_dataset_keys = {name: register_dataset_loader(name, csv_path) for name, csv_path in contest_csv_paths.items()}
+current_dataset_keys['ssb_cw'] = register_dataset_view('ssb_cw', [current_dataset_keys['cw'], current_dataset_keys['ssb']])
+
+# Funzione che restituisce l'occupazione di memoria di un dataset, colonna per colonna.
+# Una vista non occupa memoria propria: viene riportata la somma dei suoi dataset
+def dataset_memory_report(dataset_key):
+    part_keys = get_dataset_part_keys(dataset_key)
+    if part_keys != [dataset_key]:
+        parts = [dataset_memory_report(part_key) for part_key in part_keys]
+        return {
+            'dataset': dataset_key,
+            'rows': sum(part['rows'] for part in parts),
+            'bytes': sum(part['bytes'] for part in parts),
+            'parts': parts
+        }
+    df = get_dataset(dataset_key)
+    usage = df.memory_usage(deep=True, index=False)
+    return {
+        'dataset': dataset_key,
+        'rows': len(df),
+        'bytes': int(usage.sum()),
+        'columns': {col: {'dtype': str(df[col].dtype), 'bytes': int(usage[col])} for col in df.columns}
+    }
+
+# Funzione che restituisce i nominativi di un dataset a cui non e' stato assegnato un
+# Country (ne' dal QTH ne' dal nominativo), con il loro QTH e il numero di righe
+def unresolved_countries(dataset_key):
+    df = get_dataset(dataset_key)
+    unresolved = df.loc[df['Country'].isna(), ['Call', 'QTH']].astype(object)
+    counts = unresolved.value_counts(dropna=False).rename('rows').reset_index()
+    return counts.sort_values(['rows', 'Call'], ascending=[False, True], kind='stable').to_dict('records')
+
+
+# Scala di colori personalizzata per la mappa
+custom_colorscale = [
+    [0.0, '#7d28c3'],  # Viola intenso
+    [0.1, '#5030c3'],  # Blu-viola
+    [0.2, '#2860c3'],  # Blu intenso
+    [0.3, '#2890c3'],  # Blu chiaro
+    [0.4, '#37c357'],  # Verde
+    [0.5, '#91c337'],  # Verde-giallo
+    [0.6, '#f5e056'],  # Giallo
+    [0.7, '#f5ae56'],  # Arancione chiaro
+    [0.8, '#f57542'],  # Arancione
+    [0.9, '#f34544'],  # Rosso-arancione
+    [1.0, '#d22b2b']   # Rosso intenso
+]
+
+# Riscalamento degli assi:
+buffer_percentage = 0.05
+
+# Funzione per ottenere i 'confini' dei continenti
+def get_continent_bounds(continent):
+    bounds = {
+        'World': {'lon': [-180, 180], 'lat': [-90, 90]},
+        'Europe': {'lon': [-30, 60], 'lat': [30, 75]},
+        'North America': {'lon': [-170, -50], 'lat': [5, 85]},
+        'Asia': {'lon': [30, 160], 'lat': [-10, 85]},
+        'Africa': {'lon': [-30, 60], 'lat': [-40, 40]},
+        'South America': {'lon': [-90, -30], 'lat': [-60, 15]},
+        'Oceania': {'lon': [85, 240], 'lat': [-50, 20]}
+    }
+    return bounds.get(continent, bounds['World'])
+
+# Cubo di aggregati precalcolato per ogni dataset: una riga per ogni combinazione
+# di (Contest, Year, Country, Category, Club Status) con numero di valori non nulli,
+# somma e massimo di ogni metrica. Pagine e callback leggono le medie da qui.
+# Le dimensioni derivate dalla categoria non aggiungono righe al cubo
+cube_dimensions = ['Contest', 'Year', 'Country', 'country_code', 'Category', 'Club Status',
+                   'Supercategory', 'Power', 'Band', 'Overlay']
+cube_metrics = ['QSOs', 'WPX', 'Score', 'Hours'] + bands
+
+aggregate_cubes = {}
+cube_rollups = {}
+
+# Funzione che costruisce il cubo di aggregati di un dataset
+def build_aggregate_cube(df):
+    cube_df = df[cube_dimensions + cube_metrics].copy()
+    # Le somme delle ore vengono calcolate in doppia precisione
+    cube_df['Hours'] = cube_df['Hours'].astype('float64')
+
+    grouped = cube_df.groupby(cube_dimensions, dropna=False, sort=False, observed=True)
+    cube = grouped[cube_metrics].agg(['count', 'sum', 'max'])
+    cube.columns = [f"{metric}_{stat}" for metric, stat in cube.columns]
+    cube['Entries'] = grouped.size()
+    return cube.reset_index()
+
+# Funzione che restituisce il cubo di un dataset, calcolandolo al primo utilizzo.
+# Il cubo di una vista e' l'unione dei cubi dei dataset (il Contest li separa)
+def get_aggregate_cube(dataset_key):
+    if dataset_key not in aggregate_cubes:
+        load_precomputed(dataset_key)
+    if dataset_key not in aggregate_cubes:
+        part_keys = get_dataset_part_keys(dataset_key)
+        if part_keys == [dataset_key]:
+            aggregate_cubes[dataset_key] = build_aggregate_cube(get_dataset(dataset_key))
+        else:
+            part_cubes = [get_aggregate_cube(part_key) for part_key in part_keys]
+            aggregate_cubes[dataset_key] = pd.concat(part_cubes, ignore_index=True)
+    return aggregate_cubes[dataset_key]
+
+# Funzione che riaggrega righe del cubo (o di suoi rollup) sulle dimensioni richieste:
+# i conteggi e le somme si sommano, i massimi si combinano con il massimo
+def aggregate_cube_stats(cube, by, sort=True):
+    stat_columns = [col for col in cube.columns if col not in cube_dimensions]
+    aggregations = {col: ('max' if col.endswith('_max') else 'sum') for col in stat_columns}
+    return cube.groupby(list(by), dropna=False, sort=sort, observed=True).agg(aggregations).reset_index()
+
+# Funzione che applica al cubo dei filtri di uguaglianza
+def filter_cube(cube, filters):
+    for dimension, value in filters.items():
+        cube = cube[cube[dimension] == value]
+    return cube
+
+# Funzione che aggrega il cubo sulle dimensioni richieste, applicando eventuali filtri
+# di uguaglianza ({'Contest': 'CW'}). I risultati vengono memorizzati per dataset
+def rollup_cube(dataset_key, by, filters=None):
+    filters = filters or {}
+    rollup_key = (dataset_key, tuple(by), tuple(sorted(filters.items())))
+    if rollup_key not in cube_rollups:
+        load_precomputed(dataset_key)
+    if rollup_key not in cube_rollups:
+        cube = get_aggregate_cube(dataset_key)
+        cube_rollups[rollup_key] = aggregate_cube_stats(filter_cube(cube, filters), by)
+    return cube_rollups[rollup_key].copy()
+
+# Funzione che calcola la media eliminando i valori nulli
+def calculate_mean(dataset_key, band, filters=None, by=('Year',), decimals=1):
+    return mean_from_rollup(rollup_cube(dataset_key, by, filters), band, by, decimals)
+
+# Funzione che calcola la media di una metrica da un rollup del cubo
+def mean_from_rollup(rollup, band, by=('Year',), decimals=1):
+    rollup = rollup[rollup[f"{band}_count"] > 0]
+
+    mean_by_year = rollup[list(by)].reset_index(drop=True)
+    mean_values = rollup[f"{band}_sum"] / rollup[f"{band}_count"]
+    if decimals is not None:
+        mean_values = mean_values.round(decimals)
+    mean_by_year[band] = mean_values.to_numpy()
+
+    return mean_by_year
+
+# Funzione che calcola in un'unica passata le medie di piu' metriche da un rollup del
+# cubo: una colonna per metrica, NaN dove la metrica non ha valori non nulli
+def means_from_rollup(rollup, by, metrics=cube_metrics, decimals=1):
+    counts = rollup[[f"{metric}_count" for metric in metrics]].to_numpy()
+    sums = rollup[[f"{metric}_sum" for metric in metrics]].to_numpy(dtype='float64')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_values = np.where(counts > 0, sums / counts, np.nan)
+    if decimals is not None:
+        mean_values = mean_values.round(decimals)
+    means = pd.DataFrame(mean_values, columns=metrics)
+    return pd.concat([rollup[list(by)].reset_index(drop=True), means], axis=1)
+
+# Funzione che restituisce le medie per contest e anno di tutte le metriche, da un solo
+# rollup del cubo: in formato largo (una colonna per metrica) e lungo (Contest, Year,
+# Metric, Mean), per i grafici che scelgono la metrica da mostrare
+def calculate_yearly_means(dataset_key, decimals=1):
+    wide_means = means_from_rollup(rollup_cube(dataset_key, ['Contest', 'Year']), ['Contest', 'Year'], decimals=decimals)
+    long_means = wide_means.melt(id_vars=['Contest', 'Year'], var_name='Metric', value_name='Mean')
+    return wide_means, long_means
+
+# Funzione che calcola il punteggio medio di ogni Country
+def calculate_mean_data_for_country(dataset_key, country, y_data):
+    return calculate_mean(dataset_key, y_data, filters={'Country': country})
+
+# Funzione che conta i partecipanti per ogni country_code, in tutti gli anni o
+# nell'intervallo di anni dato
+def calculate_country_counts(dataset_key, filters=None, year_range=None):
+    if year_range is None:
+        return country_counts_from_rollup(rollup_cube(dataset_key, ['country_code'], filters))
+    return country_counts_from_rollup(rollup_year_range(dataset_key, ['country_code'], year_range, filters))
+
+# Funzione che ordina i conteggi dei partecipanti di un rollup per country_code
+def country_counts_from_rollup(country_counts):
+    country_counts = country_counts[country_counts['country_code'].notna()]
+    country_counts = country_counts.sort_values('Entries', ascending=False, kind='stable')
+    country_counts = country_counts[['country_code', 'Entries']].rename(columns={'Entries': 'count'})
+    return country_counts.reset_index(drop=True)
+
+# Funzione che conta i vincitori per ogni country_code
+# (country_code e' categorica: vengono esclusi i codici senza vincitori)
+def calculate_winner_counts(winners_table):
+    winner_counts = winners_table['country_code'].value_counts()
+    winner_counts = winner_counts[winner_counts > 0].reset_index()
+    winner_counts.columns = ['country_code', 'count']
+    return winner_counts
+
+# Funzione che calcola i limiti degli assi del grafico delle bande, con un margine
+def calculate_band_ranges(merged_mean_df):
+    y_values = merged_mean_df[['TotalQSOs'] + bands]
+    y_range = y_values.max().max() - y_values.min().min()
+    x_range = merged_mean_df['Year'].max() - merged_mean_df['Year'].min()
+    return {
+        'x_min': merged_mean_df['Year'].min() - buffer_percentage * x_range,
+        'x_max': merged_mean_df['Year'].max() + buffer_percentage * x_range,
+        'y_min': y_values.min().min() - buffer_percentage * y_range,
+        'y_max': y_values.max().max() + buffer_percentage * y_range
+    }
+
+# Funzione che restituisce le medie annuali per banda (con i QSO totali) di un dataset
+# e i limiti degli assi del loro grafico
+def calculate_band_means(dataset_key):
+    yearly_means, _ = calculate_yearly_means(dataset_key)
+    merged_mean_df = yearly_means[['Year'] + bands + ['QSOs']].rename(columns={'QSOs': 'TotalQSOs'})
+    return merged_mean_df, calculate_band_ranges(merged_mean_df)
+
+# Funzione che restituisce le prime n righe di ogni gruppo secondo una metrica
+# (vincitori per anno, podi, vincitori per categoria o per country), senza
+# ordinare separatamente ogni gruppo
+def top_n_per_group(df, metric='Score', by=('Year',), n=1):
+    grouped_metric = df.groupby(list(by), observed=True)[metric]
+    if n == 1:
+        top_index = grouped_metric.idxmax().dropna()
+    else:
+        top_index = grouped_metric.nlargest(n).index.get_level_values(-1)
+    return df.loc[top_index]
+
+top_entries_cache = {}
+
+# Funzione che restituisce (e memorizza) le prime n righe per gruppo di un dataset.
+# Per una vista si scelgono tra le prime n righe di ogni dataset
+def calculate_top_entries(dataset_key, metric='Score', by=('Year',), n=1):
+    top_key = (dataset_key, metric, tuple(by), n)
+    if top_key not in top_entries_cache:
+        load_precomputed(dataset_key)
+    if top_key not in top_entries_cache:
+        part_keys = get_dataset_part_keys(dataset_key)
+        if part_keys == [dataset_key]:
+            top_entries_cache[top_key] = top_n_per_group(get_dataset(dataset_key), metric, by, n)
+        else:
+            part_tops = [calculate_top_entries(part_key, metric, by, n) for part_key in part_keys]
+            top_entries_cache[top_key] = top_n_per_group(pd.concat(part_tops, ignore_index=True), metric, by, n)
+    return top_entries_cache[top_key]
+
+# Funzione che restituisce il massimo di una metrica nel dataset
+def calculate_max(dataset_key, metric):
+    return get_aggregate_cube(dataset_key)[f"{metric}_max"].max()
+
+# Somme cumulative per anno: per ogni gruppo (country_code, Club Status, ...) i conteggi
+# e le somme del cubo vengono accumulati anno dopo anno, quindi conteggi, somme e medie
+# di un intervallo di anni qualsiasi sono la differenza di due righe (un valore per
+# gruppo), senza rileggere il cubo o le righe del dataset
+year_prefix_sums = {}
+
+# Funzione che costruisce le somme cumulative per anno dei gruppi di un dataset: una
+# matrice (anni + 1) x gruppi per ogni colonna di conteggi o somme del cubo
+def build_year_prefix_sums(dataset_key, by):
+    rollup = rollup_cube(dataset_key, ['Year'] + list(by))
+    stat_columns = [col for col in rollup.columns if col == 'Entries' or col.endswith(('_count', '_sum'))]
+    years, year_positions = np.unique(rollup['Year'].to_numpy(), return_inverse=True)
+    group_ids = rollup.groupby(list(by), dropna=False, sort=True, observed=True).ngroup().to_numpy()
+    first_rows = pd.Series(np.arange(len(rollup))).groupby(group_ids).first().to_numpy()
+
+    cumulative = {}
+    for col in stat_columns:
+        # Riga 0 a zero: gli anni dalla posizione i alla j sono cumulative[j + 1] - cumulative[i]
+        totals = np.zeros((len(years) + 1, len(first_rows)), dtype=rollup[col].dtype)
+        totals[year_positions + 1, group_ids] = rollup[col].to_numpy()
+        cumulative[col] = totals.cumsum(axis=0)
+    return {
+        'years': years,
+        'groups': rollup[list(by)].iloc[first_rows].reset_index(drop=True),
+        'cumulative': cumulative
+    }
+
+# Funzione che restituisce le somme cumulative per anno, calcolandole al primo utilizzo
+def get_year_prefix_sums(dataset_key, by):
+    prefix_key = (dataset_key, tuple(by))
+    if prefix_key not in year_prefix_sums:
+        year_prefix_sums[prefix_key] = build_year_prefix_sums(dataset_key, by)
+    return year_prefix_sums[prefix_key]
+
+# Funzione che restituisce il primo e l'ultimo anno di un dataset
+def get_dataset_years(dataset_key):
+    years = rollup_cube(dataset_key, ['Year'])['Year']
+    return int(years.min()), int(years.max())
+
+# Funzione che restituisce il primo e l'ultimo anno di un dataset senza caricarlo:
+# dagli aggregati in memoria o precalcolati, dal dataset se e' gia' caricato o dal
+# manifest della cache. Restituisce None se nessuna di queste fonti e' disponibile
+def peek_dataset_years(dataset_key):
+    load_precomputed(dataset_key)
+    if dataset_key in aggregate_cubes or (dataset_key, ('Year',), ()) in cube_rollups:
+        return get_dataset_years(dataset_key)
+    part_keys = get_dataset_part_keys(dataset_key)
+    if part_keys != [dataset_key]:
+        part_years = [peek_dataset_years(part_key) for part_key in part_keys]
+        if None in part_years:
+            return None
+        return min(years[0] for years in part_years), max(years[1] for years in part_years)
+    if dataset_key in dataset_registry:
+        years = dataset_registry[dataset_key]['Year']
+        return int(years.min()), int(years.max())
+    name, _, version = dataset_key.rpartition('-')
+    manifest = read_dataset_manifest(name)
+    if manifest is None or 'years' not in manifest or not manifest['source_hash'].startswith(version):
+        return None
+    return tuple(manifest['years'])
+
+# Funzione che aggrega i conteggi e le somme del cubo sulle dimensioni richieste per gli
+# anni dell'intervallo (estremi inclusi), come rollup_cube senza i massimi. I filtri di
+# uguaglianza diventano dimensioni delle somme cumulative e selezionano i gruppi
+def rollup_year_range(dataset_key, by, year_range, filters=None):
+    filters = filters or {}
+    prefix_sums = get_year_prefix_sums(dataset_key, list(filters) + list(by))
+    start = np.searchsorted(prefix_sums['years'], year_range[0], side='left')
+    end = max(np.searchsorted(prefix_sums['years'], year_range[1], side='right'), start)
+
+    groups = prefix_sums['groups']
+    entries = prefix_sums['cumulative']['Entries'][end] - prefix_sums['cumulative']['Entries'][start]
+    selected = entries > 0
+    for dimension, value in filters.items():
+        selected &= (groups[dimension] == value).to_numpy()
+
+    rollup = {dimension: groups[dimension].array[selected] for dimension in by}
+    for col, cumulative in prefix_sums['cumulative'].items():
+        rollup[col] = cumulative[end, selected] - cumulative[start, selected]
+    return pd.DataFrame(rollup)
+
+# Funzione che restituisce le righe di una tabella per anno (vincitori, medie) che
+# cadono nell'intervallo di anni dato
+def filter_year_range(table, year_range):
+    if year_range is None:
+        return table
+    return table[table['Year'].between(year_range[0], year_range[1])]
+
+# Distribuzioni delle ore di attivita', precalcolate come istogrammi per ogni
+# (Contest, Year, Supercategory): le pagine sommano i conteggi dei bin dei gruppi
+# selezionati e il browser riceve solo i conteggi, mai le righe. Per ogni grandezza
+# i limiti dei bin sono fissi (gli istogrammi di anni diversi si sommano) e l'ultimo
+# bin comprende anche i valori oltre l'ultimo limite (ore oltre le 48 del contest)
+hours_distributions = {
+    'Hours': {'edges': np.arange(0, 49, 1), 'label': 'Hours of operation'},
+    'QSO rate': {'edges': np.arange(0, 305, 5), 'label': 'QSOs per hour'},
+    'Score per hour': {'edges': np.round(10 ** np.arange(2, 7.05, 0.1)), 'label': 'Score per hour'}
+}
+# Bin dell'istogramma bidimensionale ore - punteggio (punteggio in scala logaritmica)
+hours_score_edges = {'Hours': np.arange(0, 50, 2), 'Score': np.round(10 ** np.arange(3, 8.75, 0.25))}
+hours_histogram_dimensions = ['Contest', 'Year', 'Supercategory']
+
+hours_histograms = {}
+
+# Funzione che restituisce la posizione del bin di ogni valore (i valori fuori dai
+# limiti finiscono nel primo o nell'ultimo bin)
+def bin_positions(values, edges):
+    return np.clip(np.searchsorted(edges, values, side='right') - 1, 0, len(edges) - 2)
+
+# Funzione che costruisce gli istogrammi delle ore di attivita' di un dataset: per ogni
+# gruppo i conteggi di ore, QSO all'ora e punteggio all'ora, e la matrice ore - punteggio.
+# Le righe senza ore dichiarate sono escluse
+def build_hours_histograms(df):
+    hours = df['Hours'].to_numpy(dtype='float64')
+    valid = hours > 0
+    df = df[valid]
+    hours = hours[valid]
+    group_ids = df.groupby(hours_histogram_dimensions, dropna=False, sort=True, observed=True).ngroup().to_numpy()
+    first_rows = pd.Series(np.arange(len(df))).groupby(group_ids).first().to_numpy()
+    n_groups = len(first_rows)
+
+    values = {
+        'Hours': hours,
+        'QSO rate': df['QSOs'].to_numpy() / hours,
+        'Score per hour': df['Score'].to_numpy() / hours
+    }
+    counts = {}
+    for distribution, spec in hours_distributions.items():
+        n_bins = len(spec['edges']) - 1
+        positions = group_ids * n_bins + bin_positions(values[distribution], spec['edges'])
+        counts[distribution] = np.bincount(positions, minlength=n_groups * n_bins).reshape(n_groups, n_bins)
+
+    n_hours, n_scores = len(hours_score_edges['Hours']) - 1, len(hours_score_edges['Score']) - 1
+    positions = (group_ids * n_hours + bin_positions(hours, hours_score_edges['Hours'])) * n_scores
+    positions += bin_positions(df['Score'].to_numpy(), hours_score_edges['Score'])
+    counts['Hours vs Score'] = np.bincount(positions, minlength=n_groups * n_hours * n_scores).reshape(n_groups, n_hours, n_scores)
+
+    return {
+        'groups': df[hours_histogram_dimensions].iloc[first_rows].reset_index(drop=True),
+        'counts': counts
+    }
+
+# Funzione che unisce gli istogrammi di gruppi diversi (dataset di una vista, anni aggiunti da un log)
+def concat_hours_histograms(histograms):
+    return {
+        'groups': pd.concat([histogram['groups'] for histogram in histograms], ignore_index=True),
+        'counts': {
+            distribution: np.concatenate([histogram['counts'][distribution] for histogram in histograms])
+            for distribution in histograms[0]['counts']
+        }
+    }
+
+# Funzione che restituisce gli istogrammi delle ore di un dataset, calcolandoli al primo
+# utilizzo. Gli istogrammi di una vista sono l'unione di quelli dei dataset
+def get_hours_histograms(dataset_key):
+    if dataset_key not in hours_histograms:
+        load_precomputed(dataset_key)
+    if dataset_key not in hours_histograms:
+        part_keys = get_dataset_part_keys(dataset_key)
+        if part_keys == [dataset_key]:
+            hours_histograms[dataset_key] = build_hours_histograms(get_dataset(dataset_key))
+        else:
+            hours_histograms[dataset_key] = concat_hours_histograms([get_hours_histograms(part_key) for part_key in part_keys])
+    return hours_histograms[dataset_key]
+
+# Funzione che somma gli istogrammi dei gruppi negli anni e nelle sopracategorie
+# selezionati (tutte se nessuna e' selezionata). Con by restituisce i valori della
+# dimensione e un istogramma per ognuno, altrimenti un solo istogramma
+def calculate_hours_histogram(dataset_key, distribution, year_range=None, supercategories=None, by=None):
+    histograms = get_hours_histograms(dataset_key)
+    groups = histograms['groups']
+    selected = np.ones(len(groups), dtype=bool)
+    if year_range is not None:
+        selected &= groups['Year'].between(year_range[0], year_range[1]).to_numpy()
+    if supercategories:
+        selected &= groups['Supercategory'].isin(np.atleast_1d(supercategories)).to_numpy()
+    counts = histograms['counts'][distribution][selected]
+    if by is None:
+        return counts.sum(axis=0)
+
+    codes, values = pd.factorize(groups.loc[selected, by], sort=True)
+    totals = np.zeros((len(values),) + counts.shape[1:], dtype=counts.dtype)
+    np.add.at(totals, codes[codes >= 0], counts[codes >= 0])
+    return values.tolist(), totals
+
+# Punti delle singole stazioni per il grafico Score - QSOs - WPX (assi logaritmici):
+# per ogni vista del grafico vengono inviati al browser al massimo
+# entry_scatter_max_points punti. Se nella finestra ci sono piu' punti, la finestra
+# viene divisa in una griglia e da ogni cella viene preso lo stesso numero massimo di
+# punti: le celle poco dense (stazioni fuori dal gruppo) restano complete, quelle dense
+# vengono campionate. Zoomando la finestra si restringe fino a mostrare i punti esatti
+entry_scatter_max_points = 3000
+entry_scatter_grid_size = 50
+entry_points = {}
+
+# Funzione che prepara i punti di un dataset: coordinate logaritmiche, valori mostrati
+# e un ordine casuale (fisso) con cui si scelgono i punti delle celle dense, in modo
+# che zoomando i punti gia' mostrati restino visibili. Punteggi e QSO nulli sono esclusi
+def build_entry_points(df):
+    df = df[(df['Score'] > 0) & (df['QSOs'] > 0)]
+    return {
+        'x': np.log10(df['QSOs'].to_numpy(dtype='float64')),
+        'y': np.log10(df['Score'].to_numpy(dtype='float64')),
+        'QSOs': df['QSOs'].to_numpy(),
+        'Score': df['Score'].to_numpy(),
+        'WPX': df['WPX'].to_numpy(),
+        # Etichetta breve ('K3LR CW 2015'): e' la parte piu' pesante della figura
+        'label': (df['Call'].astype(str) + ' ' + df['Contest'].astype(str) + ' ' + df['Year'].astype(str)).to_numpy(dtype=object),
+        'rank': np.random.default_rng(0).permutation(len(df))
+    }
+
+# Funzione che restituisce i punti di un dataset (o di una vista), preparandoli al primo utilizzo
+def get_entry_points(dataset_key):
+    if dataset_key not in entry_points:
+        part_keys = get_dataset_part_keys(dataset_key)
+        df = pd.concat([get_dataset(part_key) for part_key in part_keys], ignore_index=True)
+        entry_points[dataset_key] = build_entry_points(df)
+    return entry_points[dataset_key]
+
+# Funzione che restituisce l'estensione (log10) di tutti i punti: x_min, x_max, y_min, y_max
+def get_entry_extent(dataset_key):
+    points = get_entry_points(dataset_key)
+    return points['x'].min(), points['x'].max(), points['y'].min(), points['y'].max()
+
+# Funzione che sceglie i punti da mostrare in una finestra (x_min, x_max, y_min, y_max
+# in log10): tutti se sono al massimo entry_scatter_max_points, altrimenti lo stesso
+# numero massimo di punti per ogni cella della griglia. Restituisce le posizioni dei
+# punti scelti e il numero di punti nella finestra
+def select_entry_points(dataset_key, window):
+    points = get_entry_points(dataset_key)
+    x_min, x_max, y_min, y_max = window
+    in_window = np.flatnonzero((points['x'] >= x_min) & (points['x'] <= x_max) &
+                               (points['y'] >= y_min) & (points['y'] <= y_max))
+    if len(in_window) <= entry_scatter_max_points:
+        return in_window, len(in_window)
+
+    grid = entry_scatter_grid_size
+    cell_x = ((points['x'][in_window] - x_min) / max(x_max - x_min, 1e-9) * grid).astype(int).clip(0, grid - 1)
+    cell_y = ((points['y'][in_window] - y_min) / max(y_max - y_min, 1e-9) * grid).astype(int).clip(0, grid - 1)
+    cells = cell_x * grid + cell_y
+
+    # Punti ordinati per cella e, nella cella, secondo l'ordine casuale
+    order = np.lexsort((points['rank'][in_window], cells))
+    sorted_cells = cells[order]
+    position_in_cell = np.arange(len(order)) - np.searchsorted(sorted_cells, sorted_cells, side='left')
+
+    # Numero massimo di punti per cella: il piu' grande che non supera il limite
+    cell_counts = np.bincount(cells, minlength=grid * grid)
+    low, high = 1, int(cell_counts.max())
+    while low < high:
+        quota = (low + high + 1) // 2
+        if np.minimum(cell_counts, quota).sum() <= entry_scatter_max_points:
+            low = quota
+        else:
+            high = quota - 1
+    return in_window[order[position_in_cell < low]], len(in_window)
+
+# Funzione che restituisce le etichette dei bin ('0-5', '1.3k-1.6k', ..., '300+'). Se il
+# primo limite non e' zero, il primo bin comprende anche i valori minori ('<126')
+def format_bin_labels(edges):
+    def format_edge(value):
+        for threshold, suffix in [(1e6, 'M'), (1e3, 'k')]:
+            if value >= threshold:
+                return f"{value / threshold:.3g}{suffix}"
+        return f"{value:g}"
+    labels = [f"{format_edge(low)}-{format_edge(high)}" for low, high in zip(edges[:-2], edges[1:-1])]
+    if edges[0] > 0:
+        labels[0] = f"<{format_edge(edges[1])}"
+    return labels + [f"{format_edge(edges[-2])}+"]
+
+
+# Aggregati precalcolati all'avvio (python dashboard.py --precompute): cubo, rollup e
+# vincitori usati dalle pagine vengono calcolati una volta, un processo per ogni dataset
+# dei contest, e salvati in un file per chiave nella cartella della cache. Ogni worker
+# li legge al primo utilizzo di una chiave invece di ricalcolarli
+precomputed_checked = set()
+
+# Funzione che restituisce il file degli aggregati precalcolati di un dataset
+def precomputed_path(dataset_key):
+    return os.path.join(dataset_cache_dir, f"precomputed-{dataset_key}.pkl")
+
+# Funzione che raccoglie gli aggregati gia' calcolati per un dataset
+def collect_precomputed(dataset_key):
+    return {
+        'format': dataset_cache_format,
+        'aggregate_cube': aggregate_cubes[dataset_key],
+        'rollups': {cache_key: rollup for cache_key, rollup in cube_rollups.items() if cache_key[0] == dataset_key},
+        'top_entries': {cache_key: top for cache_key, top in top_entries_cache.items() if cache_key[0] == dataset_key},
+        'hours_histograms': hours_histograms.get(dataset_key)
+    }
+
+# Funzione che salva gli aggregati di un dataset, sostituendo il file in modo atomico
+def write_precomputed(dataset_key, precomputed):
+    os.makedirs(dataset_cache_dir, exist_ok=True)
+    tmp_path = f"{precomputed_path(dataset_key)}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as precomputed_file:
+        pickle.dump(precomputed, precomputed_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, precomputed_path(dataset_key))
+
+# Funzione che carica (una sola volta per chiave) gli aggregati precalcolati di un
+# dataset nelle cache in memoria. Il file manca se il precalcolo non e' stato eseguito
+# o se la chiave e' nuova (log aggiunto dopo l'avvio): gli aggregati vengono calcolati
+def load_precomputed(dataset_key):
+    if dataset_key in precomputed_checked:
+        return
+    precomputed_checked.add(dataset_key)
+    try:
+        with open(precomputed_path(dataset_key), 'rb') as precomputed_file:
+            precomputed = pickle.load(precomputed_file)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return
+    if precomputed.get('format') != dataset_cache_format:
+        return
+    aggregate_cubes.setdefault(dataset_key, precomputed['aggregate_cube'])
+    if precomputed.get('hours_histograms') is not None:
+        hours_histograms.setdefault(dataset_key, precomputed['hours_histograms'])
+    for cache, entries in [(cube_rollups, precomputed['rollups']), (top_entries_cache, precomputed['top_entries'])]:
+        for cache_key, value in entries.items():
+            cache.setdefault(cache_key, value)
+
+
+# Indice dei nominativi: array ordinato dei nominativi distinti, con per ognuno
+# l'intervallo delle righe del dataset (in entrambi i contest) che gli appartengono,
+# piu' un trie dei prefissi in cui ogni nodo conosce l'intervallo dei nominativi
+# che iniziano con quel prefisso (contigui nell'array ordinato)
+callsign_indexes = {}
+
+# Colonne mostrate nello storico di una stazione
+callsign_history_columns = ['Year', 'Contest', 'Category', 'Score', 'QSOs', 'WPX'] + bands + ['Club', 'Country']
+
+# Funzione che costruisce l'indice dei nominativi di un dataset
+def build_callsign_index(df):
+    calls = df['Call'].to_numpy(dtype=str)
+    # Righe ordinate per nominativo, anno e contest: lo storico di una stazione e'
+    # un intervallo contiguo gia' ordinato
+    row_order = np.lexsort((df['Contest'].to_numpy(dtype=str), df['Year'].to_numpy(), calls))
+    unique_calls, starts = np.unique(calls[row_order], return_index=True)
+    ends = np.append(starts[1:], len(calls))
+    history = df[callsign_history_columns].iloc[row_order].reset_index(drop=True)
+
+    trie = {'children': {}, 'range': (0, len(unique_calls))}
+    for position, call in enumerate(unique_calls):
+        node = trie
+        for char in call:
+            child = node['children'].get(char)
+            if child is None:
+                child = {'children': {}, 'range': (position, position + 1)}
+                node['children'][char] = child
+            else:
+                child['range'] = (child['range'][0], position + 1)
+            node = child
+
+    return {
+        'calls': unique_calls,
+        'starts': starts,
+        'ends': ends,
+        'history': history,
+        'trie': trie
+    }
+
+# Funzione che restituisce l'indice dei nominativi, calcolandolo al primo utilizzo
+def get_callsign_index(dataset_key):
+    if dataset_key not in callsign_indexes:
+        index_columns = ['Call'] + callsign_history_columns
+        parts = [get_dataset(part_key)[index_columns] for part_key in get_dataset_part_keys(dataset_key)]
+        callsign_indexes[dataset_key] = build_callsign_index(pd.concat(parts, ignore_index=True))
+    return callsign_indexes[dataset_key]
+
+# Funzione che normalizza un nominativo inserito dall'utente
+def normalize_callsign(callsign):
+    return (callsign or '').strip().upper()
+
+# Funzione che restituisce (al massimo limit) i nominativi che iniziano con il prefisso dato
+def complete_callsign(dataset_key, prefix, limit=10):
+    callsign_index = get_callsign_index(dataset_key)
+    node = callsign_index['trie']
+    for char in normalize_callsign(prefix):
+        node = node['children'].get(char)
+        if node is None:
+            return []
+    start, end = node['range']
+    return callsign_index['calls'][start:min(end, start + limit)].tolist()
+
+# Funzione che restituisce lo storico di una stazione (tutti gli anni, entrambi i contest)
+def get_callsign_history(dataset_key, callsign):
+    callsign_index = get_callsign_index(dataset_key)
+    callsign = normalize_callsign(callsign)
+    position = np.searchsorted(callsign_index['calls'], callsign)
+    if position >= len(callsign_index['calls']) or callsign_index['calls'][position] != callsign:
+        return None
+    start, end = callsign_index['starts'][position], callsign_index['ends'][position]
+    return callsign_index['history'].iloc[start:end]
+
+# Indice delle categorie: le righe di un dataset ordinate per categoria, con per ogni
+# categoria l'intervallo delle sue righe, e la tabella delle dimensioni derivate di
+# ogni categoria. Un filtro su supercategoria, potenza, banda e overlay viene risolto
+# sulla tabella (poche centinaia di categorie) e poi sugli intervalli di righe
+category_indexes = {}
+# Valore usato nei filtri per le categorie senza potenza, banda o overlay
+category_missing_value = 'NONE'
+
+# Funzione che costruisce l'indice delle categorie di un dataset
+def build_category_index(df):
+    categories = df['Category'].cat.categories.to_series(index=None)
+    category_codes = df['Category'].cat.codes.to_numpy()
+    row_order = np.argsort(category_codes, kind='stable')
+    # Le righe della categoria c sono row_order[starts[c]:starts[c + 1]]
+    starts = np.searchsorted(category_codes[row_order], np.arange(len(categories) + 1))
+    category_table = pd.DataFrame({
+        dimension: parse(categories).fillna(category_missing_value).to_numpy()
+        for dimension, parse in category_parsers.items()
+    })
+    category_table['Category'] = categories.to_numpy()
+    return {'row_order': row_order, 'starts': starts, 'categories': category_table}
+
+# Funzione che restituisce l'indice delle categorie, calcolandolo al primo utilizzo
+def get_category_index(dataset_key):
+    if dataset_key not in category_indexes:
+        category_indexes[dataset_key] = build_category_index(get_dataset(dataset_key))
+    return category_indexes[dataset_key]
+
+# Funzione che restituisce i codici delle categorie che soddisfano i filtri
+# ({'Power': ['LOW', 'QRP'], 'Band': ['ALL']}); un filtro vuoto non esclude nulla
+def match_categories(dataset_key, filters):
+    category_table = get_category_index(dataset_key)['categories']
+    matches = np.ones(len(category_table), dtype=bool)
+    for dimension, values in filters.items():
+        if isinstance(values, str):
+            values = [values]
+        if values:
+            matches &= category_table[dimension].isin(values).to_numpy()
+    return np.flatnonzero(matches)
+
+# Funzione che restituisce le righe del dataset delle categorie date
+def select_category_rows(dataset_key, category_codes):
+    category_index = get_category_index(dataset_key)
+    starts = category_index['starts']
+    positions = [category_index['row_order'][starts[code]:starts[code + 1]] for code in category_codes]
+    positions = np.sort(np.concatenate(positions)) if positions else np.array([], dtype=int)
+    return get_dataset(dataset_key).iloc[positions]
+
+# Funzione che restituisce i valori di ogni dimensione presenti nel dataset
+def get_category_options(dataset_key):
+    category_table = get_category_index(dataset_key)['categories']
+    return {dimension: sorted(category_table[dimension].unique()) for dimension in category_parsers}
+
+# Funzione che calcola i dati dei grafici dell'esploratore delle categorie per i
+# filtri dati: medie per banda e conteggi per Country dal cubo (ristretto alle
+# categorie selezionate), vincitori di ogni anno dalle sole righe di quelle categorie
+def explore_categories(dataset_key, filters):
+    category_codes = match_categories(dataset_key, filters)
+    category_names = get_category_index(dataset_key)['categories']['Category'].to_numpy()[category_codes]
+    cube = get_aggregate_cube(dataset_key)
+    cube = cube[cube['Category'].isin(category_names)]
+    yearly = aggregate_cube_stats(cube, ['Year'])
+    entries = int(yearly['Entries'].sum())
+    if entries == 0:
+        return {'entries': 0}
+
+    yearly_means = means_from_rollup(yearly, ['Year'])
+    merged_mean_df = yearly_means[['Year'] + bands + ['QSOs']].rename(columns={'QSOs': 'TotalQSOs'})
+
+    global_ranges = calculate_band_ranges(merged_mean_df)
+
+    winners_table = top_n_per_group(select_category_rows(dataset_key, category_codes), 'Score', ['Year'])
+    winners_table = winners_table.drop(columns=derived_columns)
+    winner_counts = calculate_winner_counts(winners_table)
+    country_counts = country_counts_from_rollup(aggregate_cube_stats(cube, ['country_code']))
+
+    return {
+        'entries': entries,
+        'merged_mean': merged_mean_df.to_dict('records'),
+        'global_ranges': global_ranges,
+        'winners': winners_table.to_dict('records'),
+        'winner_counts': winner_counts.to_dict('records'),
+        'country_counts': country_counts.to_dict('records')
+    }
+
+# Casi ambigui da gestire: codici condivisi da piu' Country (isole, regioni)
+ambiguous_country_codes = {
+    'ITA': 'Italy',
+    'ESP': 'Spain',
+    'USA': 'USA',
+    'FRA': 'France',
+    'GBR': 'England',
+    'NOR': 'Norway'
+}
+
+# Funzione che costruisce l'indice bidirezionale codice <-> Country. Per i codici
+# condivisi vengono preferiti i Country presenti nella tabella dei prefissi
+# (gli unici che possono comparire nei dati), poi le regole dei casi ambigui
+def build_country_index(prefix_df, country_codes_df):
+    country_to_code = dict(zip(country_codes_df['Country'], country_codes_df['country_code']))
+    known_countries = set(prefix_df['Country'])
+
+    code_to_country = {}
+    for country, code in country_to_code.items():
+        if code not in code_to_country or (country in known_countries and code_to_country[code] not in known_countries):
+            code_to_country[code] = country
+    code_to_country.update(ambiguous_country_codes)
+    return code_to_country, country_to_code
+
+code_to_country, country_to_code = build_country_index(prefix_table['prefixes'], country_codes_df)
+
+# Funzione che restituisce il nome del Country dato il codice
+def find_country_from_code(code):
+    return code_to_country.get(code)
+
+# Log dei nuovi anni aggiunti ai dataset senza riavviare i worker (CSV con ';' o JSONL,
+# con le stesse colonne dei CSV originali). Il nome del file inizia con l'istante di
+# arrivo e il contest ("20250601T120000-cw-2025.csv"): tutti i worker li applicano
+# nello stesso ordine e ottengono quindi le stesse chiavi di versione
+ingested_logs_dir = os.path.join(BASE_DIR, "ingested_logs")
+contest_log_columns = ['Call', 'QTH', 'Year', 'Category', 'Score', 'QSOs', 'WPX'] + bands + ['Hours', 'Club']
+# Secondi tra due controlli della cartella dei log
+ingest_poll_interval = 5
+# Numero di versioni mantenute in memoria per ogni dataset (le pagine gia' aperte
+# continuano ad usare la versione precedente)
+dataset_versions_kept = 2
+dataset_versions = {name: [dataset_key] for name, dataset_key in current_dataset_keys.items()}
+ingest_state = {'applied': set(), 'failed': set(), 'last_poll': 0.0, 'prefix_table_mtime': prefix_table.get('mtime')}
+ingest_lock = threading.RLock()
+
+# Funzione che legge il log di un nuovo anno
+def read_contest_log(log_path):
+    if log_path.endswith('.jsonl'):
+        log_df = pd.read_json(log_path, lines=True, dtype={'Call': str, 'QTH': str, 'Category': str, 'Club': str})
+    else:
+        log_df = pd.read_csv(log_path, sep = ";")
+    missing_columns = [col for col in contest_log_columns if col not in log_df.columns]
+    if missing_columns:
+        raise ValueError(f"{log_path}: missing columns {', '.join(missing_columns)}")
+    return log_df[contest_log_columns].copy()
+
+# Funzione che arricchisce solo le righe del log, come create_dataset_to_work
+def enrich_contest_log(log_df, contest):
+    new_rows = create_dataset_to_work(log_df)
+    new_rows['Contest'] = pd.Series(contest.upper(), index=new_rows.index, dtype='category')
+    return new_rows
+
+# Funzione che verifica che gli anni del log non siano gia' presenti nel dataset
+# (i log aggiungono anni nuovi, non correggono quelli esistenti)
+def check_new_years(dataset_key, new_rows):
+    known_years = set(rollup_cube(dataset_key, ['Year'])['Year'])
+    repeated_years = sorted(set(new_rows['Year']) & known_years)
+    if repeated_years:
+        raise ValueError(f"years already loaded: {', '.join(map(str, repeated_years))}")
+
+# Funzione che aggiunge ad un dataset le nuove righe (gia' arricchite) e registra la
+# nuova versione. Cubo, rollup e vincitori gia' calcolati per la versione precedente
+# vengono aggiornati combinandoli con i soli aggregati delle nuove righe
+def append_to_dataset(dataset_key, name, new_rows, log_hash):
+    df = get_dataset(dataset_key)
+    new_rows = new_rows.set_axis(pd.RangeIndex(len(df), len(df) + len(new_rows)))
+    updated = apply_column_types(pd.concat([df, new_rows]))
+    version = hashlib.sha256(f"{dataset_key}-{log_hash}".encode()).hexdigest()[:8]
+    new_key = register_dataset(name, updated, version)
+
+    if dataset_key in aggregate_cubes:
+        new_cube = build_aggregate_cube(new_rows)
+        aggregate_cubes[new_key] = aggregate_cube_stats(
+            pd.concat([aggregate_cubes[dataset_key], new_cube], ignore_index=True), cube_dimensions, sort=False)
+        for (rollup_dataset, by, filters), rollup in list(cube_rollups.items()):
+            if rollup_dataset == dataset_key:
+                new_rollup = aggregate_cube_stats(filter_cube(new_cube, dict(filters)), by)
+                cube_rollups[(new_key, by, filters)] = aggregate_cube_stats(
+                    pd.concat([rollup, new_rollup], ignore_index=True), by)
+
+    # Gli istogrammi delle ore dei nuovi anni si aggiungono a quelli gia' calcolati
+    if dataset_key in hours_histograms:
+        hours_histograms[new_key] = concat_hours_histograms([hours_histograms[dataset_key], build_hours_histograms(new_rows)])
+
+    # I nuovi vincitori sono tra i vecchi vincitori e le nuove righe
+    for (top_dataset, metric, by, n), top_entries in list(top_entries_cache.items()):
+        if top_dataset == dataset_key:
+            candidates = updated.loc[top_entries.index.union(new_rows.index)]
+            top_entries_cache[(new_key, metric, by, n)] = top_n_per_group(candidates, metric, by, n)
+    return new_key
+
+# Funzione che elimina una versione di un dataset e tutti i suoi dati derivati
+def retire_dataset(dataset_key):
+    dataset_registry.pop(dataset_key, None)
+    dataset_loaders.pop(dataset_key, None)
+    dataset_views.pop(dataset_key, None)
+    aggregate_cubes.pop(dataset_key, None)
+    hours_histograms.pop(dataset_key, None)
+    entry_points.pop(dataset_key, None)
+    callsign_indexes.pop(dataset_key, None)
+    category_indexes.pop(dataset_key, None)
+    precomputed_checked.discard(dataset_key)
+    for cache in [cube_rollups, top_entries_cache, year_prefix_sums]:
+        for cache_key in [cache_key for cache_key in cache if cache_key[0] == dataset_key]:
+            del cache[cache_key]
+    # Figure servite dalla route e layout delle pagine costruiti sul dataset
+    with figure_json_lock:
+        for cache_key in [cache_key for cache_key in figure_json_cache if cache_key[1] == dataset_key]:
+            del figure_json_cache[cache_key]
+    for page_key in [page_key for page_key in page_layouts if dataset_key in page_key]:
+        del page_layouts[page_key]
+
+# Funzione che applica un log al dataset del suo contest e aggiorna la vista SSB+CW,
+# restituendo le nuove chiavi (senza pubblicarle)
+def apply_contest_log(dataset_keys, log_path):
+    contest = os.path.basename(log_path).split('-')[1]
+    if contest not in ('cw', 'ssb'):
+        raise ValueError(f"{log_path}: unknown contest '{contest}'")
+    new_rows = enrich_contest_log(read_contest_log(log_path), contest)
+    check_new_years(dataset_keys[contest], new_rows)
+    with open(log_path, 'rb') as log_file:
+        log_hash = hashlib.sha256(log_file.read()).hexdigest()
+
+    dataset_keys = dict(dataset_keys)
+    dataset_keys[contest] = append_to_dataset(dataset_keys[contest], contest, new_rows, log_hash)
+    dataset_keys['ssb_cw'] = register_dataset_view('ssb_cw', [dataset_keys['cw'], dataset_keys['ssb']])
+    return dataset_keys
+
+# Funzione che segna un log non valido con un file .failed contenente l'errore
+def mark_failed_log(log_name, error):
+    logger.warning("Skipping contest log %s: %s", log_name, error)
+    ingest_state['failed'].add(log_name)
+    try:
+        with open(os.path.join(ingested_logs_dir, f"{log_name}.failed"), 'w') as marker_file:
+            marker_file.write(f"{error}\n")
+    except OSError:
+        pass
+
+# Funzione che restituisce la tabella dei prefissi della cache se e' cambiata
+# dall'ultimo controllo (None altrimenti). Si controlla solo la data del file, che
+# viene segnata come vista solo dopo che la nuova tabella e' stata applicata
+def check_prefix_table():
+    try:
+        mtime = os.stat(prefix_table_path()).st_mtime_ns
+    except OSError:
+        return None
+    if mtime == ingest_state['prefix_table_mtime']:
+        return None
+    table = read_prefix_table()
+    if table is None or table['version'] == prefix_table['version']:
+        # Nulla da applicare: il file non viene riletto fino alla prossima modifica
+        if table is None:
+            logger.warning("Ignoring invalid prefix table %s", prefix_table_path())
+        ingest_state['prefix_table_mtime'] = mtime
+        return None
+    return table
+
+# Funzione che aggiorna Country e country_code di un dataset arricchito con la nuova
+# tabella dei prefissi. Le altre colonne (e le dimensioni derivate) restano invariate
+def update_dataset_countries(df, table, country_to_code):
+    countries = pd.Series(resolve_countries(df, table), index=df.index, dtype=object)
+    updated = df.copy()
+    updated['Country'] = countries.astype('category')
+    updated['country_code'] = countries.map(country_to_code).astype('category')
+    return updated
+
+# Funzione che applica una nuova tabella dei prefissi e restituisce le chiavi dei
+# dataset dei contest (senza log) e della vista SSB+CW. I dataset gia' caricati, o
+# presenti nella cache su disco, vengono aggiornati ricalcolando solo i Country.
+# Indici e dataset vengono costruiti prima di toccare lo stato globale: se un passo
+# fallisce resta in uso la tabella precedente
+def apply_prefix_table(table):
+    global prefix_table, code_to_country, country_to_code
+    new_code_to_country, new_country_to_code = build_country_index(table['prefixes'], country_codes_df)
+    source_hashes = {}
+    datasets = {}
+    for name, csv_path in contest_csv_paths.items():
+        old_hash = compute_source_hash(csv_path)
+        source_hashes[name] = compute_source_hash(csv_path, table)
+        old_dataset = dataset_registry.get(f"{name}-{old_hash[:8]}")
+        if old_dataset is None:
+            old_dataset = read_dataset_cache(name, old_hash)
+            if old_dataset is None:
+                continue
+            old_dataset['Contest'] = pd.Series(name.upper(), index=old_dataset.index, dtype='category')
+        datasets[name] = update_dataset_countries(old_dataset, table, new_country_to_code)
+
+    prefix_table, code_to_country, country_to_code = table, new_code_to_country, new_country_to_code
+    dataset_keys = {}
+    for name, csv_path in contest_csv_paths.items():
+        dataset_keys[name] = register_dataset_loader(name, csv_path, source_hashes[name])
+        if name not in datasets:
+            continue
+        try:
+            write_dataset_cache(name, source_hashes[name], datasets[name].drop(columns='Contest'))
+        except OSError:
+            pass
+        dataset_registry[dataset_keys[name]] = datasets[name]
+        dataset_loaders.pop(dataset_keys[name], None)
+    dataset_keys['ssb_cw'] = register_dataset_view('ssb_cw', [dataset_keys['cw'], dataset_keys['ssb']])
+    return dataset_keys
+
+# Funzione che applica i log arrivati dall'ultimo controllo e pubblica le nuove versioni
+# con un solo assegnamento: le richieste in corso continuano con le chiavi precedenti.
+# Una nuova tabella dei prefissi nella cache viene applicata prima dei log, che vengono
+# poi riapplicati tutti alle nuove versioni dei dataset
+def refresh_ingested_logs(force=False):
+    global current_dataset_keys
+    if not force and time.monotonic() - ingest_state['last_poll'] < ingest_poll_interval:
+        return current_dataset_keys
+    with ingest_lock:
+        ingest_state['last_poll'] = time.monotonic()
+        dataset_keys = current_dataset_keys
+        base_keys = {}
+        new_table = check_prefix_table()
+        if new_table is not None:
+            dataset_keys = base_keys = apply_prefix_table(new_table)
+            ingest_state['prefix_table_mtime'] = new_table['mtime']
+            ingest_state['applied'] = set()
+        try:
+            log_names = sorted(os.listdir(ingested_logs_dir))
+        except OSError:
+            log_names = []
+        for log_name in log_names:
+            if log_name in ingest_state['applied'] or log_name.endswith(('.tmp', '.failed')):
+                continue
+            if f"{log_name}.failed" in log_names:
+                ingest_state['failed'].add(log_name)
+                continue
+            try:
+                dataset_keys = apply_contest_log(dataset_keys, os.path.join(ingested_logs_dir, log_name))
+            except ValueError as error:
+                # Log non valido: viene segnato con un file .failed e non viene piu' riprovato
+                mark_failed_log(log_name, error)
+                continue
+            except Exception:
+                # Errore inatteso (o file non leggibile): i log successivi dipendono da
+                # questo, quindi ci si ferma e si riprova al prossimo controllo
+                logger.exception("Contest log %s not applied, retrying at the next poll", log_name)
+                break
+            ingest_state['applied'].add(log_name)
+
+        if dataset_keys is not current_dataset_keys:
+            current_dataset_keys = dataset_keys
+            for name, dataset_key in dataset_keys.items():
+                if dataset_versions[name][-1] == dataset_key:
+                    continue
+                dataset_versions[name].append(dataset_key)
+                for old_key in dataset_versions[name][:-dataset_versions_kept]:
+                    retire_dataset(old_key)
+                del dataset_versions[name][:-dataset_versions_kept]
+            # Le versioni senza log superate dai log riapplicati non vengono pubblicate
+            for name, dataset_key in base_keys.items():
+                if dataset_key not in dataset_versions[name]:
+                    retire_dataset(dataset_key)
+    return current_dataset_keys
+
+# Funzione che copia un log nella cartella dei log, dopo averlo verificato: i worker
+# in esecuzione lo applicano al prossimo controllo
+def ingest_contest_log(contest, log_path):
+    contest = contest.lower()
+    dataset_keys = refresh_ingested_logs(force=True)
+    check_new_years(dataset_keys[contest], enrich_contest_log(read_contest_log(log_path), contest))
+
+    os.makedirs(ingested_logs_dir, exist_ok=True)
+    log_name = f"{time.strftime('%Y%m%dT%H%M%S')}-{contest}-{os.path.basename(log_path)}"
+    tmp_path = os.path.join(ingested_logs_dir, f"{log_name}.{os.getpid()}.tmp")
+    with open(log_path, 'rb') as source_file, open(tmp_path, 'wb') as log_file:
+        log_file.write(source_file.read())
+    os.replace(tmp_path, os.path.join(ingested_logs_dir, log_name))
+    return log_name
+
+# Template personalizzato per il tema chiaro
+pio.templates["plotly_light_soft"] = pio.templates["plotly_white"].update(
+    layout=dict(
+        paper_bgcolor="#b0b5ba",
+        plot_bgcolor="#b0b5ba"
+    )
+)
+
+# Template neutro con cui vengono generate tutte le figure lato server: contiene
+# solo le sequenze di colori comuni ai due temi. Il tema scelto (scuro o chiaro)
+# viene applicato nel browser da una callback clientside
+pio.templates["themeless"] = go.layout.Template(
+    layout=dict(
+        colorway=pio.templates["plotly_dark"].layout.colorway,
+        colorscale=pio.templates["plotly_dark"].layout.colorscale
+    )
+)
+pio.templates.default = "themeless"
+
+# Template inviati una sola volta al browser insieme al layout
+figure_templates = {
+    name: pio.templates[name].to_plotly_json()
+    for name in ['plotly_dark', 'plotly_light_soft']
+}
+
+# Cache delle figure: le callback che generano grafici dipendono solo dai loro
+# input (selezioni, template e dati dei Store, che identificano la versione del
+# dataset). Le figure gia' generate vengono riutilizzate, con eliminazione LRU
+figure_cache_size = 256
+figure_cache = OrderedDict()
+figure_cache_stats = {}
+figure_cache_lock = threading.Lock()
+
+# Decoratore che memorizza le figure restituite da una callback
+def cached_figure(callback_function):
+    callback_name = callback_function.__name__
+
+    @functools.wraps(callback_function)
+    def cached_callback(*args):
+        args_digest = hashlib.sha1(json.dumps(args, sort_keys=True, default=str).encode()).hexdigest()
+        cache_key = (callback_name, args_digest)
+        with figure_cache_lock:
+            stats = figure_cache_stats.setdefault(callback_name, {'hits': 0, 'misses': 0})
+            if cache_key in figure_cache:
+                figure_cache.move_to_end(cache_key)
+                stats['hits'] += 1
+                return figure_cache[cache_key]
+            stats['misses'] += 1
+
+        figure = callback_function(*args)
+
+        with figure_cache_lock:
+            figure_cache[cache_key] = figure
+            while len(figure_cache) > figure_cache_size:
+                figure_cache.popitem(last=False)
+        return figure
+
+    return cached_callback
+
+# Funzione che restituisce hit/miss della cache delle figure per ogni callback
+def get_figure_cache_stats():
+    with figure_cache_lock:
+        return {name: dict(stats) for name, stats in figure_cache_stats.items()}
+
+############################################################
+
+# Applicazione
+app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP], suppress_callback_exceptions=True)
+
+server=app.server
+
+# Numero di suggerimenti restituiti dall'autocompletamento dei nominativi
+callsign_suggestions_limit = 10
+callsign_suggestions_max = 50
+
+# Endpoint per l'autocompletamento dei nominativi: /api/callsigns?q=IK1&limit=10
+@server.route('/api/callsigns')
+def callsign_typeahead():
+    limit = request.args.get('limit', callsign_suggestions_limit, type=int)
+    limit = max(0, min(limit, callsign_suggestions_max))
+    return jsonify(complete_callsign(refresh_ingested_logs()['ssb_cw'], request.args.get('q', ''), limit))
+
+# Metriche delle callback: per ogni callback (identificata dal nome della funzione)
+# numero di chiamate, durate recenti (per i percentili), byte di input e state
+# ricevuti, byte delle figure restituite (non compresse) ed errori. Ogni worker
+# espone le proprie metriche
+callback_metrics = {}
+callback_metrics_lock = threading.Lock()
+# Numero di durate recenti usate per calcolare i percentili
+callback_durations_kept = 1024
+callback_quantiles = [0.5, 0.9, 0.99]
+# Le chiamate piu' lente della soglia (secondi) vengono conservate, senza i valori
+# degli input (possono contenere dati degli utenti): /metrics/slow-calls
+slow_callback_seconds = 0.5
+slow_callback_traces = deque(maxlen=100)
+# Token con cui vengono lette le metriche (header "Authorization: Bearer <token>"),
+# dalla variabile d'ambiente DASHBOARD_METRICS_TOKEN: senza token le metriche non
+# sono esposte. L'indirizzo del client non basta dietro un proxy
+metrics_token = os.environ.get('DASHBOARD_METRICS_TOKEN', '')
+
+# Funzione che restituisce il nome della funzione Python di una callback
+def get_callback_name(output_key):
+    callback_function = app.callback_map.get(output_key, {}).get('callback')
+    return getattr(callback_function, '__name__', output_key)
+
+@server.before_request
+def start_callback_timer():
+    if request.path == '/_dash-update-component':
+        g.callback_started = time.perf_counter()
+
+@server.after_request
+def record_callback_metrics(response):
+    if 'callback_started' not in g:
+        return response
+    seconds = time.perf_counter() - g.callback_started
+    body = request.get_json(silent=True) or {}
+    callback_name = get_callback_name(body.get('output'))
+    input_bytes = len(json.dumps(body.get('inputs', [])))
+    state_bytes = len(json.dumps(body.get('state', [])))
+    # Byte delle figure restituite, prima della compressione (solo risposte con figure)
+    figure_bytes = 0
+    if response.status_code == 200 and '.figure' in str(body.get('output')):
+        figure_bytes = g.get('uncompressed_bytes') or len(response.get_data())
+
+    with callback_metrics_lock:
+        metrics = callback_metrics.setdefault(callback_name, {
+            'calls': 0, 'seconds': 0.0, 'durations': deque(maxlen=callback_durations_kept),
+            'input_bytes': 0, 'state_bytes': 0, 'figure_bytes': 0, 'errors': 0
+        })
+        metrics['calls'] += 1
+        metrics['seconds'] += seconds
+        metrics['durations'].append(seconds)
+        metrics['input_bytes'] += input_bytes
+        metrics['state_bytes'] += state_bytes
+        metrics['figure_bytes'] += figure_bytes
+        metrics['errors'] += response.status_code >= 500
+        if seconds >= slow_callback_seconds:
+            slow_callback_traces.append({
+                'callback': callback_name,
+                'output': body.get('output'),
+                'seconds': round(seconds, 4),
+                'status': response.status_code,
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'input_bytes': input_bytes,
+                'state_bytes': state_bytes
+            })
+    return response
+
+# Funzione che scrive le metriche delle callback e della cache delle figure nel
+# formato testuale di Prometheus
+def format_callback_metrics():
+    worker = os.getpid()
+    with callback_metrics_lock:
+        snapshot = {name: dict(metrics, durations=sorted(metrics['durations'])) for name, metrics in callback_metrics.items()}
+    lines = [
+        '# HELP dash_callback_duration_seconds Wall time of Dash callbacks (quantiles over recent calls).',
+        '# TYPE dash_callback_duration_seconds summary',
+    ]
+    for name, metrics in snapshot.items():
+        labels = f'callback="{name}",worker="{worker}"'
+        for quantile in callback_quantiles:
+            value = np.quantile(metrics['durations'], quantile) if metrics['durations'] else 0.0
+            lines.append(f'dash_callback_duration_seconds{{{labels},quantile="{quantile}"}} {value:.6f}')
+        lines.append(f"dash_callback_duration_seconds_sum{{{labels}}} {metrics['seconds']:.6f}")
+        lines.append(f"dash_callback_duration_seconds_count{{{labels}}} {metrics['calls']}")
+
+    counters = [
+        ('dash_callback_input_bytes_total', 'input_bytes', 'Bytes of callback inputs received.'),
+        ('dash_callback_state_bytes_total', 'state_bytes', 'Bytes of callback state received.'),
+        ('dash_callback_figure_bytes_total', 'figure_bytes', 'Uncompressed bytes of figures returned by callbacks.'),
+        ('dash_callback_errors_total', 'errors', 'Callback calls that raised an exception.'),
+    ]
+    for metric_name, field, help_text in counters:
+        lines += [f'# HELP {metric_name} {help_text}', f'# TYPE {metric_name} counter']
+        for name, metrics in snapshot.items():
+            lines.append(f'{metric_name}{{callback="{name}",worker="{worker}"}} {metrics[field]}')
+
+    lines += ['# HELP dash_ingest_failed_logs Contest logs rejected as invalid (marked .failed).',
+              '# TYPE dash_ingest_failed_logs gauge',
+              f'dash_ingest_failed_logs{{worker="{worker}"}} {len(ingest_state["failed"])}']
+    lines += ['# HELP dash_figure_cache_requests_total Figure cache lookups by result.',
+              '# TYPE dash_figure_cache_requests_total counter']
+    for name, stats in get_figure_cache_stats().items():
+        for result in ['hits', 'misses']:
+            lines.append(f'dash_figure_cache_requests_total{{callback="{name}",result="{result}",worker="{worker}"}} {stats[result]}')
+    return '\n'.join(lines) + '\n'
+
+# Funzione che indica se la richiesta puo' leggere le metriche
+def is_metrics_request_allowed():
+    authorization = request.headers.get('Authorization', '')
+    return bool(metrics_token) and hmac.compare_digest(authorization.encode(), f"Bearer {metrics_token}".encode())
+
+# Endpoint delle metriche in formato Prometheus (solo con il token)
+@server.route('/metrics')
+def callback_metrics_route():
+    if not is_metrics_request_allowed():
+        abort(404)
+    return Response(format_callback_metrics(), mimetype='text/plain; version=0.0.4')
+
+# Endpoint con le chiamate lente piu' recenti (solo con il token)
+@server.route('/metrics/slow-calls')
+def slow_callback_traces_route():
+    if not is_metrics_request_allowed():
+        abort(404)
+    with callback_metrics_lock:
+        return jsonify(list(slow_callback_traces))
+
+
+# Compressione delle risposte delle callback, del layout iniziale e della pagina:
+# brotli se il pacchetto e' installato e il browser lo accetta, altrimenti gzip.
+# Le risposte piu' piccole della soglia (byte) non vengono compresse
+compress_min_bytes = 500
+compress_gzip_level = 6
+compress_brotli_quality = 5
+dash_layout_path = app.config.routes_pathname_prefix + '_dash-layout'
+dash_callback_path = app.config.routes_pathname_prefix + '_dash-update-component'
+compressed_paths = [
+    app.config.routes_pathname_prefix,
+    dash_layout_path,
+    app.config.routes_pathname_prefix + '_dash-dependencies',
+    dash_callback_path
+]
+
+# Budget dei payload: ogni Store e ogni figura inviati al browser (come output di una
+# callback o dentro il layout di una pagina) piu' grandi del budget vengono segnalati
+# nel log ('log') o la risposta viene rifiutata ('reject'). Budget e azione vengono
+# letti dalle variabili d'ambiente DASHBOARD_PAYLOAD_BUDGET_KB e
+# DASHBOARD_PAYLOAD_BUDGET_ACTION; un'azione sconosciuta blocca l'avvio
+payload_budget_kb = int(os.environ.get('DASHBOARD_PAYLOAD_BUDGET_KB', '100'))
+payload_budget_action = os.environ.get('DASHBOARD_PAYLOAD_BUDGET_ACTION', 'log')
+if payload_budget_action not in ('log', 'reject'):
+    raise ValueError(f"DASHBOARD_PAYLOAD_BUDGET_ACTION must be 'log' or 'reject', not '{payload_budget_action}'")
+
+# Funzione che raccoglie la dimensione (byte) dei dati degli Store e delle figure dei
+# Graph contenuti in un layout serializzato
+def collect_payload_sizes(layout, sizes):
+    if isinstance(layout, list):
+        for child in layout:
+            collect_payload_sizes(child, sizes)
+    elif isinstance(layout, dict) and isinstance(layout.get('props'), dict):
+        props = layout['props']
+        payload_prop = {'Store': 'data', 'Graph': 'figure'}.get(layout.get('type'))
+        if payload_prop in props:
+            sizes[f"{props.get('id')}.{payload_prop}"] = len(json.dumps(props[payload_prop]))
+        collect_payload_sizes(props.get('children'), sizes)
+    return sizes
+
+# Funzione che restituisce la dimensione dei payload di una risposta del layout
+# iniziale o di una callback
+def get_response_payload_sizes(response_body):
+    if request.path == dash_layout_path:
+        return collect_payload_sizes(response_body, {})
+    sizes = {}
+    for component_id, props in response_body.get('response', {}).items():
+        for prop, value in props.items():
+            if prop in ('data', 'figure'):
+                sizes[f"{component_id}.{prop}"] = len(json.dumps(value))
+            else:
+                collect_payload_sizes(value, sizes)
+    return sizes
+
+# Le risposte vengono compresse dopo il controllo del budget (Flask esegue le
+# funzioni after_request in ordine inverso di registrazione)
+@server.after_request
+def compress_response(response):
+    if (request.path not in compressed_paths or response.status_code != 200
+            or response.direct_passthrough or 'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    body = response.get_data()
+    if len(body) < compress_min_bytes:
+        return response
+    g.uncompressed_bytes = len(body)
+    if brotli is not None and 'br' in request.accept_encodings:
+        response.set_data(brotli.compress(body, quality=compress_brotli_quality))
+        response.content_encoding = 'br'
+    elif 'gzip' in request.accept_encodings:
+        response.set_data(gzip.compress(body, compresslevel=compress_gzip_level))
+        response.content_encoding = 'gzip'
+    return response
+
+@server.after_request
+def check_payload_budget(response):
+    if request.path not in (dash_layout_path, dash_callback_path) or response.status_code != 200 or not response.is_json:
+        return response
+    budget_bytes = payload_budget_kb * 1024
+    # Se l'intera risposta (non ancora compressa) sta nel budget, ci sta anche ogni
+    # payload: la risposta viene letta in JSON solo per indicare i payload troppo grandi
+    if len(response.get_data()) <= budget_bytes:
+        return response
+    over_budget = {
+        payload: size for payload, size in get_response_payload_sizes(response.get_json()).items()
+        if size > budget_bytes
+    }
+    if not over_budget:
+        return response
+    message = ', '.join(f"{payload} {size / 1024:.1f} KB" for payload, size in over_budget.items())
+    logger.warning("Payload budget of %d KB exceeded on %s: %s", payload_budget_kb, request.path, message)
+    if payload_budget_action == 'reject':
+        return Response(f"Payload budget of {payload_budget_kb} KB exceeded: {message}", status=500, mimetype='text/plain')
+    return response
+
+
+# Figure piu' pesanti (mappe e grafici delle bande) servite da /figures/<nome> come JSON
+# serializzato una sola volta e compresso, con ETag e Cache-Control: l'URL contiene la
+# chiave del dataset (che cambia con i dati) e le selezioni, quindi browser e proxy
+# possono riutilizzare la risposta tra sessioni. I grafici le scaricano con una
+# callback clientside, senza passare dalle callback di Dash
+continents = ['World', 'Europe', 'North America', 'Asia', 'Africa', 'South America', 'Oceania']
+figure_json_cache_size = 256
+figure_json_cache = OrderedDict()
+figure_json_lock = threading.Lock()
+figure_max_age = 3600
+
+# Funzione che legge l'intervallo di anni di una richiesta ('2015,2024'): restituisce
+# la coppia di anni, o None (tutti gli anni) se il parametro manca
+def parse_year_range(value):
+    if not value:
+        return None
+    first_year, last_year = (int(year) for year in value.split(','))
+    if first_year > last_year:
+        raise ValueError(f"invalid year range {value}")
+    return first_year, last_year
+
+# Funzione che limita un intervallo di anni a quelli del dataset: un intervallo senza
+# anni in comune con il dataset non e' valido
+def clamp_year_range(dataset_key, year_range):
+    if year_range is None:
+        return None
+    first_year, last_year = get_dataset_years(dataset_key)
+    clamped = max(year_range[0], first_year), min(year_range[1], last_year)
+    if clamped[0] > clamped[1]:
+        raise ValueError(f"no data from {year_range[0]} to {year_range[1]}")
+    return clamped
+
+# Funzioni che generano le figure servite dalla route, a partire dalla chiave del dataset
+def build_map_figure(dataset_key, continent, participants, years):
+    winners_table = filter_year_range(calculate_top_entries(dataset_key, 'Score', ['Year']), years)
+    return update_map(
+        continent,
+        participants == 'true',
+        calculate_country_counts(dataset_key, year_range=years).to_dict('records'),
+        calculate_winner_counts(winners_table).to_dict('records'),
+        years or get_dataset_years(dataset_key)
+    )
+
+def build_band_line_figure(dataset_key, band):
+    merged_mean_df, global_ranges = calculate_band_means(dataset_key)
+    return update_band_line_chart(band, merged_mean_df.to_dict('records'), global_ranges)
+
+def build_comparsion_map_figures(dataset_key, continent, years):
+    winners_contest_table = calculate_top_entries(dataset_key, 'Score', ['Contest', 'Year']).drop(columns=derived_columns)
+    winners_contest_table = filter_year_range(winners_contest_table, years)
+    return update_comparsion_map(
+        continent,
+        calculate_country_counts(dataset_key, {'Contest': 'SSB'}, years).to_dict('records'),
+        calculate_country_counts(dataset_key, {'Contest': 'CW'}, years).to_dict('records'),
+        winners_contest_table[winners_contest_table['Contest'] == 'CW'].to_dict('records'),
+        winners_contest_table[winners_contest_table['Contest'] == 'SSB'].to_dict('records')
+    )
+
+def build_participants_map_figure(dataset_key, continent, years):
+    return build_comparsion_map_figures(dataset_key, continent, years)[0]
+
+def build_winners_map_figure(dataset_key, continent, years):
+    return build_comparsion_map_figures(dataset_key, continent, years)[1]
+
+def build_band_comparsion_figure(dataset_key, band):
+    return update_band_comparsion_line_chart(band, dataset_key)
+
+# Funzione che restituisce il tipo di un dataset: 'comparison' per la vista SSB+CW,
+# 'contest' per il dataset di un singolo contest
+def get_dataset_kind(dataset_key):
+    return 'contest' if get_dataset_part_keys(dataset_key) == [dataset_key] else 'comparison'
+
+# Figure servite dalla route: funzione che le genera, valori ammessi per ogni
+# parametro (il primo e' quello predefinito), oppure la funzione che legge il parametro,
+# e tipo di dataset accettato
+figure_routes = {
+    'map': (build_map_figure, {'continent': continents, 'participants': ['true', 'false'], 'years': parse_year_range}, 'contest'),
+    'band-line-chart': (build_band_line_figure, {'band': ['All'] + bands}, 'contest'),
+    'participants-map': (build_participants_map_figure, {'continent': continents, 'years': parse_year_range}, 'comparison'),
+    'winners-map': (build_winners_map_figure, {'continent': continents, 'years': parse_year_range}, 'comparison'),
+    'band-comparsion': (build_band_comparsion_figure, {'band': bands}, 'comparison'),
+}
+
+# Funzione che restituisce il JSON compresso di una figura e il suo ETag,
+# generandoli alla prima richiesta (con eliminazione LRU)
+def get_figure_json(figure_name, dataset_key, params):
+    cache_key = (figure_name, dataset_key, tuple(sorted(params.items())))
+    with figure_json_lock:
+        if cache_key in figure_json_cache:
+            figure_json_cache.move_to_end(cache_key)
+            return figure_json_cache[cache_key]
+
+    build_figure = figure_routes[figure_name][0]
+    figure_json = to_json_plotly(build_figure(dataset_key, **params)).encode()
+    entry = (hashlib.sha1(figure_json).hexdigest(), gzip.compress(figure_json, mtime=0))
+
+    with figure_json_lock:
+        figure_json_cache[cache_key] = entry
+        while len(figure_json_cache) > figure_json_cache_size:
+            figure_json_cache.popitem(last=False)
+    return entry
+
+# Endpoint delle figure: /figures/map?dataset=cw-078db88f&continent=Europe&participants=true&years=2015,2024
+@server.route('/figures/<figure_name>')
+def serve_figure(figure_name):
+    if figure_name not in figure_routes:
+        abort(404)
+    _, allowed_params, dataset_kind = figure_routes[figure_name]
+    params = {}
+    for name, values in allowed_params.items():
+        if callable(values):
+            try:
+                params[name] = values(request.args.get(name, ''))
+            except ValueError:
+                abort(400)
+            continue
+        params[name] = request.args.get(name, values[0])
+        if params[name] not in values:
+            abort(400)
+    # Una chiave sconosciuta puo' arrivare da un worker che ha gia' applicato un nuovo log
+    dataset_key = request.args.get('dataset', '')
+    get_dataset_part_keys(dataset_key)
+    if not is_registered_dataset(dataset_key):
+        abort(404)
+    if get_dataset_kind(dataset_key) != dataset_kind:
+        abort(400)
+    if 'years' in params:
+        try:
+            params['years'] = clamp_year_range(dataset_key, params['years'])
+        except ValueError:
+            abort(400)
+
+    etag, compressed_json = get_figure_json(figure_name, dataset_key, params)
+    if 'gzip' in request.accept_encodings:
+        response = Response(compressed_json, mimetype='application/json')
+        response.content_encoding = 'gzip'
+    else:
+        response = Response(gzip.decompress(compressed_json), mimetype='application/json')
+    # ETag debole: la stessa figura compressa e non compressa e' equivalente
+    response.set_etag(etag, weak=True)
+    response.cache_control.public = True
+    response.cache_control.max_age = figure_max_age
+    response.vary.add('Accept-Encoding')
+    return response.make_conditional(request)
+
+# Funzione che registra la callback clientside con cui uno o piu' grafici scaricano le
+# loro figure dalla route: i parametri dell'URL sono i valori degli input, la chiave
+# del dataset viene letta dallo Store 'selected-data'
+def register_figure_fetch(figure_names, graph_ids, param_inputs):
+    figure_urls = [app.get_relative_path(f"/figures/{figure_name}") for figure_name in figure_names]
+    outputs = [Output(graph_id, 'figure') for graph_id in graph_ids]
+    app.clientside_callback(
+        """
+        function() {
+            var values = Array.prototype.slice.call(arguments);
+            var dataset = values.pop();
+            if (!dataset) {
+                return window.dash_clientside.no_update;
+            }
+            var params = new URLSearchParams({dataset: dataset});
+            %(param_names)s.forEach(function(name, i) {
+                params.set(name, String(values[i]));
+            });
+            var figures = %(figure_urls)s.map(function(url) {
+                return fetch(url + '?' + params.toString()).then(function(response) {
+                    if (!response.ok) {
+                        throw new Error(url + ': HTTP ' + response.status);
+                    }
+                    return response.json();
+                });
+            });
+            return Promise.all(figures).then(function(figures) {
+                return figures.length === 1 ? figures[0] : figures;
+            });
+        }
+        """ % {'param_names': json.dumps(list(param_inputs)), 'figure_urls': json.dumps(figure_urls)},
+        outputs if len(outputs) > 1 else outputs[0],
+        [Input(component_id, 'value') for component_id in param_inputs.values()],
+        State('selected-data', 'data')
+    )
+
+# Layout delle pagine, costruiti una sola volta per ogni versione dei dataset e
+# riutilizzati ad ogni navigazione. Gli alberi di componenti non vengono modificati
+# dopo la costruzione: lo stato della pagina vive nel browser
+page_layouts = {}
+
+# Funzione che restituisce il layout di una pagina, costruendolo al primo utilizzo.
+# La chiave contiene il nome della pagina e le chiavi dei dataset da cui dipende
+def get_page_layout(page_key, build_page, *args):
+    if page_key not in page_layouts:
+        page_layouts[page_key] = build_page(*args)
+    return page_layouts[page_key]
+
+def welcome_page(dataset_key):
+    # Gli anni vengono letti senza caricare i dataset (se non sono noti si omettono)
+    years = peek_dataset_years(dataset_key)
+    years_text = f" form {years[0]} to {years[1]}" if years else ''
+    return dbc.Container([
+        html.H1("Welcome to CQ World Wide WPX Contest Dashboard", style={'text-align': 'center', 'margin-top':'70px', 'font-size':'60px'}),
+        html.H2("The WPX Contest is based on an award offered by CQ Magazine for working all prefixes. Held on the last weekend of March (SSB) and May (CW), the contest draws thousands of entries from around the world.", style={'text-align': 'center', 'margin-top':'50px'}),
+        html.H2(f"There will be represented data{years_text}, obtained from the contest official website, using three different dashboards.", style={'text-align': 'center', 'margin-top':'20px'}),
+        html.H2("Select data to represent:", style={'text-align': 'center', 'margin-top':'60px'}),
+        dbc.Row([
+            dbc.Col(dbc.Button("SSB Contest", id='ssb-contest', className="btn-custom btn btn-dark"), width="auto"),
+            dbc.Tooltip("Display a dashboard for SSB contest data",target="ssb-contest", placement="bottom", className="tooltip-custom"),
+            dbc.Col(dbc.Button("CW Contest", id='cw-contest', className="btn-custom btn btn-dark"), width="auto"),
+            dbc.Tooltip("Display a dashboard for CW contest data",target="cw-contest", placement="bottom", className="tooltip-custom"),
+            dbc.Col(dbc.Button("SSB and CW", id='ssb-cw', className="btn-custom btn btn-dark"), width="auto"),
+            dbc.Tooltip("Direct comparison of both contests records through a simple display in one dashboard ",target="ssb-cw", placement="bottom", className="tooltip-custom"),
+            dbc.Col(dbc.Button("Categories", id='category-explorer', className="btn-custom btn btn-dark"), width="auto"),
+            dbc.Tooltip("Explore band means, winners and participants by operator class, power, band and overlay",target="category-explorer", placement="bottom", className="tooltip-custom"),
+        ], justify='center', className="custom-row"),
+        html.H2("Or search a station by callsign:", style={'text-align': 'center', 'margin-top':'60px'}),
+        dbc.Row([
+            dbc.Col(dcc.Input(
+                id='callsign-search',
+                type='text',
+                placeholder='Callsign',
+                list='callsign-suggestions',
+                autoComplete='off',
+                style={'font-size': '28px', 'height': '60px', 'width': '400px'}
+            ), width="auto"),
+            dbc.Col(dbc.Button("Search", id='callsign-search-button', className="btn-custom-home btn btn-dark"), width="auto"),
+        ], justify='center', align='center', style={'margin-top': '20px'}),
+        html.Datalist(id='callsign-suggestions', children=[]),
+        html.H3(id='callsign-search-message', style={'text-align': 'center', 'margin-top': '20px'}),
+    ], style={'text-align': 'center','min-width': '1600px'})
+
+
+# Layout servito ad ogni caricamento della pagina: la pagina iniziale usa le versioni
+# correnti dei dataset (con i log applicati dopo l'avvio)
+def serve_layout():
+    dataset_key = current_dataset_keys['ssb_cw']
+    return dbc.Container([
+        dcc.Store(id='global-color-map', storage_type='memory'),
+        dcc.Store(id='selected-theme', data={'dark_mode': True}),
+        dcc.Store(id='selected-template', data='plotly_dark'),
+        dcc.Store(id='figure-templates', data=figure_templates),
+        html.Link(id='theme-link', rel='stylesheet', href='/static/dark.css'),
+        dbc.Navbar(
+            dbc.Container(
+                dbc.Row([
+                    dbc.Col(
+                        dbc.Button(
+                            "Homepage",
+                            id="btn-home",
+                            color="primary",
+                            className="btn-custom-home btn btn-dark",
+                            style={'margin-left':'200px'},
+                        ),
+                        width="auto",
+                        className="p-0"
+                    ),
+                    dbc.Col(
+                        html.H1(
+                            "Data Analysis for CQ World Wide WPX Contest - by IU1SCQ",
+                            className="mb-0 text-center text-nowrap"
+                        ),
+                        className="p-0 flex-grow-1"
+                    ),
+                    dbc.Col(
+                        dbc.Switch(
+                            id="select-dark-mode",
+                            label="Dark mode",
+                            value=True,
+                            style={'font-size': '30px', 'margin-right':'200px'},
+                        ),
+                        width="auto",
+                        className="p-0"
+                    ),
+                ], align="center", className="g-0 w-100 flex-nowrap"),
+
+                fluid=True,
+                className="w-100",
+                style={'padding-bottom':'20px', 'padding-top':'20px'},
+            ),
+
+            sticky="top",
+            className="w-100"
+        ),
+        dcc.Location(id='url', refresh=False),
+        html.Div(id='page-content', children=get_page_layout(('welcome', dataset_key), welcome_page, dataset_key))
+    ], fluid=True)
+
+app.layout = serve_layout
+
+# Callback per tornare alla pagina principale
+@app.callback(
+    Output('page-content', 'children', allow_duplicate=True),
+    Input('btn-home', 'n_clicks'),
+    prevent_initial_call=True
+)
+def go_home(n_clicks):
+    if n_clicks:
+        dataset_key = refresh_ingested_logs()['ssb_cw']
+        return get_page_layout(('welcome', dataset_key), welcome_page, dataset_key)
+    return dash.no_update
+
+
+# Callback (clientside) per lo switch del tema
+app.clientside_callback(
+    """
+    function(dark_mode) {
+        var template = dark_mode ? 'plotly_dark' : 'plotly_light_soft';
+        return [{'dark_mode': dark_mode}, template];
+    }
+    """,
+    [Output('selected-theme', 'data'),
+     Output('selected-template', 'data')],
+    Input('select-dark-mode', 'value')
+)
+
+# Callback (clientside) che aggiorna il tema
+app.clientside_callback(
+    """
+    function(theme) {
+        var dark_mode = !theme || theme.dark_mode !== false;
+        return dark_mode ? '/static/dark.css' : '/static/light.css';
+    }
+    """,
+    Output('theme-link', 'href'),
+    Input('selected-theme', 'data')
+)
+
+# Grafici a cui il tema viene applicato nel browser
+themed_graph_ids = [
+    'band-line-chart', 'wpx-qso-linechart', 'club-chart', 'club-pie', 'map-graph',
+    'winner-barchart', 'winner-linechart', 'category-linechart',
+    'hours-histogram', 'hours-year-heatmap', 'hours-score-heatmap', 'entry-scatter',
+    'band-comparsion', 'cw-pie', 'ssb-pie', 'score-comparsion', 'qso-wpx-comparsion',
+    'participants-map-graph', 'winners-map-graph', 'winner-barchart-comparsion', 'winner-radar', 'comparsion-entry-scatter',
+    'callsign-chart', 'explorer-band-chart', 'explorer-winner-chart', 'explorer-map'
+]
+
+# Callback (clientside) che applica il template del tema ad una figura, sia quando
+# arriva una nuova figura dal server sia quando cambia il tema: il cambio di tema
+# non richiede nessuna chiamata al server
+for graph_id in themed_graph_ids:
+    app.clientside_callback(
+        """
+        function(template, figure, templates) {
+            if (!figure || !figure.data || !templates || !templates[template]) {
+                return window.dash_clientside.no_update;
+            }
+            var layout = Object.assign({}, figure.layout, {template: templates[template]});
+            return Object.assign({}, figure, {layout: layout});
+        }
+        """,
+        Output(graph_id, 'figure', allow_duplicate=True),
+        [Input('selected-template', 'data'),
+         Input(graph_id, 'figure')],
+        State('figure-templates', 'data'),
+        prevent_initial_call=True
+    )
+
+# Callback che crea la mappa dei colori per i vincitori
+@app.callback(
+    Output('global-color-map', 'data'),
+    Input('winners-table', 'data')
+)
+def compute_color_map(winners_table):
+    if not winners_table:
+        raise PreventUpdate
+    if isinstance(winners_table, list):
+        winners_table = pd.DataFrame(winners_table)
+    
+    unique_winner_countries = winners_table['Country'].unique()
+    vivid_colors = px.colors.qualitative.Vivid
+    country_color_map = {
+        country: vivid_colors[i % len(vivid_colors)]
+        for i, country in enumerate(sorted(unique_winner_countries))
+    }
+    return country_color_map
+
+
+
+########################################################################
+# Funzione che crea la dashboard di dei singoli contest
+########################################################################
+def single_data_dashboard_page(dataset_key, title_string):
+    # Medie annuali di tutte le metriche, calcolate in un'unica passata
+    yearly_means, _ = calculate_yearly_means(dataset_key)
+
+    # Dataset con medie di qso e wpx e anno
+    mean_qso_wpx_df = yearly_means[['Year', 'QSOs', 'WPX']]
+
+    # Limiti degli assi del grafico a linee delle bande (la figura viene scaricata dalla
+    # route delle figure) e del grafico di QSO e WPX
+    _, global_ranges = calculate_band_means(dataset_key)
+
+
+    # Vincitori di ogni anno
+    winners_table = calculate_top_entries(dataset_key, 'Score', ['Year'])
+
+    # Punteggio, QSOs e WPX massimi tra i vincitori
+    max_score = winners_table['Score'].max()
+    max_QSO = winners_table['QSOs'].max()
+    max_WPX = winners_table['WPX'].max()
+
+
+    # Per l'istogramma dei club quando vengono plottati i QSO
+    global_y_min_QSO = 0
+    global_y_max_QSO = calculate_max(dataset_key, 'Score')
+    global_y_QSO_range = global_y_max_QSO - global_y_min_QSO
+    global_y_min_QSO_buffered = global_y_min_QSO - buffer_percentage * global_y_QSO_range
+    global_y_max_QSO_buffered = global_y_max_QSO + buffer_percentage * global_y_QSO_range
+
+    global_x_min_QSO = 0
+    global_x_max_QSO = calculate_max(dataset_key, 'QSOs')
+    global_x_QSO_range = global_x_max_QSO - global_x_min_QSO
+    global_x_min_QSO_buffered = global_x_min_QSO - buffer_percentage * global_x_QSO_range
+    global_x_max_QSO_buffered = global_x_max_QSO + buffer_percentage * global_x_QSO_range
+
+    # Per l'istogramma dei club quando vengono plottati i WPX
+    global_y_min_WPX = 0
+    global_y_max_WPX = calculate_max(dataset_key, 'Score')
+    global_y_WPX_range = global_y_max_WPX - global_y_min_WPX
+    global_y_min_WPX_buffered = global_y_min_WPX - buffer_percentage * global_y_WPX_range
+    global_y_max_WPX_buffered = global_y_max_WPX + buffer_percentage * global_y_WPX_range
+
+    global_x_min_WPX = 0
+    global_x_max_WPX = calculate_max(dataset_key, 'WPX')
+    global_x_WPX_range = global_x_max_WPX - global_x_min_WPX
+    global_x_min_WPX_buffered = global_x_min_WPX - buffer_percentage * global_x_WPX_range
+    global_x_max_WPX_buffered = global_x_max_WPX + buffer_percentage * global_x_WPX_range
+
+
+
+    # Per poter fare uno studio sulle categorie si usano le sopracategorie, calcolate
+    # durante il caricamento: i conteggi per anno vengono letti dal cubo
+    supercat_count_per_year = rollup_cube(dataset_key, ['Year', 'Supercategory'])[['Year', 'Supercategory', 'Entries']]
+    supercat_count_per_year = supercat_count_per_year.rename(columns={'Supercategory': 'Category', 'Entries': 'Count'})
+
+    # Primo e ultimo anno del dataset
+    first_year, last_year = get_dataset_years(dataset_key)
+
+    # Sopracategorie presenti negli istogrammi delle ore
+    hours_categories = get_hours_histograms(dataset_key)['groups']['Supercategory'].dropna().unique().tolist()
+    
+        
+    # Componente RadioItems per la selezione della banda
+    radio_band = dbc.RadioItems(
+        id="select-band",
+        options=[        
+            {"label": "All", "value": "All"},
+            {"label": "160M", "value": "160M"},
+            {"label": "80M", "value": "80M"},
+            {"label": "40M", "value": "40M"},
+            {"label": "20M", "value": "20M"},
+            {"label": "15M", "value": "15M"},
+            {"label": "10M", "value": "10M"}
+        ],
+        value="All",
+        style={'font-size': '20px'},
+        inline = True
+    )
+
+    # Componente RangeSlider per la selezione degli anni rappresentati nella mappa, nel
+    # grafico a torta dei club e nel grafico delle categorie
+    year_range_slider = dcc.RangeSlider(
+        id="select-years",
+        min=first_year,
+        max=last_year,
+        step=1,
+        value=[first_year, last_year],
+        marks={year: str(year) for year in range(first_year, last_year + 1) if (year - first_year) % 5 == 0 or year == last_year},
+        allowCross=False,
+        tooltip={'placement': 'bottom'}
+    )
+
+    # Componente RadioItems per la selezione della distribuzione delle ore di attivita'
+    radio_hours_distribution = dbc.RadioItems(
+        id="select-hours-distribution",
+        options=[{"label": spec['label'], "value": distribution} for distribution, spec in hours_distributions.items()],
+        value="Hours",
+        style={'font-size': '20px'},
+        inline=True
+    )
+
+    # Componente Dropdown per la selezione delle sopracategorie nei grafici delle ore
+    # (nessuna selezione = tutte le sopracategorie)
+    hours_categories_dropdown = dcc.Dropdown(
+        id="select-hours-categories",
+        options=[{"label": category.title(), "value": category} for category in hours_categories],
+        value=[],
+        multi=True,
+        placeholder="All categories",
+        style={'min-width': '300px', 'font-size': '18px', 'color': 'black'}
+    )
+
+    # Componente RadioItems per la selezione del country vincitore
+    radio_winner_countries = dbc.RadioItems(
+        id="winner-country-radio",
+        options=[],
+        value=None,
+        style={'font-size': '20px'},
+        inline=False
+    )
+
+    # Componente RadioItems per la selezione del continente da visualizzare nella mappa
+    radio_continents = dbc.RadioItems(
+        id= "select-continent",
+        options=[
+            {'label': 'World', 'value': 'World'},
+            {'label': 'Europe', 'value': 'Europe'},
+            {'label': 'North America', 'value': 'North America'},
+            {'label': 'South America', 'value': 'South America'},
+            {'label': 'Asia', 'value': 'Asia'},
+            {'label': 'Africa', 'value': 'Africa'},
+            {'label': 'Oceania', 'value': 'Oceania'}
+        ],
+        value='World',
+        style={'width':'900px', 'margin-left':0, 'font-size': '20px'},
+        inline = True
+    )
+
+    # Componente Switch per la selezione del tipo di mappa da visualizzare (mondo o continente)
+    winner_switch = dbc.Switch(
+        id="select-map-type",
+        label="All partecipants/Winners",
+        style= {'font-size': '20px'},
+        value=True
+    )
+
+    # Componente Switch per scegliere se visualizzare qso e wpx a confronto o solo wpx    
+    enable_qso_switch = dbc.Switch(
+        id="enable-qso",
+        label="Show mean of QSOs",
+        style= {'font-size': '20px'},
+        value=True
+    )
+
+    # Componente Switch per scegliere se visualizzare in scala logaritmica nel grafico delle categorie    
+    logarithmic_scale_switch = dbc.Switch(
+        id="logarithmic-scale",
+        label="Use logarithmic scale for y axis",
+        style= {'font-size': '20px'},
+        value=True
+    )
+
+    # Componente RadioItems per la selezione del tipo di dato da visualizzare sull'asse x dell'istogramma dei club
+    radio_club_x = dbc.RadioItems(
+        id="select-club-y",
+        options=[        
+            {"label": "WPXs", "value": "WPX"},
+            {"label": "QSOs", "value": "QSOs"},
+        ],
+        value="WPX",
+        style={'font-size': '20px'},
+        inline=True
+    )
+
+    # Componente RadioItems per la selezione del tipo di dato da visualizzare sull'asse y dei plot dei vincitori
+    radio_winner_y = dbc.RadioItems(
+        id="select-winner-y",
+        options=[        
+            {"label": "WPXs", "value": "WPX"},
+            {"label": "QSOs", "value": "QSOs"},
+            {"label": "Total score", "value": "Score"}
+        ],
+        value="WPX",
+        style={'font-size': '20px'},
+        inline=True
+    )
+    return dbc.Container([
+        dcc.Store(id='selected-data', data=dataset_key),
+        dcc.Store(id='global-ranges', data=global_ranges),
+        dcc.Store(id="mean-qso-wpx", data=mean_qso_wpx_df.to_dict('records')),
+        dcc.Store(id='supercat', data=supercat_count_per_year.to_dict('records')),
+        dcc.Store(id='y-data-to-plot', data='Score'),
+        dcc.Store(id='select-winner-country', data=None),
+        dcc.Store(id='winners-table', data=winners_table.drop(columns=derived_columns).to_dict('records')),
+        dcc.Store(id='winners-QSO-WPX-score', data={
+            'max_QSO': max_QSO,
+            'max_WPX': max_WPX,
+            'max_score': max_score
+        }),
+        dcc.Store(id='global-ranges-QSO-WPX', data={
+            'x_min_QSO': global_x_min_QSO_buffered,
+            'x_max_QSO': global_x_max_QSO_buffered,
+            'y_min_QSO': global_y_min_QSO_buffered,
+            'y_max_QSO': global_y_max_QSO_buffered,
+            'x_min_WPX': global_x_min_WPX_buffered,
+            'x_max_WPX': global_x_max_WPX_buffered,
+            'y_min_WPX': global_y_min_WPX_buffered,
+            'y_max_WPX': global_y_max_WPX_buffered
+        }),
+
+        # Titolo
+        dbc.Row(
+            dbc.Col(
+                html.H3(f'Data from {first_year} to {last_year} for {title_string} contest'),
+                width=12,
+                className="text-center my-4"
+            )
+        ),
+
+        # Selezione degli anni
+        dbc.Row([
+            dbc.Col([
+                dbc.Label("Select years:", html_for="select-years", className="me-2 labels"),
+                year_range_slider
+            ], width=8)
+        ], justify="center", className="mb-5"),
+
+        # QSO e WPX sulle diverse bande, due linechart affiancati nelle due colonne
+        # primo linechart, quello dei qso totali e sulle singole bande
+        # secondo linechart, media dei wpx negli anni a confronto con la media dei qso totali
+        
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    dbc.Label("Select band:", html_for="select-band", className="me-2 labels"),
+                    radio_band
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id="band-line-chart", style={'width': '100%', 'height': '500px'})
+            ], width=5),
+
+            dbc.Col([
+                html.Div([
+                    enable_qso_switch
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id="wpx-qso-linechart", style={'width': '100%', 'height': '500px'})
+            ], width=5)
+        ], justify="center", className="mb-5"),
+
+        # vincitori, barchart con scelta tra wpx e qso, colonna che elenca i vincitori
+        # negli anni, linechart che mostra i vincitori selezionati       
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    dbc.Label("Select y axis:", html_for="select-winner-y", className="me-2 labels"),
+                    radio_winner_y
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id='winner-barchart', style={'width': '100%', 'height': '500px'})
+            ], width=5),
+
+            dbc.Col([
+                dbc.Label("Select winner:", html_for="winner-country-radio", className="me-2 labels"),
+                radio_winner_countries
+            ], width=1, style={"display": "flex", "flexDirection": "column", "alignItems": "center"}),
+
+            dbc.Col([
+                dcc.Graph(id="winner-linechart", style={'width': '100%', 'height': '500px'})
+            ], width=5)
+        ], justify="center", className="mb-5"),
+
+        # Rappresentazione per i Club
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    dbc.Label("Select y axis:", html_for="select-club-y", className="me-2 labels"),
+                    radio_club_x
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id="club-chart", style={'width': '100%', 'height': '500px'})
+            ], width=5),
+
+            dbc.Col([
+                dcc.Graph(id='club-pie', style={'width': '100%', 'height': '500px'})
+            ], width=5)
+        ], justify="center", className="mb-5"),
+
+        # Categorie di partecipazione
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    logarithmic_scale_switch,
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id='category-linechart', style={'width': '100%', 'height': '500px'})
+            ], width=9),
+        ], justify="center", className="mb-5"),
+
+        # Ore di attivita': distribuzione scelta per sopracategoria e per anno, e
+        # confronto tra ore e punteggio
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    dbc.Label("Select distribution:", html_for="select-hours-distribution", className="me-2 labels"),
+                    radio_hours_distribution
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                html.Div([
+                    dbc.Label("Select categories:", html_for="select-hours-categories", className="me-2 labels"),
+                    hours_categories_dropdown
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})
+            ], width=10)
+        ], justify="center", className="mb-3"),
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id='hours-histogram', style={'width': '100%', 'height': '500px'})
+            ], width=5),
+            dbc.Col([
+                dcc.Graph(id='hours-year-heatmap', style={'width': '100%', 'height': '500px'})
+            ], width=5)
+        ], justify="center", className="mb-5"),
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id='hours-score-heatmap', style={'width': '100%', 'height': '600px'})
+            ], width=9)
+        ], justify="center", className="mb-5"),
+
+        # Punteggio, QSO e WPX di ogni stazione
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id='entry-scatter', style={'width': '100%', 'height': '700px'})
+            ], width=9)
+        ], justify="center", className="mb-5"),
+
+        # Mappa del mondo
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    winner_switch,
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                html.Div([
+                    dbc.Label("Focus on:", html_for="select-continent", className="me-2 labels"),
+                    radio_continents
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id="map-graph", style={'width': '100%', 'height': '800px'}, config={"scrollZoom": False})
+            ], width=9, className="text-center mb-3")
+        ], justify="center", className="mb-5"),
+    ], fluid=True)
+
+
+########################################################################
+# Tutte le callbacks e funzioni per la dashboard dei singoli contest
+########################################################################
+
+# Linechart in base alla selezione della banda (scaricato dalla route delle figure)
+register_figure_fetch(['band-line-chart'], ['band-line-chart'], {'band': 'select-band'})
+
+@cached_figure
+def update_band_line_chart(selected_band, merged_mean_data, global_ranges):
+    merged_mean_df = pd.DataFrame(merged_mean_data)
+    x_min = global_ranges['x_min']
+    x_max = global_ranges['x_max']
+    y_min = global_ranges['y_min']
+    y_max = global_ranges['y_max']
+    color_map = {
+        "TotalQSOs": "#E58606",
+        "160M": "#ED645A",
+        "80M": "#52BCA3",
+        "40M": "#5D69B1",
+        "20M": "#99C945",
+        "15M": "#CC61B0",
+        "10M": "#764E9F",
+    }
+    if selected_band == "All":
+        bands_to_plot = ['TotalQSOs','160M', '80M', '40M', '20M', '15M', '10M']
+    else:
+        bands_to_plot = ['TotalQSOs', selected_band]
+
+    fig_band_line_chart = px.line(
+        merged_mean_df,
+        x='Year',
+        y=bands_to_plot,
+        title=f"QSOs in {selected_band} band compared to total QSOs",
+        labels={"Year": "Year", selected_band: f"{selected_band}"},
+        markers=True,
+        color_discrete_map=color_map
+    )
+    fig_band_line_chart.update_xaxes(title='Year', range=[x_min, x_max])
+    fig_band_line_chart.update_yaxes(title='Mean of QSOs', range=[y_min, y_max])
+    fig_band_line_chart.update_layout(
+        margin=dict(
+            l=60,
+            r=160,
+            t=60,
+            b=60,
+        )
+    )
+    return fig_band_line_chart
+
+#callback per la creazione del linechart del confronto media wpx e qso
+@app.callback(
+    Output("wpx-qso-linechart", "figure"),
+    Input("enable-qso", "value"),
+    [State("mean-qso-wpx", "data"),
+     State("global-ranges", "data")]
+)
+@cached_figure
+def update_qso_wpx_linechart(enable_qso, mean_df, global_ranges):
+    x_min = global_ranges['x_min']
+    x_max = global_ranges['x_max']
+    y_min = global_ranges['y_min']
+    y_max = global_ranges['y_max']
+    color_map = {
+        "QSOs": "#E58606",
+        "WPX": "#2F8AC4"
+    }
+    if enable_qso:
+        data_to_plot = ["WPX", "QSOs"]
+    else:
+        data_to_plot = ["WPX"]
+    fig_qso_wpx_line_chart = px.line(
+        mean_df,
+        x='Year',
+        y=data_to_plot,
+        title=f"Comparsion of mean QSOs and WPXs",
+        labels={"Year": "Year"},
+        markers=True,
+        color_discrete_map=color_map
+    )
+    fig_qso_wpx_line_chart.update_xaxes(title='Year', range=[x_min, x_max])
+    fig_qso_wpx_line_chart.update_yaxes(title='Mean of data', range=[y_min, y_max])
+    fig_qso_wpx_line_chart.update_layout(
+        margin=dict(
+            l=60,
+            r=160,
+            t=60,
+            b=60,
+        ),
+        showlegend=True
+    )
+    return fig_qso_wpx_line_chart
+
+# Callback per aggiornare l'istogramma sui club
+@app.callback(
+    Output("club-chart", "figure"),
+    Input("select-club-y", "value"),
+    State("selected-data", "data")
+)
+@cached_figure
+def update_club_chart(selected_y, dataset_key):
+    # Aggregazione per anno e 'Club Status', letta dal cubo di aggregati
+    data_club_grouped = calculate_mean(dataset_key, selected_y, by=("Year", "Club Status"), decimals=None)
+    
+    # Colori personalizzati per l'istogramma dei club
+    color_discrete_map = {
+        'No Club Member': "#EFDA3B",
+        'Club Member': '#636EFA'
+    }
+
+    fig_club_chart = px.line(
+        data_club_grouped,
+        x='Year',
+        y=selected_y,
+        color='Club Status',
+        title=f"Comparsion on {selected_y} for club members and not members",
+        labels={"Year": "Year"},
+        markers=True,
+        color_discrete_map=color_discrete_map
+    ).update_yaxes(title=f"Mean of {selected_y}")      
+    return fig_club_chart
+
+# Callback per la generazione del grafico a torta per i club, negli anni selezionati
+@app.callback(
+    Output("club-pie", "figure"),   
+    [Input("selected-data", "data"),
+     Input("select-years", "value")]
+)
+@cached_figure
+def update_club_pie(dataset_key, year_range):
+    df_pie = (
+        rollup_year_range(dataset_key, ["Club Status"], year_range)
+        .rename(columns={"Entries": "Count"})
+    )
+
+    fig = px.pie(
+        df_pie,
+        names="Club Status",
+        values="Count",
+        title=f"Club Members vs No Club Members from {year_range[0]} to {year_range[1]}",
+        color="Club Status",
+        color_discrete_map={
+            "Club Member": "#636EFA",
+            "No Club Member": "#EFDA3B"
+        }
+    )
+    return fig
+
+# Mappa del continente selezionato (scaricata dalla route delle figure)
+register_figure_fetch(['map'], ['map-graph'],
+                      {'continent': 'select-continent', 'participants': 'select-map-type', 'years': 'select-years'})
+
+@cached_figure
+def update_map(selected_continent, selected_type, country_counts, winner_counts, year_range):
+    # Le colonne vengono indicate perche' i conteggi possono essere vuoti
+    if isinstance(country_counts, list):
+        country_counts = pd.DataFrame(country_counts, columns=['country_code', 'count'])
+    if isinstance(winner_counts, list):
+        winner_counts = pd.DataFrame(winner_counts, columns=['country_code', 'count'])
+
+    bounds = get_continent_bounds(selected_continent)
+    if selected_type == True:
+        selected_type_of_rapresentation = 'participants'
+        type_of_counts = country_counts        
+        type_of_counts = type_of_counts.rename(columns={'count': 'participants'})
+        color_bar=dict(
+            title='',
+            orientation='v', 
+            yanchor='middle', 
+            y=0.5,  
+            xanchor='left',  
+            x=-0.1,
+            len=1
+        )        
+    else:
+        selected_type_of_rapresentation = 'winners'
+        type_of_counts = winner_counts                
+        type_of_counts = type_of_counts.rename(columns={'count': 'winners'})
+        color_bar = dict(
+            title='',
+            orientation='v', 
+            yanchor='middle', 
+            y=0.5,  
+            xanchor='left',  
+            x=-0.1,
+            len=1,
+            tickvals=[1, 2, 3, 4, 5],
+            ticktext=['1', '2', '3', '4', '5']
+        )
+
+    # Inserimento di una colonna con il nome del Country
+    type_of_counts.loc[:, 'Country'] = type_of_counts['country_code'].map(find_country_from_code)
+
+    map_figure = px.choropleth(
+        type_of_counts,
+        locations="country_code",
+        color=selected_type_of_rapresentation,
+        hover_name="Country",
+        hover_data= {"country_code" : False},
+        color_continuous_scale=custom_colorscale,
+        title=f"Number of {selected_type_of_rapresentation} from {year_range[0]} to {year_range[1]} per Country"
+    ).update_layout(
+        margin=dict(
+            l=60,
+            r=100,
+            t=60,
+            b=60,
+        ),
+        height=700,
+        title_y= 0.95,
+        title_x=0.5, 
+        coloraxis_colorbar = color_bar,
+        geo=dict(
+            projection_scale=1,
+            center={"lat": (bounds['lat'][0] + bounds['lat'][1]) / 2, "lon": (bounds['lon'][0] + bounds['lon'][1]) / 2},
+            lonaxis_range=bounds['lon'],
+            lataxis_range=bounds['lat'],
+        )
+    )
+    return map_figure
+
+# Callback per popolare i radio button per la scelta del country vincitore
+@app.callback(
+    [Output("winner-country-radio", "options"),
+     Output("winner-country-radio", "value")],
+    Input("winners-table", "data")
+)
+def update_winner_country_radio(winners_table):
+    if not winners_table:
+        return [], None
+    df = pd.DataFrame(winners_table)
+    country_year = (
+        df.groupby("Country")["Year"]
+        .min()
+        .reset_index()
+        .sort_values("Year")
+    )
+    options = [
+        {"label": row["Country"], "value": row["Country"]}
+        for _, row in country_year.iterrows()
+    ]
+    value = options[0]["value"]
+    return options, value
+
+# Callback per aggiornare i due grafici sui vincitori in base alla scelta del dato da usare sull'asse y
+@app.callback(
+        Output("y-data-to-plot", "data"),
+        Input("select-winner-y", "value")
+)
+def update_winner_plots(selected_y):
+    if selected_y == "WPX":
+        y_data_to_plot = "WPX"
+    elif selected_y == "QSOs":
+        y_data_to_plot = "QSOs"
+    else:
+        y_data_to_plot = "Score"
+    return y_data_to_plot    
+    
+# Callbacke per aggiornare il grafico barchart dei vincitori
+@app.callback(
+    Output("winner-barchart", "figure"),
+    [Input("y-data-to-plot", "data"),
+     Input('global-color-map', 'data')],
+    [State('winners-table', 'data')]
+)
+@cached_figure
+def update_winner_barchart(selected_y, color_map, winners_table):
+    if isinstance(winners_table, list):
+        winners_table = pd.DataFrame(winners_table)
+
+    winners_figure = px.bar(
+        winners_table,
+        x='Year',
+        y= selected_y,
+        color='Country',
+        title = "Winner Countries per year",
+        color_discrete_map=color_map,
+        hover_data={'Callsign': winners_table["Call"], 'Cat': winners_table["Category"], 'club': winners_table["Club"]}
+    ).update_layout(
+        xaxis_title='Year',
+        yaxis_title=selected_y,
+        margin=dict(l=2, r=2, t=40, b=2)
+    )
+    return winners_figure
+
+# Callback per aggiornare il grafico a linee in base alla scelta del paese (tramite il click sui radio button)
+@app.callback(
+    Output("winner-linechart", "figure"),
+    [Input("winner-country-radio", "value"),
+    Input("y-data-to-plot", "data"),
+    Input('global-color-map', 'data')],
+    [State('selected-data', 'data'),
+    State('winners-table', 'data'),
+    State('winners-QSO-WPX-score', 'data')]         
+)
+@cached_figure
+def update_winner_country_chart(selected_country, y_data, color_map, dataset_key, winners_table, winners_QSO_WPX_score):
+    if isinstance(winners_table, list):
+        winners_table = pd.DataFrame(winners_table)
+    if selected_country:
+        country_to_plot = selected_country 
+    else:
+        country_to_plot = winners_table.loc[winners_table['Year'] == winners_table['Year'].min(), 'Country'].values[0]
+
+    max_QSO = winners_QSO_WPX_score['max_QSO']
+    max_WPX = winners_QSO_WPX_score['max_WPX']
+    max_score = winners_QSO_WPX_score['max_score']
+
+    if y_data == "WPX":
+        max_to_plot = max_WPX
+    elif y_data == "QSOs":
+        max_to_plot = max_QSO
+    else:
+        max_to_plot = max_score
+
+    # Per il riscalamento degli assi
+    global_y_winner_min = 0
+    global_y_winner_max = max_to_plot
+    global_y_range = global_y_winner_max - global_y_winner_min
+    global_y_winner_max_buffered = global_y_winner_max + buffer_percentage * global_y_range
+    global_y_winner_max_buffered = max_to_plot * (1 + buffer_percentage)
+
+
+    mean_score_df = calculate_mean_data_for_country(dataset_key, country_to_plot, y_data)
+    
+    # Per ottenere il colore corretto dalla mappa
+    country_color = color_map.get(country_to_plot, "white")
+
+    fig_winner_country_chart = px.line(
+        mean_score_df,
+        x='Year',
+        y= y_data,
+        title=f"Average {y_data} for {country_to_plot} and winners",        
+        labels={"Year": "Year", y_data: f"Average {y_data}"},
+        color_discrete_sequence=[country_color],
+        markers=True    
+    ).update_layout(        
+        margin=dict(l=2, r=2, t=40, b=2)
+    )  
+    winners_selected_country = winners_table[winners_table['Country'] == country_to_plot]
+    fig_winner_country_chart.update_yaxes(title=y_data, range=[global_y_winner_min, global_y_winner_max_buffered])
+
+    # Viene sovrapposto al grafico a linee uno scatterplot per visualizzare i vincitori
+    fig_winner_country_chart.add_scatter(    
+        x=winners_selected_country['Year'],  
+        y=winners_selected_country[y_data],  
+        mode='markers', 
+        name='Winners',
+        line=dict(color="#FFFFFF"),
+        text=winners_selected_country['Call'],
+        hovertemplate=
+        '<b>Year</b>: %{x}<br>' +
+        '<b>Call</b>: %{text}<extra></extra><br>' +
+        f'<b>{y_data}</b>: %{{y}}'
+    )
+    return fig_winner_country_chart
+
+# Callback per aggiornare il grafico a linee per le categorie, negli anni selezionati
+@app.callback(
+    Output("category-linechart", "figure"),
+    [Input('logarithmic-scale', 'value'),
+     Input('select-years', 'value')],
+    State('supercat', 'data')
+)
+@cached_figure
+def update_category_linechart(logatithmic_scale, year_range, supercat_count_per_year):
+    category_fig = px.line(
+        filter_year_range(pd.DataFrame(supercat_count_per_year), year_range),
+        x='Year',
+        y='Count',
+        color='Category',
+        title="Number of operators for each category per year",
+        color_discrete_sequence=px.colors.qualitative.Vivid,
+        markers = True,
+        labels={'Count': 'Count', 'Category': 'Category', 'Year': 'Year'}
+    )
+    if logatithmic_scale:
+        category_fig.update_yaxes(type='log', title_text='Number of operators')
+    else:
+        category_fig.update_yaxes(title_text='Number of operators')
+
+    return category_fig
+
+# Callback per gli istogrammi della distribuzione selezionata delle ore di attivita':
+# barre impilate per sopracategoria negli anni selezionati e mappa di calore per anno
+# (quota delle stazioni di ogni anno in ogni bin)
+@app.callback(
+    [Output('hours-histogram', 'figure'),
+     Output('hours-year-heatmap', 'figure')],
+    [Input('select-hours-distribution', 'value'),
+     Input('select-hours-categories', 'value'),
+     Input('select-years', 'value')],
+    State('selected-data', 'data')
+)
+@cached_figure
+def update_hours_distribution(distribution, supercategories, year_range, dataset_key):
+    spec = hours_distributions[distribution]
+    bin_labels = format_bin_labels(spec['edges'])
+
+    categories, category_counts = calculate_hours_histogram(dataset_key, distribution, year_range, supercategories, 'Supercategory')
+    fig_histogram = go.Figure()
+    for category, counts in zip(categories, category_counts):
+        fig_histogram.add_trace(go.Bar(x=bin_labels, y=counts, name=category.title()))
+    fig_histogram.update_layout(
+        barmode='stack',
+        bargap=0.05,
+        title=f"Distribution of {spec['label'].lower()} from {year_range[0]} to {year_range[1]}",
+        xaxis_title=spec['label'],
+        yaxis_title='Number of operators',
+        colorway=px.colors.qualitative.Vivid
+    )
+
+    years, year_counts = calculate_hours_histogram(dataset_key, distribution, year_range, supercategories, 'Year')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        year_shares = 100 * year_counts / year_counts.sum(axis=1, keepdims=True)
+    fig_heatmap = go.Figure(go.Heatmap(
+        x=bin_labels,
+        y=years,
+        z=year_shares.round(2),
+        colorscale=custom_colorscale,
+        colorbar=dict(title='%'),
+        hovertemplate=f"{spec['label']}: %{{x}}<br>Year: %{{y}}<br>Operators: %{{z}}%<extra></extra>"
+    )).update_layout(
+        title=f"{spec['label']} per year",
+        xaxis_title=spec['label'],
+        yaxis=dict(title='Year', dtick=1)
+    )
+    return fig_histogram, fig_heatmap
+
+# Callback per la mappa di calore ore - punteggio negli anni e sopracategorie selezionati
+@app.callback(
+    Output('hours-score-heatmap', 'figure'),
+    [Input('select-hours-categories', 'value'),
+     Input('select-years', 'value')],
+    State('selected-data', 'data')
+)
+@cached_figure
+def update_hours_score_heatmap(supercategories, year_range, dataset_key):
+    counts = calculate_hours_histogram(dataset_key, 'Hours vs Score', year_range, supercategories)
+    fig_heatmap = go.Figure(go.Heatmap(
+        x=format_bin_labels(hours_score_edges['Hours']),
+        y=format_bin_labels(hours_score_edges['Score']),
+        z=counts.T,
+        colorscale=custom_colorscale,
+        colorbar=dict(title='Operators'),
+        hovertemplate="Hours: %{x}<br>Score: %{y}<br>Operators: %{z}<extra></extra>"
+    )).update_layout(
+        title=f"Hours of operation vs Score from {year_range[0]} to {year_range[1]}",
+        xaxis_title='Hours of operation',
+        yaxis_title='Score'
+    )
+    return fig_heatmap
+
+# Funzione che legge la finestra visibile del grafico delle stazioni dal relayoutData
+# (assi logaritmici: gli estremi sono in log10). Gli assi non zoomati o riportati
+# all'estensione automatica usano l'estensione di tutti i punti
+def parse_entry_scatter_window(relayout_data, extent):
+    window = list(extent)
+    relayout_data = relayout_data or {}
+    for axis, offset in [('xaxis', 0), ('yaxis', 2)]:
+        if relayout_data.get(f'{axis}.autorange'):
+            continue
+        axis_range = relayout_data.get(f'{axis}.range')
+        if axis_range is None and f'{axis}.range[0]' in relayout_data:
+            axis_range = [relayout_data[f'{axis}.range[0]'], relayout_data.get(f'{axis}.range[1]')]
+        if axis_range and None not in axis_range:
+            window[offset], window[offset + 1] = sorted(float(value) for value in axis_range)
+    return tuple(window)
+
+# Callback per il grafico Score - QSOs - WPX delle singole stazioni (WebGL): ad ogni zoom
+# il server invia solo i punti scelti per la finestra visibile. Lo zoom dell'utente viene
+# mantenuto (uirevision) quando arrivano i nuovi punti
+@cached_figure
+def update_entry_scatter(relayout_data, dataset_key):
+    extent = get_entry_extent(dataset_key)
+    selected, total = select_entry_points(dataset_key, parse_entry_scatter_window(relayout_data, extent))
+    points = get_entry_points(dataset_key)
+    shown = f"all {total}" if len(selected) == total else f"{len(selected)} of {total}"
+
+    fig_scatter = go.Figure(go.Scattergl(
+        x=points['QSOs'][selected],
+        y=points['Score'][selected],
+        mode='markers',
+        marker=dict(
+            color=points['WPX'][selected],
+            colorscale=custom_colorscale,
+            cmin=points['WPX'].min(),
+            cmax=points['WPX'].max(),
+            colorbar=dict(title='WPX'),
+            size=5,
+            opacity=0.8
+        ),
+        text=points['label'][selected],
+        hovertemplate=
+        '<b>%{text}</b><br>' +
+        'QSOs: %{x}<br>' +
+        'Score: %{y}<br>' +
+        'WPX: %{marker.color}<extra></extra>'
+    )).update_layout(
+        title=f"Score vs QSOs of each entry, colored by WPX ({shown} entries in view)",
+        xaxis=dict(type='log', title='QSOs'),
+        yaxis=dict(type='log', title='Score'),
+        uirevision=dataset_key
+    )
+    return fig_scatter
+
+# Il grafico delle stazioni e' presente in entrambe le dashboard
+for graph_id in ['entry-scatter', 'comparsion-entry-scatter']:
+    app.callback(
+        Output(graph_id, 'figure'),
+        Input(graph_id, 'relayoutData'),
+        State('selected-data', 'data')
+    )(update_entry_scatter)
+
+
+########################################################################
+# Funzione che crea la dashboard di confronto
+########################################################################
+
+def ssb_cw_dashboard_page(dataset_key):
+    # Medie annuali di tutte le metriche per i due contest, calcolate in un'unica passata
+    yearly_means, _ = calculate_yearly_means(dataset_key)
+
+    # Una colonna per ogni metrica e contest ('20M_CW', ..., 'TotalQSOs_CW', 'TotalScore_SSB')
+    mean_columns = {}
+    for metric in bands + ['QSOs', 'WPX', 'Score']:
+        for contest in ['CW', 'SSB']:
+            mean_columns[(metric, contest)] = f"{metric}_{contest}" if metric in bands else f"Total{metric}_{contest}"
+    merged_mean_df = yearly_means.pivot(index='Year', columns='Contest').reindex(columns=list(mean_columns))
+    merged_mean_df.columns = list(mean_columns.values())
+    merged_mean_df = merged_mean_df.reset_index()
+
+
+    # Vincitori di ogni anno per il cw e per l'ssb, calcolati in un'unica passata
+    winners_contest_table = calculate_top_entries(dataset_key, 'Score', ['Contest', 'Year'])
+    winners_cw_table = winners_contest_table[winners_contest_table['Contest'] == 'CW']
+    winners_ssb_table = winners_contest_table[winners_contest_table['Contest'] == 'SSB']
+
+    # Primo e ultimo anno dei due contest
+    first_year, last_year = get_dataset_years(dataset_key)
+
+
+
+    # Componente RadioItems per la selezione della banda
+    radio_comparsion_band = dbc.RadioItems(
+        id="select-comparsion-band",
+        options=[        
+            {"label": "160M", "value": "160M"},
+            {"label": "80M", "value": "80M"},
+            {"label": "40M", "value": "40M"},
+            {"label": "20M", "value": "20M"},
+            {"label": "15M", "value": "15M"},
+            {"label": "10M", "value": "10M"}
+        ],
+        value="20M",
+        style={'item-align':'center', 'font-size': '20px'},
+        inline = True
+    )
+
+    # Componente RangeSlider per la selezione degli anni rappresentati nelle mappe e nei
+    # grafici a torta delle bande
+    comparsion_year_range_slider = dcc.RangeSlider(
+        id="select-comparsion-years",
+        min=first_year,
+        max=last_year,
+        step=1,
+        value=[first_year, last_year],
+        marks={year: str(year) for year in range(first_year, last_year + 1) if (year - first_year) % 5 == 0 or year == last_year},
+        allowCross=False,
+        tooltip={'placement': 'bottom'}
+    )
+
+    # Componente RadioItems per la selezione del tipo di dato da visualizzare sull'asse y del linechart dei qso wpx
+    radio_qso_wpx_comparsion = dbc.RadioItems(
+        id="select-line-qso-wpx-y",
+        options=[        
+            {"label": "WPX", "value": "TotalWPX"},
+            {"label": "QSOs", "value": "TotalQSOs"}
+        ],
+        value="TotalWPX",
+        style={'font-size': '20px'},
+        inline=True
+    )
+
+    # Componente RadioItems per la selezione del continente da visualizzare nella mappa
+    radio_comparsion_continents = dbc.RadioItems(
+        id= "select-comparsion-continent",
+        options=[
+            {'label': 'World', 'value': 'World'},
+            {'label': 'Europe', 'value': 'Europe'},
+            {'label': 'North America', 'value': 'North America'},
+            {'label': 'South America', 'value': 'South America'},
+            {'label': 'Asia', 'value': 'Asia'},
+            {'label': 'Africa', 'value': 'Africa'},
+            {'label': 'Oceania', 'value': 'Oceania'}
+        ],
+        value='World',
+        style={'width':1000, 'margin-top':10, 'font-size': '20px'},
+        inline = True
+    )
+
+    # Componenete RadioItems per la selezione del dato da visualizzare sull'asse y nei barchart dei vincitori
+    radio_comparsion_winner_axis = dbc.RadioItems(
+        id= "select-y-barchart-comparsion",
+        options=[
+            {'label': 'WPX', 'value': 'WPX'},
+            {'label': 'QSOs', 'value': 'QSOs'},
+            {'label': 'Total score', 'value': 'Score'}
+        ],
+        value='WPX',
+        style={'font-size': '20px'},
+        inline = True
+    )
+    
+    return dbc.Container([
+        dcc.Store(id='selected-data', data=dataset_key),
+        dcc.Store(id='merged-mean-data', data=merged_mean_df.to_dict('records')),
+        dcc.Store(id='winners-cw-table', data=winners_cw_table.drop(columns=derived_columns).to_dict('records')),
+        dcc.Store(id='winners-ssb-table', data=winners_ssb_table.drop(columns=derived_columns).to_dict('records')),
+
+        dbc.Row(
+            dbc.Col(
+                html.H3(f'Comparsion between SSB and CW contest data from {first_year} to {last_year}'),
+                width=12,
+                className="text-center my-4"
+            )
+        ),
+        # Selezione degli anni
+        dbc.Row([
+            dbc.Col([
+                dbc.Label("Select years:", html_for="select-comparsion-years", class_name="me-2 labels"),
+                comparsion_year_range_slider
+            ], width=8)
+        ], justify="center", className="mb-5"),
+        # Grafico a linee per le bande
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    dbc.Label(
+                        "Select band:",
+                        html_for="select-comparsion-band",
+                        class_name="me-2 labels"
+                    ),
+                    radio_comparsion_band
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),                    
+                dcc.Graph(id="band-comparsion", style={'width': '100%', 'height': '500px'}),
+            ], width=5),
+            dbc.Col([
+                html.Div([
+                    dcc.Graph(id = 'cw-pie', style={'width': '50%', 'height': '500px'}),
+                    dcc.Graph(id = 'ssb-pie', style={'width': '50%', 'height': '500px'})
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),                
+            ], width=6),
+        ], justify="center", className="mb-5"),
+        # Grafico di comparazione dei punteggi o qso o wpx negli anni
+        dbc.Row([
+            # Grafico a linee per la media dei punteggi
+            dbc.Col([                
+                dcc.Graph(id="score-comparsion", style={'width': '100%', 'height': '500px'})
+            ], width=5),
+            # Grafico a linee per le medie dei WPX o dei QSO a seconda della selezione
+            dbc.Col([
+                html.Div([
+                    dbc.Label(
+                        "Select y axis:",
+                        html_for="selectline-qso-wpx-y",
+                        class_name="me-2 labels"
+                    ),
+                    radio_qso_wpx_comparsion
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id="qso-wpx-comparsion", style={'width': '100%', 'height': '500px'})
+            ], width=5)            
+        ], justify="center", className="mb-5"), 
+        # Punteggio, QSO e WPX di ogni stazione dei due contest
+        dbc.Row([
+            dbc.Col([
+                dcc.Graph(id='comparsion-entry-scatter', style={'width': '100%', 'height': '700px'})
+            ], width=10)
+        ], justify="center", className="mb-5"),
+        # Grafici dei vincitori. Devono essere più indipendenti l'uno dall'altro
+        dbc.Row([                    
+            dbc.Col([
+                html.Div([
+                    dbc.Label(
+                        "Select y axis:",
+                        html_for="select-y-barchart-comparsion",
+                        class_name="me-2 labels"
+                    ),
+                    radio_comparsion_winner_axis
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),                
+                dcc.Graph(id='winner-barchart-comparsion', style={'width': '100%', 'height': '500px', 'margin-right':'20px'}),
+            ], width=5),
+            dbc.Col([
+                html.Div([
+                    dcc.Graph(id='winner-radar', style={'width': '100%', 'height': '500px', 'margin-left':'20px'})
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})
+            ], width=5)                      
+        ], justify="center", className="mb-5"),
+        # Mappe
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    dbc.Label(
+                        "Focus on:",
+                        html_for="select-comparsion-continent",
+                        class_name="me-2 labels"
+                    ),
+                    radio_comparsion_continents
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center", "margin-top":"40px"}),
+            ], width=10, class_name="text-center mb-3"),
+        ], justify="center", className="mb-5"),
+        dbc.Row([        
+            dbc.Col([
+                html.Div([
+                    dcc.Graph(id='participants-map-graph', style={'width': '100%', 'height': '700px'}, config={"scrollZoom": False}),
+                    dcc.Graph(id='winners-map-graph', style={'width': '100%', 'height': '700px'}, config={"scrollZoom": False})
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})                
+            ], width=10, style={'display':'flex', 'flexDirection': 'column', 'alignItems':'center', 'min-height': 1000})
+        ], justify="center", className="mb-5")
+    ], fluid=True)                   
+ 
+#################################################################
+# Tutte le callbacks e le funzioni per la dashboard di confronto
+#################################################################
+
+# Linechart delle bande (scaricato dalla route delle figure)
+register_figure_fetch(['band-comparsion'], ['band-comparsion'], {'band': 'select-comparsion-band'})
+
+@cached_figure
+def update_band_comparsion_line_chart(selected_band, dataset_key):
+    # Medie annuali in formato lungo, ristrette alla banda selezionata
+    _, yearly_means = calculate_yearly_means(dataset_key)
+    band_means = yearly_means[yearly_means['Metric'] == selected_band]
+
+    fig_band_comparsion_line_chart = go.Figure()
+
+    for contest, color in [('CW', '#31AFE0'), ('SSB', 'darkorange')]:
+        contest_means = band_means[band_means['Contest'] == contest]
+        fig_band_comparsion_line_chart.add_trace(go.Scatter(
+            x=contest_means['Year'],
+            y=contest_means['Mean'],
+            mode='lines+markers',
+            name=contest,
+            line=dict(color=color)
+        ))
+
+    fig_band_comparsion_line_chart.update_layout(
+        title=f"Comparison of number of QSOs between SSB and CW contest in {selected_band} band",
+        xaxis_title='Year',
+        yaxis_title='Mean of QSOs',
+    )
+
+    return fig_band_comparsion_line_chart
+
+# Callback per il pie del contest cw, negli anni selezionati
+@app.callback(
+    Output("cw-pie", "figure"),   
+    [Input("merged-mean-data", "data"),
+     Input("select-comparsion-years", "value")]
+)
+@cached_figure
+def update_cw_pie(data, year_range):
+    df = filter_year_range(pd.DataFrame(data), year_range)
+
+    values = []
+    labels = []
+
+    for band in bands:
+        col = f"{band}_CW"
+        if col in df.columns:
+            values.append(df[col].sum())
+            labels.append(band)
+
+    fig = px.pie(
+        names=labels,
+        values=values,
+        title="Band activity comparsion in CW contest",
+        color_discrete_sequence=px.colors.qualitative.Vivid
+    ).update_traces(
+        hovertemplate=
+        "Band: %{label}<br>"
+        "QSOs: %{value}<extra></extra>"
+    )
+
+    return fig
+
+# Callback per il pie del contest ssb, negli anni selezionati
+@app.callback(
+    Output("ssb-pie", "figure"),   
+    [Input("merged-mean-data", "data"),
+     Input("select-comparsion-years", "value")]
+)
+@cached_figure
+def update_ssb_pie(data, year_range):
+    df = filter_year_range(pd.DataFrame(data), year_range)
+
+    values = []
+    labels = []
+
+    for band in bands:
+        col = f"{band}_SSB"
+        if col in df.columns:
+            values.append(df[col].sum())
+            labels.append(band)
+
+    fig = px.pie(
+        names=labels,
+        values=values,
+        title="Band activity comparsion in SSB contest",
+        color_discrete_sequence=px.colors.qualitative.Vivid
+    ).update_traces(
+        hovertemplate=
+        "Band: %{label}<br>"
+        "QSOs: %{value}<extra></extra>"
+    )
+
+    return fig
+
+# Callback per il linechart per il punteggio medio negli anni
+@app.callback(
+    Output("score-comparsion", "figure"),    
+    Input("merged-mean-data", "data")
+)
+@cached_figure
+def update_score_comparsion(merged_mean_data):
+    merged_mean_df = pd.DataFrame(merged_mean_data)
+    fig_score_chart = go.Figure()
+    fig_score_chart.add_trace(go.Scatter(
+        x=merged_mean_df['Year'],
+        y=merged_mean_df['TotalScore_CW'],
+        mode='lines+markers',
+        name='CW',
+        line=dict(color='#31AFE0')
+    ))
+    fig_score_chart.add_trace(go.Scatter(
+        x=merged_mean_df['Year'],
+        y=merged_mean_df['TotalScore_SSB'],
+        mode='lines+markers',
+        name='SSB',
+        line=dict(color='darkorange')
+    ))
+    fig_score_chart.update_layout(
+        title=f"Comparison of mean Score between SSB and CW contest",
+        xaxis_title='Year',
+        yaxis_title='Mean of Score',
+    )
+    return fig_score_chart
+
+# Callback per il linechart per i wpx o qso medi negli anni
+@app.callback(
+    Output("qso-wpx-comparsion", "figure"),    
+    Input('select-line-qso-wpx-y', 'value'),
+    State("merged-mean-data", "data")
+)
+@cached_figure
+def update_qso_wpx_comparsion(selected_y, merged_mean_data):
+    merged_mean_df = pd.DataFrame(merged_mean_data)
+
+    fig_line_chart = go.Figure()
+    y_cw = f'{selected_y}_CW'
+    y_ssb = f'{selected_y}_SSB'
+
+    fig_line_chart.add_trace(go.Scatter(
+        x=merged_mean_df['Year'],
+        y=merged_mean_df[y_cw],
+        mode='lines+markers',
+        name='CW',
+        line=dict(color='#31AFE0')
+    ))
+    fig_line_chart.add_trace(go.Scatter(
+        x=merged_mean_df['Year'],
+        y=merged_mean_df[y_ssb],
+        mode='lines+markers',
+        name='SSB',
+        line=dict(color='darkorange')
+    ))
+    if selected_y == 'TotalQSOs':
+        mean_label = 'QSOs'
+    else:
+        mean_label = 'WPX'
+
+    fig_line_chart.update_layout(
+        title=f"Comparison of mean {mean_label} between SSB and CW contest",
+        xaxis_title='Year',
+        yaxis_title=f"Mean of {mean_label}",
+    )
+    return fig_line_chart
+
+# Mappe geografiche (scaricate dalla route delle figure)
+register_figure_fetch(['participants-map', 'winners-map'], ['participants-map-graph', 'winners-map-graph'],
+                      {'continent': 'select-comparsion-continent', 'years': 'select-comparsion-years'})
+
+@cached_figure
+def update_comparsion_map(selected_continent, country_counts_ssb, country_counts_cw, winners_cw_table, winners_ssb_table):
+    if isinstance(country_counts_ssb, list):
+        country_counts_ssb = pd.DataFrame(country_counts_ssb)        
+    if isinstance(country_counts_cw, list):
+        country_counts_cw = pd.DataFrame(country_counts_cw)
+    if isinstance(winners_cw_table, list):
+        winners_cw_table = pd.DataFrame(winners_cw_table)
+    if isinstance(winners_ssb_table, list):
+        winners_ssb_table = pd.DataFrame(winners_ssb_table)
+
+    bounds = get_continent_bounds(selected_continent)
+
+    type_of_counts_ssb = country_counts_ssb        
+    type_of_counts_ssb = type_of_counts_ssb.rename(columns={'count': 'participants'})
+    type_of_counts_cw = country_counts_cw        
+    type_of_counts_cw = type_of_counts_cw.rename(columns={'count': 'participants'})
+
+    # Inserimento di una colonna con il nome del Country
+    type_of_counts_ssb.loc[:, 'Country'] = type_of_counts_ssb['country_code'].map(find_country_from_code)
+    type_of_counts_cw.loc[:, 'Country'] = type_of_counts_cw['country_code'].map(find_country_from_code)
+
+    # Merge dei dati CW e SSB per confronto
+    combined_counts = pd.merge(
+        type_of_counts_ssb[['country_code', 'participants', 'Country']],
+        type_of_counts_cw[['country_code', 'participants', 'Country']],
+        on=['country_code', 'Country'],
+        suffixes=('_ssb', '_cw')
+    )
+
+    # Determina il contest con il maggior numero di partecipanti
+    combined_counts['Majority'] = np.where(combined_counts['participants_cw'] > combined_counts['participants_ssb'], 'CW', 'SSB')
+    color_map = {'CW': '#31AFE0', 'SSB': 'orange'}
+    combined_counts['color'] = combined_counts['Majority'].map(color_map)
+    
+    # Mappa per numero di partecipanti
+    map_figure_participants = px.choropleth(
+        combined_counts,
+        locations="country_code",
+        color='Majority',
+        hover_name="Country",
+        hover_data={"country_code": False, "participants_ssb": True, "participants_cw": True},
+        title=f"Comparsion of number of participants per Country",
+        color_discrete_map=color_map,
+    ).update_layout(
+        margin=dict(
+            l=5, 
+            r=5, 
+            t=70, 
+            b=20
+        ),
+        height=700,
+        title_y= 0.98,
+        title_x=0.5, 
+        geo=dict(
+            projection_scale=1,
+            center={"lat": (bounds['lat'][0] + bounds['lat'][1]) / 2, "lon": (bounds['lon'][0] + bounds['lon'][1]) / 2},
+            lonaxis_range=bounds['lon'],
+            lataxis_range=bounds['lat']
+        ),
+        legend=dict(
+            orientation="h",      
+            yanchor="bottom",    
+            xanchor="center",  
+            y=1,    
+            x=0.5    
+        )
+    )
+
+    # Vincitori
+    cw_countries = winners_cw_table.groupby('country_code').size().reset_index(name='cw_winners')
+    ssb_countries = winners_ssb_table.groupby('country_code').size().reset_index(name='ssb_winners')
+
+    winners_counts = pd.merge(cw_countries, ssb_countries, on='country_code', how='outer').fillna(0)
+    winners_counts['cw_winners'] = winners_counts['cw_winners'].astype(int)
+    winners_counts['ssb_winners'] = winners_counts['ssb_winners'].astype(int)
+
+    winners_counts['Contest'] = np.select(
+        [(winners_counts['cw_winners'] > 0) & (winners_counts['ssb_winners'] == 0),
+         (winners_counts['ssb_winners'] > 0) & (winners_counts['cw_winners'] == 0)],
+        ['CW Only', 'SSB Only'],
+        default='Both'
+    )
+    winners_counts['Country'] = winners_counts['country_code'].map(find_country_from_code)
+
+    color_map = {'CW Only': '#31AFE0', 'SSB Only': 'orange', 'Both': '#FF00B7'}
+
+    # Mappa per numero di vincitori
+    map_figure_winners = px.choropleth(
+        winners_counts,
+        locations="country_code",
+        color="Contest",
+        hover_name="Country",        
+        hover_data={"Country": False, "country_code":False, "cw_winners": True, "ssb_winners": True},
+        title=f"Winners Distribution",
+        color_discrete_map=color_map
+    ).update_layout(
+        margin=dict(
+            l=5, 
+            r=5, 
+            t=70, 
+            b=20
+        ),        
+        height=700,
+        title_y= 0.98,
+        title_x=0.5,
+        geo=dict(
+            projection_scale=1,
+            center={"lat": (bounds['lat'][0] + bounds['lat'][1]) / 2, "lon": (bounds['lon'][0] + bounds['lon'][1]) / 2},
+            lonaxis_range=bounds['lon'],
+            lataxis_range=bounds['lat']
+        ),
+        legend=dict(
+            orientation="h", 
+            yanchor="bottom",
+            xanchor="center",
+            y=1,          
+            x=0.5            
+        )
+    )
+    return map_figure_participants, map_figure_winners
+
+# Callback per il grafico a barre dei vincitori
+@app.callback(
+    Output("winner-barchart-comparsion", "figure"),
+    Input('select-y-barchart-comparsion', 'value'),
+    [State('winners-cw-table', 'data'),
+     State('winners-ssb-table', 'data')]
+)
+@cached_figure
+def update_winner_comparsion_barchart(selected_y, winners_cw_table, winners_ssb_table):
+    if isinstance(winners_cw_table, list):
+        winners_cw_table = pd.DataFrame(winners_cw_table)
+    if isinstance(winners_ssb_table, list):
+        winners_ssb_table = pd.DataFrame(winners_ssb_table)
+
+    cw_color = '#31AFE0'
+    ssb_color = 'orange'
+
+    cw_data = winners_cw_table[["Year", "Country", selected_y]].rename(columns={selected_y: "Value"})
+    ssb_data = winners_ssb_table[["Year", "Country", selected_y]].rename(columns={selected_y: "Value"})
+
+    winner_barchart = go.Figure()
+    winner_barchart.add_trace(
+        go.Bar(
+            x=cw_data["Year"],
+            y=cw_data["Value"],
+            name="CW",
+            marker_color=cw_color,
+            hovertemplate=(
+                "<b>Year:</b> %{x}<br>"
+                "<b>Country:</b> %{customdata}<br>"
+                "<b>" + selected_y +": </b> %{y}<extra></extra>"
+            ),
+            customdata=cw_data["Country"]
+        )
+    )
+    winner_barchart.add_trace(
+        go.Bar(
+            x=ssb_data["Year"],
+            y=ssb_data["Value"],
+            name="SSB",
+            marker_color=ssb_color,
+            hovertemplate=(
+                "<b>Year:</b> %{x}<br>"
+                "<b>Country:</b> %{customdata}<br>"
+                "<b>" + selected_y +": </b> %{y}<extra></extra>"
+            ),
+            customdata=ssb_data["Country"]
+        )
+    )
+    winner_barchart.update_layout(
+        height=570,
+        width=850,
+        barmode="group",  # Per sovrapporre le barre
+        title=f"Winner Comparison ({selected_y})",
+        xaxis_title="Year",
+        yaxis_title=selected_y,
+        legend_title="Contest",
+        margin=dict(l=10, r=10, t=50, b=50),
+    )
+
+    return winner_barchart
+
+# Radar chart vincitori
+@app.callback(
+    Output('winner-radar', 'figure'),
+    [Input('winners-cw-table', 'data'),
+    Input('winners-ssb-table', 'data')]
+)
+@cached_figure
+def update_radar_chart(winners_cw_table, winners_ssb_table):
+    if isinstance(winners_cw_table, list):
+        winners_cw_table = pd.DataFrame(winners_cw_table)
+    if isinstance(winners_ssb_table, list):
+        winners_ssb_table = pd.DataFrame(winners_ssb_table)
+
+    cw_color = '#31AFE0'
+    ssb_color = 'orange'
+
+    cw_band_profile = winners_cw_table[bands].mean()
+    ssb_band_profile = winners_ssb_table[bands].mean()
+    fig = go.Figure()
+
+    fig.add_trace(
+        go.Scatterpolar(
+            r=cw_band_profile.values,
+            theta=bands,
+            fill='toself',
+            name='CW Winners',
+            line=dict(color=cw_color)
+        )
+    )
+
+    fig.add_trace(
+        go.Scatterpolar(
+            r=ssb_band_profile.values,
+            theta=bands,
+            fill='toself',
+            name='SSB Winners',
+            line=dict(color=ssb_color)
+        )
+    )
+
+    fig.update_layout(
+        title="Band activity profile of contest winners (mean of QSOs per band)",
+        polar=dict(
+            radialaxis=dict(visible=True)
+        ),
+        showlegend=True
+    )
+
+    return fig
+
+
+########################################################################
+# Funzione che crea la pagina con lo storico di un nominativo
+########################################################################
+
+def callsign_page(dataset_key, callsign):
+    history = get_callsign_history(dataset_key, callsign)
+    first_year, last_year = get_dataset_years(dataset_key)
+
+    # Componente RadioItems per la selezione del dato da visualizzare sull'asse y
+    radio_callsign_y = dbc.RadioItems(
+        id="select-callsign-y",
+        options=[
+            {"label": "Total score", "value": "Score"},
+            {"label": "QSOs", "value": "QSOs"},
+            {"label": "WPXs", "value": "WPX"}
+        ],
+        value="Score",
+        style={'font-size': '20px'},
+        inline=True
+    )
+
+    return dbc.Container([
+        dcc.Store(id='callsign-data', data={'dataset': dataset_key, 'call': callsign}),
+
+        dbc.Row(
+            dbc.Col(
+                html.H3(f'Results of {callsign} from {first_year} to {last_year}'),
+                width=12,
+                className="text-center my-4"
+            )
+        ),
+
+        # Andamento negli anni nei due contest
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    dbc.Label("Select y axis:", html_for="select-callsign-y", className="me-2 labels"),
+                    radio_callsign_y
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id="callsign-chart", style={'width': '100%', 'height': '500px'})
+            ], width=9)
+        ], justify="center", className="mb-5"),
+
+        # Tabella con tutte le partecipazioni
+        dbc.Row([
+            dbc.Col([
+                dbc.Table.from_dataframe(history, striped=True, bordered=True, hover=True, className="callsign-table")
+            ], width=10)
+        ], justify="center", className="mb-5"),
+    ], fluid=True)
+
+#################################################################
+# Tutte le callbacks per la ricerca dei nominativi
+#################################################################
+
+# Callback per i suggerimenti della barra di ricerca
+@app.callback(
+    Output('callsign-suggestions', 'children'),
+    Input('callsign-search', 'value'),
+    prevent_initial_call=True
+)
+def update_callsign_suggestions(prefix):
+    if not normalize_callsign(prefix):
+        return []
+    suggestions = complete_callsign(refresh_ingested_logs()['ssb_cw'], prefix, callsign_suggestions_limit)
+    return [html.Option(value=call) for call in suggestions]
+
+# Callback per la ricerca di un nominativo e la navigazione al suo storico
+@app.callback(
+    [Output('page-content', 'children', allow_duplicate=True),
+     Output('callsign-search-message', 'children')],
+    [Input('callsign-search-button', 'n_clicks'),
+     Input('callsign-search', 'n_submit')],
+    State('callsign-search', 'value'),
+    prevent_initial_call=True
+)
+def search_callsign(n_clicks, n_submit, callsign):
+    callsign = normalize_callsign(callsign)
+    if not callsign:
+        raise PreventUpdate
+    dataset_key = refresh_ingested_logs()['ssb_cw']
+    if get_callsign_history(dataset_key, callsign) is None:
+        return dash.no_update, f"No entries found for {callsign}"
+    return callsign_page(dataset_key, callsign), dash.no_update
+
+# Callback per il grafico dello storico del nominativo
+@app.callback(
+    Output("callsign-chart", "figure"),
+    Input("select-callsign-y", "value"),
+    State("callsign-data", "data")
+)
+@cached_figure
+def update_callsign_chart(selected_y, callsign_data):
+    history = get_callsign_history(callsign_data['dataset'], callsign_data['call'])
+    if history is None:
+        raise PreventUpdate
+
+    fig_callsign_chart = px.line(
+        history,
+        x='Year',
+        y=selected_y,
+        color='Contest',
+        title=f"{selected_y} of {callsign_data['call']} per year",
+        markers=True,
+        hover_data=['Category', 'Club'],
+        color_discrete_map={'CW': '#31AFE0', 'SSB': 'darkorange'}
+    )
+    fig_callsign_chart.update_xaxes(title='Year', dtick=1)
+    fig_callsign_chart.update_yaxes(title=selected_y)
+    return fig_callsign_chart
+
+
+########################################################################
+# Funzione che crea la pagina dell'esploratore delle categorie
+########################################################################
+def category_explorer_page(dataset_keys):
+    # Valori di ogni dimensione presenti in almeno uno dei due contest
+    cw_options = get_category_options(dataset_keys['CW'])
+    ssb_options = get_category_options(dataset_keys['SSB'])
+    category_options = {
+        dimension: sorted(set(cw_options[dimension]) | set(ssb_options[dimension]))
+        for dimension in category_parsers
+    }
+
+    # Componente RadioItems per la selezione del contest
+    radio_contest = dbc.RadioItems(
+        id="explorer-contest",
+        options=[
+            {"label": "CW", "value": "CW"},
+            {"label": "SSB", "value": "SSB"}
+        ],
+        value="CW",
+        style={'font-size': '20px'},
+        inline=True
+    )
+
+    # Componenti Dropdown per i filtri sulle categorie (nessuna selezione = tutte)
+    def category_dropdown(component_id, dimension, placeholder):
+        return dcc.Dropdown(
+            id=component_id,
+            options=[{"label": value.title() if len(value) > 1 else f"({value})", "value": value} for value in category_options[dimension]],
+            value=[],
+            multi=True,
+            placeholder=placeholder,
+            style={'min-width': '250px', 'font-size': '18px', 'color': 'black'}
+        )
+
+    # Componente RadioItems per la selezione della banda nel grafico delle medie
+    radio_band = dbc.RadioItems(
+        id="explorer-select-band",
+        options=[{"label": "All", "value": "All"}] + [{"label": band, "value": band} for band in bands],
+        value="All",
+        style={'font-size': '20px'},
+        inline=True
+    )
+
+    # Componente RadioItems per la selezione del dato dei vincitori
+    radio_winner_y = dbc.RadioItems(
+        id="explorer-winner-y",
+        options=[
+            {"label": "WPXs", "value": "WPX"},
+            {"label": "QSOs", "value": "QSOs"},
+            {"label": "Total score", "value": "Score"}
+        ],
+        value="Score",
+        style={'font-size': '20px'},
+        inline=True
+    )
+
+    # Componente Switch per la selezione del tipo di mappa
+    map_switch = dbc.Switch(
+        id="explorer-map-type",
+        label="All partecipants/Winners",
+        style={'font-size': '20px'},
+        value=True
+    )
+
+    return dbc.Container([
+        dcc.Store(id='explorer-datasets', data=dataset_keys),
+        dcc.Store(id='explorer-selection'),
+
+        dbc.Row(
+            dbc.Col(
+                html.H3('Category explorer'),
+                width=12,
+                className="text-center my-4"
+            )
+        ),
+
+        # Filtri
+        dbc.Row([
+            dbc.Col(radio_contest, width="auto"),
+            dbc.Col(category_dropdown("explorer-supercategory", "Supercategory", "Operator class"), width="auto"),
+            dbc.Col(category_dropdown("explorer-power", "Power", "Power"), width="auto"),
+            dbc.Col(category_dropdown("explorer-category-band", "Band", "Band"), width="auto"),
+            dbc.Col(category_dropdown("explorer-overlay", "Overlay", "Overlay"), width="auto"),
+        ], justify="center", align="center", className="mb-3"),
+        dbc.Row(
+            dbc.Col(html.H4(id='explorer-entries'), width=12, className="text-center mb-4")
+        ),
+
+        # Medie per banda e vincitori delle categorie selezionate
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    dbc.Label("Select band:", html_for="explorer-select-band", className="me-2 labels"),
+                    radio_band
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id="explorer-band-chart", style={'width': '100%', 'height': '500px'})
+            ], width=5),
+
+            dbc.Col([
+                html.Div([
+                    dbc.Label("Select y axis:", html_for="explorer-winner-y", className="me-2 labels"),
+                    radio_winner_y
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id="explorer-winner-chart", style={'width': '100%', 'height': '500px'})
+            ], width=5)
+        ], justify="center", className="mb-5"),
+
+        # Mappa delle categorie selezionate
+        dbc.Row([
+            dbc.Col([
+                html.Div([
+                    map_switch,
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"}),
+                dcc.Graph(id="explorer-map", style={'width': '100%', 'height': '800px'}, config={"scrollZoom": False})
+            ], width=9, className="text-center mb-3")
+        ], justify="center", className="mb-5"),
+    ], fluid=True)
+
+#################################################################
+# Tutte le callbacks per l'esploratore delle categorie
+#################################################################
+
+# Funzione che crea la figura mostrata quando nessuna categoria soddisfa i filtri
+def empty_explorer_figure():
+    return go.Figure().update_layout(title="No entries match the selected categories", title_x=0.5)
+
+# Callback che calcola i dati dei grafici per i filtri selezionati
+@app.callback(
+    [Output('explorer-selection', 'data'),
+     Output('explorer-entries', 'children')],
+    [Input('explorer-contest', 'value'),
+     Input('explorer-supercategory', 'value'),
+     Input('explorer-power', 'value'),
+     Input('explorer-category-band', 'value'),
+     Input('explorer-overlay', 'value')],
+    State('explorer-datasets', 'data')
+)
+def update_explorer_selection(contest, supercategories, powers, category_bands, overlays, dataset_keys):
+    selection = explore_categories(dataset_keys[contest], {
+        'Supercategory': supercategories,
+        'Power': powers,
+        'Band': category_bands,
+        'Overlay': overlays
+    })
+    return selection, f"{selection['entries']} entries in the selected categories ({contest})"
+
+# Callback per il grafico delle medie per banda (stessa figura della dashboard dei contest)
+@app.callback(
+    Output("explorer-band-chart", "figure"),
+    [Input("explorer-select-band", "value"),
+     Input("explorer-selection", "data")]
+)
+def update_explorer_band_chart(selected_band, selection):
+    if not selection or not selection['entries']:
+        return empty_explorer_figure()
+    return update_band_line_chart(selected_band, selection['merged_mean'], selection['global_ranges'])
+
+# Callback per il grafico dei vincitori (stessa figura della dashboard dei contest)
+@app.callback(
+    Output("explorer-winner-chart", "figure"),
+    [Input("explorer-winner-y", "value"),
+     Input("explorer-selection", "data")]
+)
+def update_explorer_winner_chart(selected_y, selection):
+    if not selection or not selection['entries']:
+        return empty_explorer_figure()
+    color_map = compute_color_map(selection['winners'])
+    return update_winner_barchart(selected_y, color_map, selection['winners'])
+
+# Callback per la mappa (stessa figura della dashboard dei contest)
+@app.callback(
+    Output("explorer-map", "figure"),
+    [Input("explorer-map-type", "value"),
+     Input("explorer-selection", "data")]
+)
+def update_explorer_map(selected_type, selection):
+    if not selection or not selection['entries']:
+        return empty_explorer_figure()
+    year_range = (selection['merged_mean'][0]['Year'], selection['merged_mean'][-1]['Year'])
+    return update_map('World', selected_type, selection['country_counts'], selection['winner_counts'], year_range)
+
+
+##################################################################
+# Callback per gestire la selezione del dataset e la navigazione alla dashboard
+@app.callback(
+    Output('page-content', 'children'),
+    [Input('ssb-contest', 'n_clicks'),
+     Input('cw-contest', 'n_clicks'),
+     Input('ssb-cw', 'n_clicks'),
+     Input('category-explorer', 'n_clicks')],
+     prevent_initial_call=True  # Per evitare che la callback venga chiamata all'inizio
+)
+def select_dataset(ssb_click, cw_click, ssb_cw_click, category_explorer_click):
+    # Vengono applicati gli eventuali nuovi log e lette le chiavi delle versioni correnti
+    dataset_keys = refresh_ingested_logs()
+    if ssb_click:
+        return get_page_layout(('ssb', dataset_keys['ssb']), single_data_dashboard_page, dataset_keys['ssb'], 'SSB')
+    elif cw_click:
+        return get_page_layout(('cw', dataset_keys['cw']), single_data_dashboard_page, dataset_keys['cw'], 'CW')
+    elif ssb_cw_click:
+        return get_page_layout(('ssb_cw', dataset_keys['ssb_cw']), ssb_cw_dashboard_page, dataset_keys['ssb_cw'])
+    elif category_explorer_click:
+        return get_page_layout(('explorer', dataset_keys['cw'], dataset_keys['ssb']), category_explorer_page,
+                               {'CW': dataset_keys['cw'], 'SSB': dataset_keys['ssb']})
+    else:
+        return get_page_layout(('welcome', dataset_keys['ssb_cw']), welcome_page, dataset_keys['ssb_cw'])
+
+
+# Funzione che calcola gli aggregati letti dalle pagine di un dataset (o di una vista):
+# quelli della pagina stessa, delle mappe, delle callback sui club e le somme cumulative per anno
+def warm_dataset_caches(dataset_key):
+    if get_dataset_part_keys(dataset_key) == [dataset_key]:
+        single_data_dashboard_page(dataset_key, dataset_key)
+        calculate_country_counts(dataset_key)
+        calculate_mean(dataset_key, 'Score', by=('Year', 'Club Status'), decimals=None)
+        rollup_cube(dataset_key, ['Club Status'])
+        for by in [['country_code'], ['Club Status']]:
+            get_year_prefix_sums(dataset_key, by)
+        get_hours_histograms(dataset_key)
+    else:
+        ssb_cw_dashboard_page(dataset_key)
+        for contest in ['CW', 'SSB']:
+            calculate_country_counts(dataset_key, {'Contest': contest})
+        get_year_prefix_sums(dataset_key, ['Contest', 'country_code'])
+
+# Funzione eseguita in un processo separato: calcola gli aggregati di un dataset
+def precompute_dataset(dataset_key):
+    warm_dataset_caches(dataset_key)
+    return collect_precomputed(dataset_key)
+
+# Funzione che precalcola in parallelo gli aggregati dei dataset correnti e li salva
+# nella cartella della cache. La vista SSB+CW viene calcolata dai risultati dei due
+# contest. I file delle versioni non piu' correnti vengono eliminati
+def precompute_aggregates():
+    dataset_keys = refresh_ingested_logs(force=True)
+    part_keys = get_dataset_part_keys(dataset_keys['ssb_cw'])
+    with ProcessPoolExecutor(max_workers=len(part_keys)) as executor:
+        for dataset_key, precomputed in zip(part_keys, executor.map(precompute_dataset, part_keys)):
+            write_precomputed(dataset_key, precomputed)
+            precomputed_checked.discard(dataset_key)
+            load_precomputed(dataset_key)
+
+    warm_dataset_caches(dataset_keys['ssb_cw'])
+    write_precomputed(dataset_keys['ssb_cw'], collect_precomputed(dataset_keys['ssb_cw']))
+
+    current_files = {os.path.basename(precomputed_path(dataset_key)) for dataset_key in dataset_keys.values()}
+    for file_name in os.listdir(dataset_cache_dir):
+        if file_name.startswith('precomputed-') and file_name.endswith('.pkl') and file_name not in current_files:
+            os.remove(os.path.join(dataset_cache_dir, file_name))
+    return dataset_keys
+
+# All'avvio vengono applicati i log gia' presenti (dopo aver definito tutte le cache
+# che una nuova versione dei dataset aggiorna o elimina)
+refresh_ingested_logs(force=True)
+
+if __name__ == '__main__':
+    # Con --build-cache viene solo ricostruita la cache binaria dei dataset
+    if '--build-cache' in sys.argv:
+        load_dataset_to_work('cw', cw_data_path, rebuild=True)
+        load_dataset_to_work('ssb', ssb_data_path, rebuild=True)
+    # Con --precompute vengono precalcolati gli aggregati letti dai worker all'avvio
+    elif '--precompute' in sys.argv:
+        print(f"Precomputed {', '.join(precompute_aggregates().values())}")
+    # Con --refresh-prefixes [url] viene aggiornata la cache della tabella dei prefissi
+    # dalla geolist e vengono stampate le differenze
+    elif '--refresh-prefixes' in sys.argv:
+        url = (sys.argv[sys.argv.index('--refresh-prefixes') + 1:] or [None])[0]
+        print(json.dumps(refresh_prefix_table(url), indent=2))
+    # Con --unresolved-countries vengono stampati i nominativi senza Country
+    elif '--unresolved-countries' in sys.argv:
+        print(json.dumps({name: unresolved_countries(current_dataset_keys[name]) for name in ['cw', 'ssb']}, indent=2))
+    # Con --memory-report viene stampata l'occupazione di memoria dei dataset
+    elif '--memory-report' in sys.argv:
+        print(json.dumps([dataset_memory_report(dataset_key) for dataset_key in current_dataset_keys.values()], indent=2))
+    # Con --ingest cw|ssb <log> viene aggiunto il log di un nuovo anno
+    elif '--ingest' in sys.argv:
+        contest, log_path = sys.argv[sys.argv.index('--ingest') + 1:][:2]
+        print(f"Added {ingest_contest_log(contest, log_path)}")
+    else:
+        app.run(debug=True)
+
+
+
+
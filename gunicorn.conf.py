@@ -0,0 +1,21 @@
+# Configurazione di gunicorn (letta automaticamente dalla cartella di avvio)
+import subprocess
+import sys
+
+
+# Prima di avviare i worker vengono precalcolati gli aggregati dei dataset, in un
+# processo separato: i worker li leggono dal disco e servono la prima richiesta
+# senza ricalcolarli. Se il precalcolo fallisce, i worker calcolano gli aggregati
+# al primo accesso; l'errore e l'output del precalcolo vengono scritti nel log
+def on_starting(server):
+    try:
+        result = subprocess.run([sys.executable, 'dashboard.py', '--precompute'], cwd=server.app.cfg.chdir,
+                                capture_output=True, text=True)
+    except OSError as error:
+        server.log.error("Precompute of the dashboard aggregates could not start: %s", error)
+        return
+    if result.returncode != 0:
+        server.log.error("Precompute of the dashboard aggregates failed (exit code %d):\n%s",
+                         result.returncode, (result.stderr or result.stdout).strip())
+    else:
+        server.log.info(result.stdout.strip())
@@ -0,0 +1,44 @@
+import pandas as pd
+
+import dashboard
+
+
+def entries():
+    return pd.DataFrame({
+        'Call': ['A', 'B', 'C', 'D', 'E', 'F'],
+        'Year': [2020, 2020, 2020, 2021, 2021, 2022],
+        'Contest': ['CW', 'CW', 'SSB', 'CW', 'SSB', 'CW'],
+        'Score': [10, 30, 30, 5, 5, 7]
+    })
+
+
+def test_top_entry_per_group_keeps_first_of_ties():
+    top = dashboard.top_n_per_group(entries(), 'Score', ['Year'])
+    assert top['Call'].tolist() == ['B', 'D', 'F']
+
+
+def test_top_entries_stay_within_group_boundaries():
+    top = dashboard.top_n_per_group(entries(), 'Score', ['Year', 'Contest'])
+    assert sorted(top['Call']) == ['B', 'C', 'D', 'E', 'F']
+
+
+def test_top_n_with_groups_smaller_than_n():
+    top = dashboard.top_n_per_group(entries(), 'Score', ['Year'], n=2)
+    assert top['Call'].tolist() == ['B', 'C', 'D', 'E', 'F']
+
+
+def test_top_entries_match_dataset_maximum():
+    dataset_key = dashboard.current_dataset_keys['cw']
+    df = dashboard.get_dataset(dataset_key)
+    winners = dashboard.calculate_top_entries(dataset_key, 'Score', ['Year'])
+    assert winners.set_index('Year')['Score'].equals(df.groupby('Year')['Score'].max())
+
+
+def test_rollup_matches_dataset_groupby():
+    dataset_key = dashboard.current_dataset_keys['ssb']
+    df = dashboard.get_dataset(dataset_key)
+    rollup = dashboard.rollup_cube(dataset_key, ['Year', 'Club Status']).set_index(['Year', 'Club Status'])
+    grouped = df.groupby(['Year', 'Club Status'], observed=True)
+    assert rollup['Entries'].sort_index().equals(grouped.size().sort_index().astype(rollup['Entries'].dtype))
+    assert rollup['Score_sum'].sort_index().astype('int64').equals(grouped['Score'].sum().sort_index().astype('int64'))
+    assert rollup['QSOs_max'].sort_index().astype('int64').equals(grouped['QSOs'].max().sort_index().astype('int64'))
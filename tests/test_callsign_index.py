@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+import dashboard
+
+
+@pytest.fixture
+def callsign_index():
+    df = pd.DataFrame({
+        'Call': ['K1AR', 'K1ARX', 'K1AR', 'K3LR', 'I2ABC', 'K1AR'],
+        'Year': [2020, 2020, 2019, 2020, 2021, 2020],
+        'Contest': ['CW', 'CW', 'CW', 'SSB', 'CW', 'SSB'],
+    })
+    for col in dashboard.callsign_history_columns:
+        if col not in df:
+            df[col] = 0
+    return dashboard.build_callsign_index(df)
+
+
+def test_exact_lookup_returns_sorted_history(monkeypatch, callsign_index):
+    monkeypatch.setattr(dashboard, 'get_callsign_index', lambda dataset_key: callsign_index)
+    history = dashboard.get_callsign_history('cw-00000000', ' k1ar ')
+    assert list(zip(history['Year'], history['Contest'])) == [(2019, 'CW'), (2020, 'CW'), (2020, 'SSB')]
+
+
+def test_exact_lookup_miss(monkeypatch, callsign_index):
+    monkeypatch.setattr(dashboard, 'get_callsign_index', lambda dataset_key: callsign_index)
+    assert dashboard.get_callsign_history('cw-00000000', 'K1A') is None
+    assert dashboard.get_callsign_history('cw-00000000', 'ZZ9ZZ') is None
+
+
+def test_prefix_lookup(monkeypatch, callsign_index):
+    monkeypatch.setattr(dashboard, 'get_callsign_index', lambda dataset_key: callsign_index)
+    assert dashboard.complete_callsign('cw-00000000', 'k') == ['K1AR', 'K1ARX', 'K3LR']
+    assert dashboard.complete_callsign('cw-00000000', 'K1AR') == ['K1AR', 'K1ARX']
+    assert dashboard.complete_callsign('cw-00000000', 'K', limit=1) == ['K1AR']
+    assert dashboard.complete_callsign('cw-00000000', 'K2') == []
+
+
+def test_lookups_on_dataset():
+    dataset_key = dashboard.current_dataset_keys['ssb_cw']
+    call = dashboard.calculate_top_entries(dataset_key, 'Score', ['Year'])['Call'].iloc[0]
+    history = dashboard.get_callsign_history(dataset_key, call)
+    assert len(history) > 0
+    assert call in dashboard.complete_callsign(dataset_key, call[:3], limit=1000)
@@ -0,0 +1,22 @@
+import pandas as pd
+
+import dashboard
+
+
+def test_resolve_countries_all_qth_known():
+    score_df = pd.DataFrame({'Call': ['I2ABC', 'DL1XX'], 'QTH': ['I', 'DL']})
+    assert list(dashboard.resolve_countries(score_df)) == ['Italy', 'Germany']
+
+
+def test_resolve_countries_empty():
+    score_df = pd.DataFrame({'Call': pd.Series([], dtype=str), 'QTH': pd.Series([], dtype=str)})
+    assert len(dashboard.resolve_countries(score_df)) == 0
+
+
+def test_match_callsign_prefixes_empty():
+    assert len(dashboard.match_callsign_prefixes([])) == 0
+
+
+def test_resolve_countries_from_callsign():
+    score_df = pd.DataFrame({'Call': ['5B/AJ2O', 'I2ABC'], 'QTH': ['???', 'I']})
+    assert list(dashboard.resolve_countries(score_df)) == ['Cyprus', 'Italy']
@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+import pytest
+
+import dashboard
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(dashboard, 'dataset_cache_dir', str(tmp_path))
+    monkeypatch.setattr(dashboard, 'prefix_table', dict(dashboard.prefix_table, mtime=None))
+    return tmp_path
+
+
+def column_hashes(cache_dir):
+    return {file_name.split('-')[1] for file_name in os.listdir(cache_dir) if file_name.endswith('.npy')}
+
+
+def test_cache_round_trip_and_prune(cache_dir):
+    df = pd.DataFrame({'Call': ['K1AR', 'I2ABC'], 'Year': [2020, 2021], 'Score': [10, 20]})
+    dashboard.write_dataset_cache('cw', 'a' * 16, df)
+    dashboard.write_dataset_cache('cw', 'b' * 16, df)
+    assert column_hashes(cache_dir) == {'b' * 16}
+    assert dashboard.read_dataset_cache('cw', 'a' * 16) is None
+    assert dashboard.read_dataset_cache('cw', 'b' * 16).equals(df)
+    assert dashboard.read_dataset_manifest('cw')['years'] == [2020, 2021]
+
+
+def test_stale_worker_does_not_prune_newer_version(cache_dir, monkeypatch):
+    df = pd.DataFrame({'Call': ['K1AR'], 'Year': [2020], 'Score': [10]})
+    dashboard.write_dataset_cache('cw', 'b' * 16, df)
+    # Un altro worker ha salvato una nuova tabella dei prefissi che questo non ha ancora applicato
+    with open(dashboard.prefix_table_path(), 'w') as cache_file:
+        cache_file.write('{}')
+    dashboard.write_dataset_cache('cw', 'a' * 16, df)
+    assert column_hashes(cache_dir) == {'a' * 16, 'b' * 16}
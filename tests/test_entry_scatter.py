@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+import dashboard
+
+dataset_key = 'cw-00000000'
+
+
+@pytest.fixture
+def points(monkeypatch):
+    rng = np.random.default_rng(1)
+    # Un gruppo denso e pochi punti isolati
+    x = np.concatenate([rng.normal(2.5, 0.1, 5000), [0.5, 0.6, 4.5]])
+    y = np.concatenate([rng.normal(5.0, 0.1, 5000), [1.0, 1.1, 7.5]])
+    monkeypatch.setitem(dashboard.entry_points, dataset_key, {'x': x, 'y': y, 'rank': rng.permutation(len(x))})
+    monkeypatch.setattr(dashboard, 'entry_scatter_max_points', 500)
+    return x, y
+
+
+def test_decimation_respects_point_cap(points):
+    x, y = points
+    selected, in_window = dashboard.select_entry_points(dataset_key, (x.min(), x.max(), y.min(), y.max()))
+    assert in_window == len(x)
+    assert 0 < len(selected) <= 500
+    assert len(set(selected.tolist())) == len(selected)
+    # I punti isolati (celle poco dense) restano visibili
+    assert {len(x) - 3, len(x) - 2, len(x) - 1} <= set(selected.tolist())
+
+
+def test_zoomed_window_returns_all_points(points):
+    x, y = points
+    window = (2.45, 2.5, 4.95, 5.0)
+    expected = np.flatnonzero((x >= 2.45) & (x <= 2.5) & (y >= 4.95) & (y <= 5.0))
+    assert 0 < len(expected) <= 500
+    selected, in_window = dashboard.select_entry_points(dataset_key, window)
+    assert in_window == len(expected)
+    assert sorted(selected.tolist()) == expected.tolist()
+
+
+def test_empty_window(points):
+    selected, in_window = dashboard.select_entry_points(dataset_key, (10, 11, 10, 11))
+    assert in_window == 0 and len(selected) == 0
@@ -0,0 +1,30 @@
+import dashboard
+
+
+def test_map_year_range_without_data():
+    client = dashboard.server.test_client()
+    dataset_key = dashboard.current_dataset_keys['cw']
+    assert client.get(f'/figures/map?dataset={dataset_key}&years=2030,2040').status_code == 400
+
+
+def test_map_year_range_clamped_to_dataset():
+    client = dashboard.server.test_client()
+    dataset_key = dashboard.current_dataset_keys['cw']
+    last_year = dashboard.get_dataset_years(dataset_key)[1]
+    assert client.get(f'/figures/map?dataset={dataset_key}&years={last_year},2040').status_code == 200
+
+
+def test_comparison_maps_reject_single_contest_datasets():
+    client = dashboard.server.test_client()
+    for name in ['cw', 'ssb']:
+        dataset_key = dashboard.current_dataset_keys[name]
+        for figure_name in ['participants-map', 'winners-map', 'band-comparsion']:
+            assert client.get(f'/figures/{figure_name}?dataset={dataset_key}').status_code == 400
+
+
+def test_contest_figures_reject_comparison_view():
+    client = dashboard.server.test_client()
+    dataset_key = dashboard.current_dataset_keys['ssb_cw']
+    for figure_name in ['map', 'band-line-chart']:
+        assert client.get(f'/figures/{figure_name}?dataset={dataset_key}').status_code == 400
+    assert client.get(f'/figures/participants-map?dataset={dataset_key}').status_code == 200
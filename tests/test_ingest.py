@@ -0,0 +1,48 @@
+import copy
+
+import pandas as pd
+
+import dashboard
+
+
+def write_synthetic_log(log_dir, year, rows=50):
+    contest_df = pd.read_csv(dashboard.cw_data_path, sep=";")
+    log_df = contest_df[contest_df['Year'] == contest_df['Year'].max()].head(rows).copy()
+    log_df['Year'] = year
+    log_df[dashboard.contest_log_columns].to_csv(log_dir / f"20250601T120000-cw-{year}.csv", sep=";", index=False)
+    return log_df
+
+
+def test_ingested_log_updates_aggregates_incrementally(tmp_path, monkeypatch):
+    monkeypatch.setattr(dashboard, 'ingested_logs_dir', str(tmp_path))
+    monkeypatch.setattr(dashboard, 'current_dataset_keys', dict(dashboard.current_dataset_keys))
+    monkeypatch.setattr(dashboard, 'dataset_versions', copy.deepcopy(dashboard.dataset_versions))
+    monkeypatch.setattr(dashboard, 'ingest_state', dict(dashboard.ingest_state, applied=set(), failed=set()))
+
+    old_key = dashboard.current_dataset_keys['cw']
+    old_cube = dashboard.get_aggregate_cube(old_key)
+    old_years = dashboard.rollup_cube(old_key, ['Year']).set_index('Year')['Entries']
+    first_year, last_year = dashboard.get_dataset_years(old_key)
+
+    new_year = last_year + 1
+    log_df = write_synthetic_log(tmp_path, new_year)
+    cube_sizes = []
+    build_aggregate_cube = dashboard.build_aggregate_cube
+    monkeypatch.setattr(dashboard, 'build_aggregate_cube', lambda df: cube_sizes.append(len(df)) or build_aggregate_cube(df))
+
+    new_keys = dashboard.refresh_ingested_logs(force=True)
+    new_key = new_keys['cw']
+    assert new_key != old_key
+    # Il cubo viene aggiornato con i soli aggregati delle nuove righe
+    assert cube_sizes == [len(log_df)]
+    assert dashboard.get_aggregate_cube(new_key)['Entries'].sum() == old_cube['Entries'].sum() + len(log_df)
+
+    new_years = dashboard.rollup_cube(new_key, ['Year']).set_index('Year')['Entries']
+    assert new_years[new_year] == len(log_df)
+    assert new_years.drop(new_year).equals(old_years)
+    assert dashboard.get_dataset_years(new_key) == (first_year, new_year)
+    assert dashboard.rollup_year_range(new_key, ['Club Status'], (new_year, new_year))['Entries'].sum() == len(log_df)
+    assert cube_sizes == [len(log_df)]
+
+    for name in ['cw', 'ssb_cw']:
+        dashboard.retire_dataset(new_keys[name])
@@ -0,0 +1,92 @@
+import http.server
+import json
+import os
+import threading
+
+import pytest
+
+import dashboard
+
+
+@pytest.fixture
+def geolist_server():
+    # Server locale che restituisce la geolist impostata dal test
+    served = {}
+
+    class GeolistHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps(served['geolist']).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(('127.0.0.1', 0), GeolistHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield served, f"http://127.0.0.1:{server.server_port}/geolist"
+    server.shutdown()
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(dashboard, 'dataset_cache_dir', str(tmp_path))
+    monkeypatch.setattr(dashboard, 'ingest_state', dict(dashboard.ingest_state, prefix_table_mtime=None))
+    return tmp_path
+
+
+def current_geolist():
+    prefixes = dashboard.prefix_table['prefixes']
+    return [{'prefix': prefix, 'country': country} for prefix, country in zip(prefixes['QTH'], prefixes['Country'])]
+
+
+def test_valid_refresh_writes_new_version(geolist_server, cache_dir):
+    served, url = geolist_server
+    geolist = current_geolist()
+    geolist[0]['country'] = 'Atlantis'
+    served['geolist'] = {'data': geolist}
+
+    diff = dashboard.refresh_prefix_table(url)
+    assert diff['old_version'] == dashboard.prefix_table['version']
+    assert diff['changed'] == {geolist[0]['prefix']: [current_geolist()[0]['country'], 'Atlantis']}
+    assert dashboard.read_prefix_table()['version'] == diff['new_version']
+
+
+def test_malformed_table_keeps_previous_version(geolist_server, cache_dir):
+    served, url = geolist_server
+    served['geolist'] = current_geolist()[:10]
+    with pytest.raises(ValueError):
+        dashboard.refresh_prefix_table(url)
+    served['geolist'] = current_geolist() + [{'prefix': 'not a prefix', 'country': 'Nowhere'}]
+    with pytest.raises(ValueError):
+        dashboard.refresh_prefix_table(url)
+    served['geolist'] = [{'call': 'I', 'country': 'Italy'}]
+    with pytest.raises(ValueError):
+        dashboard.refresh_prefix_table(url)
+    assert not os.path.exists(dashboard.prefix_table_path())
+    assert dashboard.check_prefix_table() is None
+
+
+def test_version_bump_invalidates_cached_table(geolist_server, cache_dir):
+    served, url = geolist_server
+    geolist = current_geolist()
+    geolist[0]['country'] = 'Atlantis'
+    served['geolist'] = geolist
+    dashboard.refresh_prefix_table(url)
+
+    # I worker vedono la nuova tabella e i dataset in cache non corrispondono piu'
+    new_table = dashboard.check_prefix_table()
+    assert new_table['version'] != dashboard.prefix_table['version']
+    csv_path = dashboard.contest_csv_paths['cw']
+    assert dashboard.compute_source_hash(csv_path, new_table) != dashboard.compute_source_hash(csv_path)
+
+    # Una cache con una versione che non corrisponde al contenuto non viene usata
+    with open(dashboard.prefix_table_path()) as cache_file:
+        cache = json.load(cache_file)
+    cache['version'] = dashboard.prefix_table['version']
+    with open(dashboard.prefix_table_path(), 'w') as cache_file:
+        json.dump(cache, cache_file)
+    assert dashboard.read_prefix_table() is None
@@ -0,0 +1,35 @@
+import pandas as pd
+import pytest
+
+import dashboard
+
+
+def direct_sums(df, by, year_range):
+    selected = df[df['Year'].between(*year_range)]
+    grouped = selected.groupby(by, observed=True, dropna=False)
+    return pd.DataFrame({
+        'Entries': grouped.size(),
+        'Score_sum': grouped['Score'].sum(),
+        'QSOs_count': grouped['QSOs'].count()
+    })
+
+
+@pytest.mark.parametrize('year_range', [(2010, 2015), (2018, 2018)])
+def test_year_range_rollup_matches_filtered_sum(year_range):
+    dataset_key = dashboard.current_dataset_keys['cw']
+    by = ['Club Status']
+    rollup = dashboard.rollup_year_range(dataset_key, by, year_range).set_index(by)
+    expected = direct_sums(dashboard.get_dataset(dataset_key), by, year_range)
+    assert rollup.loc[expected.index, expected.columns].astype('int64').equals(expected.astype('int64'))
+    assert len(rollup) == len(expected)
+
+
+@pytest.mark.parametrize('year_range', [(2010, 2015), (2018, 2018)])
+def test_year_range_rollup_with_filter_matches_filtered_sum(year_range):
+    dataset_key = dashboard.current_dataset_keys['ssb_cw']
+    by = ['country_code']
+    rollup = dashboard.rollup_year_range(dataset_key, by, year_range, {'Contest': 'SSB'}).set_index(by)
+    ssb_df = dashboard.get_dataset(dashboard.current_dataset_keys['ssb'])
+    expected = direct_sums(ssb_df, by, year_range)
+    assert rollup.loc[expected.index, expected.columns].astype('int64').equals(expected.astype('int64'))
+    assert len(rollup) == len(expected)